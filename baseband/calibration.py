@@ -1,5 +1,7 @@
 import numpy as np
 
+from utils.random_utils import make_rng
+
 
 class BasebandCalibration:
     """
@@ -43,9 +45,12 @@ class BasebandCalibration:
         return iq + offset
 
     @staticmethod
-    def phase_noise(iq, std=0.01):
+    def phase_noise(iq, std=0.01, rng=None):
         """
         Random phase jitter.
+
+        rng : None, int, SeedSequence or Generator
         """
-        phase = np.random.randn(*iq.shape) * std
+        rng = make_rng(rng)
+        phase = rng.standard_normal(iq.shape) * std
         return iq * np.exp(1j * phase)
@@ -0,0 +1,204 @@
+import numpy as np
+
+from utils.random_utils import complex_normal, make_rng
+
+
+class ImpairmentChain:
+    """
+    Fused, in-place baseband impairment chain.
+
+    Configured once, then applied to every frame:
+
+        chain = (ImpairmentChain(rng=seed)
+                 .iq_imbalance(0.05, 5)
+                 .dc_offset(0.01)
+                 .phase_noise(0.01)
+                 .awgn(snr_db=20)
+                 .clutter_floor(-40))
+
+        iq = chain.apply(beat)                  # [Nc, Ns] or [N_virt, Nc, Ns]
+        iq = chain.apply(stack, batched=True)   # [F, ...], power per frame
+
+    Same models as BasebandCalibration / BasebandNoise, applied in the
+    configured order, but
+        - all stages update one output buffer in place
+        - scratch buffers are reused between calls of the same shape
+        - coefficients (IQ-imbalance matrix, noise scales) are fixed at
+          configuration time
+        - signal power is computed once, at the first stage that needs
+          it, and shared by all SNR-relative stages
+        - consecutive AWGN / clutter stages are merged into a single
+          complex Gaussian draw (independent Gaussians add in power)
+
+    Note: with sequential BasebandNoise calls, clutter_floor measures the
+    power of the already noisy signal; here both refer to the same
+    signal power.
+
+    Parameters
+    ----------
+    rng : None, int, SeedSequence or Generator
+    threads : int
+        Parallel noise fill for large cubes (see complex_normal)
+    """
+
+    def __init__(self, rng=None, threads=1):
+        self.rng = make_rng(rng)
+        self.threads = threads
+        self.stages = []
+
+        self._buffers = {}
+
+    # === Configuration ===
+
+    def iq_imbalance(self, gain_mismatch=0.05, phase_error_deg=5):
+        """
+        I' = (1 + g) I
+        Q' = (1 - g) (Q cos φ + I sin φ)
+        """
+        phase_error = np.deg2rad(phase_error_deg)
+        self.stages.append((
+            "iq_imbalance",
+            (
+                1 + gain_mismatch,
+                (1 - gain_mismatch) * np.cos(phase_error),
+                (1 - gain_mismatch) * np.sin(phase_error),
+            )
+        ))
+        return self
+
+    def dc_offset(self, offset=0.01):
+        self.stages.append(("dc_offset", offset))
+        return self
+
+    def phase_noise(self, std=0.01):
+        self.stages.append(("phase_noise", std))
+        return self
+
+    def awgn(self, snr_db=None, noise_power=None):
+        """
+        Complex AWGN; snr_db → relative to signal power,
+        noise_power → absolute.
+        """
+        if (snr_db is None) == (noise_power is None):
+            raise ValueError("Give exactly one of snr_db or noise_power.")
+
+        if noise_power is not None:
+            self.stages.append(("noise", (0.0, noise_power)))
+        else:
+            self.stages.append(("noise", (10**(-snr_db / 10), 0.0)))
+        return self
+
+    def clutter_floor(self, level_db=-40):
+        self.stages.append(("noise", (10**(level_db / 10), 0.0)))
+        return self
+
+    # === Execution ===
+
+    def _plan(self):
+        """
+        Merge consecutive Gaussian stages:
+            noise → (relative power factor, absolute power)
+        """
+        plan = []
+        for kind, params in self.stages:
+            if kind == "noise" and plan and plan[-1][0] == "noise":
+                rel, absolute = plan[-1][1]
+                plan[-1] = ("noise", (rel + params[0], absolute + params[1]))
+            else:
+                plan.append((kind, params))
+        return plan
+
+    def _buffer(self, name, shape, dtype):
+        key = (name, shape, np.dtype(dtype).str)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = np.empty(shape, dtype=dtype)
+        return buf
+
+    @staticmethod
+    def _power(x, batched):
+        """
+        Mean |x|^2 (per frame if batched), without |x| temporaries.
+        """
+        rows = x.shape[0] if batched else 1
+        pairs = x.reshape(rows, -1).view(np.finfo(x.dtype).dtype)
+        power = np.einsum("ij,ij->i", pairs, pairs) / (pairs.shape[1] // 2)
+
+        if batched:
+            return power.reshape((rows,) + (1,) * (x.ndim - 1))
+        return power[0]
+
+    def apply(self, iq, out=None, batched=False):
+        """
+        Apply every stage in one pass over a single output buffer.
+
+        Parameters
+        ----------
+        iq : complex ndarray
+            One frame, or a [F, ...] stack with batched=True
+        out : complex ndarray or None
+            C-contiguous output (may be iq itself for in-place use)
+        batched : bool
+            Treat axis 0 as frames: SNR-relative powers per frame
+
+        Returns
+        -------
+        complex ndarray (shape of iq)
+        """
+        dtype = np.result_type(iq, np.complex64)
+        real_dtype = np.finfo(dtype).dtype
+
+        if out is None:
+            out = np.empty(iq.shape, dtype=dtype)
+        elif (not np.iscomplexobj(out) or not out.flags.c_contiguous
+              or out.shape != iq.shape):
+            raise ValueError(
+                "out must be a C-contiguous complex array shaped like iq."
+            )
+
+        if out is not iq:
+            np.copyto(out, iq)
+
+        pairs = out.view(real_dtype).reshape(out.shape + (2,))
+        I = pairs[..., 0]
+        Q = pairs[..., 1]
+
+        power = None
+
+        for kind, params in self._plan():
+            if kind == "iq_imbalance":
+                gain_i, q_cos, q_sin = params
+                tmp = self._buffer("real", out.shape, real_dtype)
+                np.multiply(I, q_sin, out=tmp)
+                Q *= q_cos
+                Q += tmp
+                I *= gain_i
+
+            elif kind == "dc_offset":
+                out += params
+
+            elif kind == "phase_noise":
+                phase = self._buffer("real", out.shape, real_dtype)
+                rot = self._buffer("complex", out.shape, dtype)
+                self.rng.standard_normal(out=phase, dtype=real_dtype)
+                phase *= params
+                np.cos(phase, out=rot.real)
+                np.sin(phase, out=rot.imag)
+                out *= rot
+
+            elif kind == "noise":
+                rel, absolute = params
+                if rel and power is None:
+                    power = self._power(out, batched)
+
+                noise_power = absolute + (rel * power if rel else 0.0)
+
+                noise = self._buffer("complex", out.shape, dtype)
+                complex_normal(
+                    self.rng, out.shape, dtype=dtype, out=noise,
+                    threads=self.threads
+                )
+                noise *= np.sqrt(noise_power).astype(real_dtype)
+                out += noise
+
+        return out
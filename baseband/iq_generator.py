@@ -17,7 +17,7 @@ class IQGenerator:
     """
 
     @staticmethod
-    def from_complex(signal):
+    def from_complex(signal, dtype=np.complex128):
         """
         Ensure signal is complex baseband format.
 
@@ -25,12 +25,14 @@ class IQGenerator:
         ----------
         signal : ndarray
             complex input signal
+        dtype : complex64 or complex128
+            Target precision
 
         Returns
         -------
         iq : ndarray (complex)
         """
-        return signal.astype(np.complex128)
+        return signal.astype(dtype, copy=False)
 
     @staticmethod
     def from_real(signal):
@@ -1,5 +1,7 @@
 import numpy as np
 
+from utils.random_utils import complex_normal, make_rng
+
 
 class BasebandNoise:
     """
@@ -8,54 +10,91 @@ class BasebandNoise:
     Includes:
         - AWGN (thermal noise)
         - Clutter floor
+
+    All draws come from the instance Generator, so a fixed seed
+    reproduces the same noise sequence.
     """
 
-    def __init__(self, snr_db=None, noise_power=None):
+    def __init__(self, snr_db=None, noise_power=None, rng=None, threads=1):
         """
         Choose one:
             snr_db → relative noise
             noise_power → absolute noise
+
+        rng : None, int, SeedSequence or Generator
+        threads : int
+            Parallel fill for large cubes (see complex_normal)
         """
         self.snr_db = snr_db
         self.noise_power = noise_power
+        self.rng = make_rng(rng)
+        self.threads = threads
 
-    def awgn(self, signal):
+        self._scratch = None
+
+    def awgn(self, signal, out=None):
         """
         Add complex AWGN.
 
+        out : ndarray or None
+            Destination (may be signal itself); the noise is then drawn
+            into a reused scratch buffer
+
         SNR 정의:
             SNR = signal_power / noise_power
         """
-        sig_power = np.mean(np.abs(signal)**2)
-
         if self.noise_power is None:
+            sig_power = self._power(signal)
             snr_linear = 10**(self.snr_db / 10)
             noise_power = sig_power / snr_linear
         else:
             noise_power = self.noise_power
 
-        noise = (
-            np.sqrt(noise_power/2) *
-            (np.random.randn(*signal.shape) +
-             1j*np.random.randn(*signal.shape))
-        )
-
-        return signal + noise
+        return self._add(signal, self._draw(signal, noise_power, out), out)
 
-    def clutter_floor(self, signal, level_db=-40):
+    def clutter_floor(self, signal, level_db=-40, out=None):
         """
         Add stationary clutter background.
 
         모델:
             constant amplitude complex background
+
+        out : ndarray or None
+            Destination (may be signal itself)
         """
-        sig_power = np.mean(np.abs(signal)**2)
+        sig_power = self._power(signal)
         clutter_power = sig_power * 10**(level_db / 10)
 
-        clutter = (
-            np.sqrt(clutter_power/2) *
-            (np.random.randn(*signal.shape) +
-             1j*np.random.randn(*signal.shape))
-        )
+        return self._add(signal, self._draw(signal, clutter_power, out), out)
+
+    @staticmethod
+    def _power(signal):
+        """
+        Mean |x|^2 without |x| temporaries (vdot over the flat array).
+        """
+        return np.vdot(signal, signal).real / max(signal.size, 1)
 
-        return signal + clutter
+    @staticmethod
+    def _add(signal, noise, out):
+        if out is None:
+            noise += signal
+            return noise
+        return np.add(signal, noise, out=out)
+
+    def _draw(self, signal, power, out=None):
+        dtype = np.result_type(signal, np.complex64)
+
+        buf = None
+        if out is not None:
+            buf = self._scratch
+            if buf is None or buf.shape != signal.shape or buf.dtype != dtype:
+                buf = self._scratch = np.empty(signal.shape, dtype=dtype)
+
+        return complex_normal(
+            self.rng,
+            signal.shape,
+            scale=np.sqrt(power),
+            dtype=dtype,
+            out=buf,
+            threads=self.threads
+        )
@@ -0,0 +1,412 @@
+"""
+Stage-level benchmarks with JSON baselines.
+
+Times every stage of the simulation chain (channel, mixer, ADC, noise,
+RDM) and the full analytic chain over a grid of sizes, and records
+throughput and peak memory. Runs offline on a plain CPU.
+
+Usage (from the repository root):
+
+    python -m benchmarks.stage_bench run -o baseline.json
+    python -m benchmarks.stage_bench run -o current.json --chirps 64 128 \\
+        --targets 8 64 --batch 1 8 --precision double single
+    python -m benchmarks.stage_bench compare baseline.json current.json
+
+compare exits with status 1 if any case is slower (or uses more peak
+memory) than the baseline by more than the threshold, or if a baseline
+case is missing from the current run.
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from config.radar_config import PRECISIONS
+
+from radar.waveform import FMCWWaveform
+from radar.channel import RadarChannel
+from radar.mixer import Mixer
+from radar.adc import ADC
+from radar.beat_model import AnalyticBeatModel
+from radar.radar_sensor import RadarSensor
+
+from baseband.noise import BasebandNoise
+
+from pipeline.rdm_pipeline import RDMPipeline
+from pipeline.simulation_runner import SimulationRunner
+
+
+FORMAT_VERSION = 1
+
+FC = 77e9
+BANDWIDTH = 1e9
+SAMPLE_RATE = 5e6
+
+STAGES = ("channel", "mixer", "adc", "noise", "rdm", "chain")
+
+
+def _scene(num_targets, seed=0):
+    """
+    Random target arrays {range, velocity, rcs, phase, angle}, each [K].
+    """
+    rng = np.random.default_rng(seed)
+    return {
+        "range": rng.uniform(5.0, 60.0, num_targets),
+        "velocity": rng.uniform(-20.0, 20.0, num_targets),
+        "rcs": rng.uniform(0.5, 1.0, num_targets),
+        "phase": rng.uniform(0.0, 2 * np.pi, num_targets),
+        "angle": np.zeros(num_targets),
+    }
+
+
+def _setup(stage, num_chirps, num_samples, num_targets, batch, precision):
+    """
+    Build the inputs of one case.
+
+    Returns a zero-argument callable processing `batch` frames.
+    """
+    dtype = PRECISIONS[precision][0]
+
+    # Chirp length chosen so the RF waveform has exactly num_samples
+    chirp_duration = num_samples / SAMPLE_RATE
+    scene = _scene(num_targets)
+
+    rng = np.random.default_rng(1)
+    beat = (
+        rng.standard_normal((batch, num_chirps, num_samples))
+        + 1j * rng.standard_normal((batch, num_chirps, num_samples))
+    ).astype(dtype) * 0.1
+
+    if stage in ("channel", "mixer"):
+        tx = FMCWWaveform(
+            FC, BANDWIDTH, chirp_duration, SAMPLE_RATE, dtype=dtype
+        ).generate()
+
+    if stage == "channel":
+        channel = RadarChannel(
+            SAMPLE_RATE, FC, num_chirps=num_chirps, dtype=dtype
+        )
+
+        def run():
+            for _ in range(batch):
+                channel.propagate_frame(tx, scene)
+
+        return run
+
+    if stage == "mixer":
+        return lambda: Mixer.mix(tx, beat)
+
+    if stage == "adc":
+        adc = ADC()
+        return lambda: adc.sample(beat)
+
+    if stage == "noise":
+        noise = BasebandNoise(snr_db=20.0, rng=0)
+        return lambda: noise.awgn(beat)
+
+    pipeline = RDMPipeline(
+        fc=FC,
+        bandwidth=BANDWIDTH,
+        chirp_duration=chirp_duration,
+        num_chirps=num_chirps,
+        num_samples=num_samples,
+        fs=SAMPLE_RATE,
+        dtype=dtype
+    )
+
+    if stage == "rdm":
+        return lambda: pipeline.run_batch(beat)
+
+    # Full chain as SimulationRunner.stream runs it: beat synthesis →
+    # noise (analog, before the ADC) → ADC sized to the scene → RDM
+    synthesizer = AnalyticBeatModel(
+        fc=FC,
+        bandwidth=BANDWIDTH,
+        chirp_duration=chirp_duration,
+        num_chirps=num_chirps,
+        num_samples=num_samples,
+        fs=SAMPLE_RATE,
+        dtype=dtype
+    )
+    noise = BasebandNoise(snr_db=20.0, rng=0)
+    sensor = RadarSensor.analytic(
+        synthesizer, SimulationRunner.default_adc(scene["rcs"], snr_db=20.0)
+    )
+    stack = np.empty((batch, num_chirps, num_samples), dtype=dtype)
+
+    def run():
+        for b in range(batch):
+            stack[b] = sensor.capture(scene, impair=noise.awgn)
+        pipeline.run_batch(stack)
+
+    return run
+
+
+def _measure(fn, repeat, warmup):
+    """
+    Wall times of `repeat` calls and the peak memory of one call.
+
+    Memory is traced in a separate call so tracemalloc overhead does
+    not distort the timings (NumPy reports its buffers to tracemalloc).
+    """
+    for _ in range(warmup):
+        fn()
+
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return times, peak - base
+
+
+def run_benchmarks(stages=STAGES, chirps=(128,), samples=(256,),
+                   targets=(8,), batch=(1,), precision=("double",),
+                   repeat=5, warmup=1, log=None):
+    """
+    Run the benchmark grid.
+
+    Parameters
+    ----------
+    stages : sequence of str
+    chirps, samples, targets, batch : sequence of int
+        Size grid (every combination is run)
+    precision : sequence of str
+        "double" / "single"
+    repeat : int
+        Timed calls per case
+    warmup : int
+        Untimed calls before timing (FFT plans, caches)
+    log : file or None
+        Progress output
+
+    Returns
+    -------
+    dict
+        {"version", "meta", "results": [case, ...]}
+    """
+    results = []
+
+    for stage in stages:
+        if stage not in STAGES:
+            raise ValueError(
+                f"Unknown stage '{stage}'. Choose from {', '.join(STAGES)}."
+            )
+
+    grid = itertools.product(stages, chirps, samples, targets, batch, precision)
+
+    for stage, nc, ns, k, b, prec in grid:
+        params = {
+            "num_chirps": nc,
+            "num_samples": ns,
+            "num_targets": k,
+            "batch": b,
+            "precision": prec,
+        }
+
+        fn = _setup(stage, nc, ns, k, b, prec)
+        times, peak = _measure(fn, repeat, warmup)
+
+        median = statistics.median(times)
+        case = {
+            "stage": stage,
+            "params": params,
+            "time_median_s": median,
+            "time_min_s": min(times),
+            "frames_per_s": b / median,
+            "samples_per_s": b * nc * ns / median,
+            "peak_memory_bytes": peak,
+        }
+        results.append(case)
+
+        if log is not None:
+            print(_format_case(case), file=log)
+
+    return {
+        "version": FORMAT_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def _case_key(case):
+    return (case["stage"],) + tuple(sorted(case["params"].items()))
+
+
+def _case_label(case):
+    p = case["params"]
+    return (
+        f"{case['stage']:<8} Nc={p['num_chirps']:<4} Ns={p['num_samples']:<5} "
+        f"K={p['num_targets']:<5} B={p['batch']:<3} {p['precision']:<6}"
+    )
+
+
+def _format_case(case):
+    return (
+        f"{_case_label(case)} {case['time_median_s'] * 1e3:10.3f} ms "
+        f"{case['frames_per_s']:10.1f} frames/s "
+        f"{case['samples_per_s'] / 1e6:9.2f} MS/s "
+        f"{case['peak_memory_bytes'] / 2**20:9.2f} MiB"
+    )
+
+
+def compare(baseline, current, threshold=0.10, memory_threshold=0.20):
+    """
+    Compare two benchmark results.
+
+    A case regresses if its median time grows by more than `threshold`
+    or its peak memory by more than `memory_threshold` (fractions).
+
+    Baseline cases missing from the current run (renamed or removed
+    stages, a narrower grid) count as regressions, so the gate cannot
+    pass by dropping cases. Cases new in the current run are skipped.
+
+    Returns
+    -------
+    list of dict
+        One entry per baseline case:
+        {label, time_ratio, memory_ratio, missing, regression}
+        (ratios None for missing cases)
+    """
+    base_cases = {_case_key(c): c for c in baseline["results"]}
+    current_keys = {_case_key(c) for c in current["results"]}
+
+    report = [
+        {
+            "label": _case_label(ref),
+            "time_ratio": None,
+            "memory_ratio": None,
+            "missing": True,
+            "regression": True,
+        }
+        for key, ref in base_cases.items() if key not in current_keys
+    ]
+
+    for case in current["results"]:
+        ref = base_cases.get(_case_key(case))
+        if ref is None:
+            continue
+
+        time_ratio = case["time_median_s"] / ref["time_median_s"]
+        memory_ratio = (
+            case["peak_memory_bytes"] / ref["peak_memory_bytes"]
+            if ref["peak_memory_bytes"] > 0 else 1.0
+        )
+
+        report.append({
+            "label": _case_label(case),
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "missing": False,
+            "regression": (
+                time_ratio > 1 + threshold
+                or memory_ratio > 1 + memory_threshold
+            ),
+        })
+
+    return report
+
+
+def _load(path):
+    with open(path) as f:
+        result = json.load(f)
+
+    if result.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark file version in {path}.")
+
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.stage_bench",
+        description="Stage-level benchmarks of the radar simulation chain."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run benchmarks, write JSON")
+    run.add_argument("-o", "--output", help="JSON output path")
+    run.add_argument("--stages", nargs="+", default=list(STAGES))
+    run.add_argument("--chirps", nargs="+", type=int, default=[128])
+    run.add_argument("--samples", nargs="+", type=int, default=[256])
+    run.add_argument("--targets", nargs="+", type=int, default=[8])
+    run.add_argument("--batch", nargs="+", type=int, default=[1])
+    run.add_argument("--precision", nargs="+", default=["double"],
+                     choices=sorted(PRECISIONS))
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1)
+
+    cmp = sub.add_parser("compare", help="compare against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.10,
+                     help="allowed time increase (fraction)")
+    cmp.add_argument("--memory-threshold", type=float, default=0.20,
+                     help="allowed peak memory increase (fraction)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run_benchmarks(
+            stages=args.stages,
+            chirps=args.chirps,
+            samples=args.samples,
+            targets=args.targets,
+            batch=args.batch,
+            precision=args.precision,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            log=sys.stdout
+        )
+
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result, f, indent=2)
+        return 0
+
+    report = compare(
+        _load(args.baseline),
+        _load(args.current),
+        threshold=args.threshold,
+        memory_threshold=args.memory_threshold
+    )
+
+    for entry in report:
+        if entry["missing"]:
+            print(f"{entry['label']} MISSING from {args.current}")
+            continue
+        flag = "REGRESSION" if entry["regression"] else "ok"
+        print(
+            f"{entry['label']} time x{entry['time_ratio']:.3f} "
+            f"mem x{entry['memory_ratio']:.3f}  {flag}"
+        )
+
+    return 1 if any(e["regression"] for e in report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
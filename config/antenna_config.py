@@ -0,0 +1,74 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+
+@dataclass
+class AntennaConfig:
+    """
+    Linear TDM-MIMO antenna geometry.
+
+    Element positions are in wavelengths along one axis. Virtual
+    channel v = tx * num_rx + rx sits at tx_pos[tx] + rx_pos[rx].
+    With the default tx_spacing = num_rx * rx_spacing the virtual array
+    is uniform with pitch rx_spacing (required by the angle FFT).
+
+    TDM: within each chirp loop the TX antennas fire one after another
+    in tdm_order, so TX k transmits in slot tdm_order.index(k).
+    """
+
+    num_tx: int = 1
+    num_rx: int = 1
+    rx_spacing: float = 0.5                 # [wavelengths]
+    tx_spacing: Optional[float] = None      # [wavelengths]
+    tdm_order: Optional[List[int]] = None   # TX firing order per loop
+
+    num_virtual: int = field(init=False)
+
+    def __post_init__(self):
+        if self.num_tx <= 0 or self.num_rx <= 0:
+            raise ValueError("num_tx and num_rx must be positive.")
+
+        if self.tx_spacing is None:
+            self.tx_spacing = self.num_rx * self.rx_spacing
+
+        if self.tdm_order is None:
+            self.tdm_order = list(range(self.num_tx))
+
+        if sorted(self.tdm_order) != list(range(self.num_tx)):
+            raise ValueError("tdm_order must be a permutation of TX indices.")
+
+        self.num_virtual = self.num_tx * self.num_rx
+
+    def tx_positions(self):
+        return np.arange(self.num_tx) * self.tx_spacing
+
+    def rx_positions(self):
+        return np.arange(self.num_rx) * self.rx_spacing
+
+    def virtual_positions(self):
+        """
+        Virtual element positions [N_virt] in wavelengths.
+        """
+        return (
+            self.tx_positions()[:, None] + self.rx_positions()[None, :]
+        ).reshape(-1)
+
+    def tx_slots(self):
+        """
+        TDM slot of every TX antenna [N_tx].
+        """
+        slots = np.empty(self.num_tx, dtype=np.int64)
+        slots[np.asarray(self.tdm_order)] = np.arange(self.num_tx)
+        return slots
+
+    def virtual_slots(self):
+        """
+        TDM slot of every virtual channel [N_virt].
+        """
+        return np.repeat(self.tx_slots(), self.num_rx)
+
+    def is_uniform(self):
+        pos = self.virtual_positions()
+        return pos.size < 2 or np.allclose(np.diff(pos), self.rx_spacing)
@@ -1,5 +1,16 @@
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from .antenna_config import AntennaConfig
+
+
+# precision → (complex dtype, real dtype)
+PRECISIONS = {
+    "double": (np.dtype(np.complex128), np.dtype(np.float64)),
+    "single": (np.dtype(np.complex64), np.dtype(np.float32)),
+}
+
 
 @dataclass
 class RadarConfig:
@@ -22,16 +33,25 @@ class RadarConfig:
 
     snr_db: float | None = 20.0     # AWGN SNR
 
+    precision: str = "double"       # "double" (complex128) / "single" (complex64)
+
+    antenna: AntennaConfig = field(default_factory=AntennaConfig)
+
     # === Derived parameters (auto computed) ===
     slope: float = field(init=False)
     wavelength: float = field(init=False)
     range_resolution: float = field(init=False)
     max_range: float = field(init=False)
     velocity_resolution: float = field(init=False)
+    complex_dtype: np.dtype = field(init=False)
+    real_dtype: np.dtype = field(init=False)
 
     SPEED_OF_LIGHT = 3e8
 
     def __post_init__(self):
+        if isinstance(self.antenna, dict):
+            self.antenna = AntennaConfig(**self.antenna)
+
         self._compute_derived()
 
     def _compute_derived(self):
@@ -51,6 +71,15 @@ class RadarConfig:
             self.SPEED_OF_LIGHT * self.sampling_rate
         ) / (2 * self.slope)
 
-        self.velocity_resolution = (
-            self.wavelength / (2 * self.num_chirps * self.chirp_duration)
+        # TDM: each virtual channel is sampled once per loop of N_tx
+        # chirps, so the Doppler observation time is Nc · Tc · N_tx
+        self.velocity_resolution = self.wavelength / (
+            2 * self.num_chirps * self.chirp_duration * self.antenna.num_tx
         )
+
+        if self.precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision '{self.precision}'. "
+                f"Choose from {sorted(PRECISIONS)}."
+            )
+        self.complex_dtype, self.real_dtype = PRECISIONS[self.precision]
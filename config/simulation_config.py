@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
+from typing import Optional
+
 from .radar_config import RadarConfig
-from .target_config import TargetScenario
+from .target_config import Target, TargetScenario
 
 
 @dataclass
@@ -15,3 +17,52 @@ class SimulationConfig:
     frame_time: float = 0.05
     enable_noise: bool = True
     enable_clutter: bool = False
+
+    # Overrides radar.precision when set ("single" / "double")
+    precision: Optional[str] = None
+
+    def __post_init__(self):
+        if self.precision is not None and self.precision != self.radar.precision:
+            self.radar = replace(self.radar, precision=self.precision)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build from plain values (parsed JSON / TOML):
+
+            {"radar": {RadarConfig fields, "antenna": {...}},
+             "targets": [{"range_m": ..., "velocity_mps": ...}, ...],
+             "frame_time": ..., "enable_noise": ..., "enable_clutter": ...,
+             "precision": ...}
+
+        Targets may also be given as {"scenario": {"targets": [...]}}.
+        Missing fields take their defaults.
+        """
+        data = dict(data)
+
+        scenario = data.pop("scenario", None) or {}
+        targets = data.pop("targets", scenario.get("targets", []))
+        radar = RadarConfig(**data.pop("radar", {}))
+
+        unknown = set(data) - {f.name for f in fields(cls)}
+        if unknown:
+            raise ValueError(
+                f"Unknown simulation config keys: {sorted(unknown)}."
+            )
+
+        return cls(
+            radar=radar,
+            scenario=TargetScenario([Target(**t) for t in targets]),
+            **data
+        )
+
+    def compile(self, angle_fft=64):
+        """
+        Validate the configuration once and derive every table of the
+        default chain into an immutable SimulationPlan
+        (config.simulation_plan).
+        """
+        # simulation_plan imports this module
+        from .simulation_plan import SimulationPlan
+
+        return SimulationPlan.build(self, angle_fft=angle_fft)
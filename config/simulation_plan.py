@@ -0,0 +1,333 @@
+import copy
+import hashlib
+import json
+import os
+from dataclasses import fields, is_dataclass
+from types import MappingProxyType
+
+import numpy as np
+
+from dsp.core.window import hann_window
+from dsp.doppler_processing.velocity_axis import VelocityAxis
+from dsp.range_processing.range_axis import RangeAxis
+
+from radar.channel import FRACTIONAL_STEPS, fractional_delay_table
+from radar.waveform import FMCWWaveform
+
+from .simulation_config import SimulationConfig
+from .validation import validate_radar_config
+
+
+PLAN_FILE = "plan.json"
+
+FORMAT_VERSION = 1
+
+
+def _to_dict(value):
+    """
+    Init fields of (nested) config dataclasses as plain JSON values;
+    derived fields are recomputed on load.
+    """
+    if is_dataclass(value):
+        return {
+            f.name: _to_dict(getattr(value, f.name))
+            for f in fields(value) if f.init
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_dict(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def build_tables(sim_cfg, angle_fft=64):
+    """
+    Every configuration-only table of the default processing chain.
+
+    Returns
+    -------
+    dict name → ndarray
+        t_fast [Ns], t_slow [N_tx, Nc]           (AnalyticBeatModel)
+        chirp [Tc·fs]                            (FMCWWaveform)
+        fractional_delay [Q, Tc·fs]              (RadarChannel, default
+                                                  fractional_steps)
+        win_range [Ns], win_doppler [Nc],
+        win_2d [Nc, Ns], range_axis [Ns],
+        velocity_axis [Nc]                       (RDMPipeline)
+        angle_axis [angle_fft], virtual_slots    (AngleProcessor,
+                                                  N_virt > 1 only)
+    """
+    radar = sim_cfg.radar
+    antenna = radar.antenna
+    real_dtype = radar.real_dtype
+
+    nc, ns = radar.num_chirps, radar.num_samples
+    fs = radar.sampling_rate
+
+    tables = {}
+
+    # Beat synthesis time axes (chirp interval = chirp duration)
+    tables["t_fast"] = np.arange(ns) / fs
+    tables["t_slow"] = (
+        np.arange(nc)[None, :] * antenna.num_tx + antenna.tx_slots()[:, None]
+    ) * radar.chirp_duration
+
+    tables["chirp"] = FMCWWaveform(
+        radar.fc, radar.bandwidth, radar.chirp_duration, fs,
+        dtype=radar.complex_dtype, cache=None
+    ).generate()
+    tables["fractional_delay"] = fractional_delay_table(
+        tables["chirp"], FRACTIONAL_STEPS
+    )
+
+    # RDM windows and axes (TDM: slow-time sampling is N_tx chirps)
+    win_r = np.asarray(hann_window(ns), dtype=real_dtype)
+    win_d = np.asarray(hann_window(nc), dtype=real_dtype)
+    tables["win_range"] = win_r
+    tables["win_doppler"] = win_d
+    tables["win_2d"] = win_d[:, None] * win_r[None, :]
+
+    tables["range_axis"] = RangeAxis(
+        fc=radar.fc,
+        bandwidth=radar.bandwidth,
+        chirp_duration=radar.chirp_duration,
+        num_samples=ns,
+        sampling_rate=fs
+    ).generate(shift=False)
+    tables["velocity_axis"] = VelocityAxis(
+        fc=radar.fc,
+        chirp_interval=radar.chirp_duration * antenna.num_tx,
+        n_fft=nc
+    ).generate(shift=True)
+
+    if antenna.num_virtual > 1 and antenna.is_uniform():
+        spatial_freq = np.fft.fftshift(np.fft.fftfreq(angle_fft))
+        sin_theta = np.clip(spatial_freq / antenna.rx_spacing, -1.0, 1.0)
+        tables["angle_axis"] = np.arcsin(sin_theta)
+        tables["virtual_slots"] = antenna.virtual_slots()
+
+    return tables
+
+
+class SimulationPlan:
+    """
+    Validated, immutable simulation plan.
+
+    Built once by SimulationConfig.compile(): the configuration is
+    validated and every configuration-only table (time axes, transmit
+    chirp, windows, range / velocity / angle axes) is derived into one
+    read-only mapping that the stages share through their from_plan()
+    constructors instead of rebuilding it:
+
+        plan = sim_cfg.compile()
+        plan.save("plan/")                      # once
+        plan = SimulationPlan.load("plan/")     # per worker (memmap)
+        runner = SimulationRunner.from_plan(plan)
+
+    On disk a plan is a directory with plan.json (config, fingerprint,
+    table index) and one .npy file per table. load() memory-maps the
+    tables by default, so worker processes share the pages.
+
+    Attributes
+    ----------
+    config : SimulationConfig
+        Private copy; do not modify
+    tables : mapping name → read-only ndarray
+    fingerprint : str
+        Hash of the configuration (identifies compatible plans)
+    angle_fft : int
+    """
+
+    __slots__ = ("config", "tables", "fingerprint", "angle_fft")
+
+    def __init__(self, config, tables, angle_fft=64):
+        frozen = {}
+        for name, table in tables.items():
+            if not isinstance(table, np.memmap):
+                table = np.array(table, copy=True)
+            table.setflags(write=False)
+            frozen[name] = table
+
+        object.__setattr__(self, "config", config)
+        object.__setattr__(self, "tables", MappingProxyType(frozen))
+        object.__setattr__(self, "angle_fft", int(angle_fft))
+        object.__setattr__(self, "fingerprint", self._fingerprint(config))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SimulationPlan is immutable.")
+
+    def __reduce__(self):
+        # Pickled with its tables (process pools); save()/load() share
+        # them through memory-mapped files instead
+        return (type(self), (self.config, dict(self.tables), self.angle_fft))
+
+    @staticmethod
+    def _fingerprint(config):
+        text = json.dumps(_to_dict(config), sort_keys=True)
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def build(cls, sim_cfg, angle_fft=64):
+        """
+        Validate sim_cfg and derive all tables (see build_tables).
+        """
+        validate_radar_config(sim_cfg.radar)
+
+        if sim_cfg.frame_time <= 0:
+            raise ValueError("frame_time must be positive.")
+
+        config = copy.deepcopy(sim_cfg)
+        return cls(config, build_tables(config, angle_fft), angle_fft)
+
+    @property
+    def radar(self):
+        return self.config.radar
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def table(self, name, shape=None, dtype=None):
+        """
+        Table by name, checked against the shape a stage expects and
+        converted to its dtype (no copy when it already matches).
+        """
+        try:
+            table = self.tables[name]
+        except KeyError:
+            raise ValueError(f"Plan has no table '{name}'.") from None
+
+        if shape is not None and table.shape != tuple(shape):
+            raise ValueError(
+                f"Plan table '{name}' has shape {table.shape}, "
+                f"expected {tuple(shape)}."
+            )
+
+        if dtype is not None and table.dtype != np.dtype(dtype):
+            table = table.astype(dtype)
+            table.setflags(write=False)
+
+        return table
+
+    def check(self, stage, **params):
+        """
+        Raise ValueError unless the parameters a stage was constructed
+        with match the plan: its tables (time axes, windows, axes) are
+        only valid for the plan's configuration.
+
+        Parameters
+        ----------
+        stage : str
+            Name used in the error message
+        **params
+            Any of fc, bandwidth, chirp_duration, num_chirps,
+            num_samples, fs, chirp_period (chirp start spacing),
+            chirp_interval (slow-time sampling per virtual channel,
+            chirp_duration · N_tx), tx_slots, antenna, angle_fft, radar
+        """
+        radar = self.radar
+        antenna = radar.antenna
+        expected = {
+            "fc": radar.fc,
+            "bandwidth": radar.bandwidth,
+            "chirp_duration": radar.chirp_duration,
+            "num_chirps": radar.num_chirps,
+            "num_samples": radar.num_samples,
+            "fs": radar.sampling_rate,
+            "chirp_period": radar.chirp_duration,
+            "chirp_interval": radar.chirp_duration * antenna.num_tx,
+            "tx_slots": antenna.tx_slots(),
+            "antenna": antenna,
+            "angle_fft": self.angle_fft,
+            "radar": radar,
+        }
+
+        mismatched = []
+        for name, value in params.items():
+            target = expected[name]
+            if is_dataclass(target):
+                value, target = _to_dict(value), _to_dict(target)
+                mismatched += [
+                    f"{name}.{key}={value.get(key)} (plan: {target[key]})"
+                    for key in target if value.get(key) != target[key]
+                ]
+                continue
+
+            value, target = np.asarray(value), np.asarray(target)
+            same = value.shape == target.shape and np.allclose(
+                value, target, rtol=1e-9, atol=0
+            )
+            if not same:
+                mismatched.append(f"{name}={value} (plan: {target})")
+
+        if mismatched:
+            raise ValueError(
+                f"{stage} does not match the plan: " + ", ".join(mismatched)
+                + ". Build it with from_plan()."
+            )
+
+    @property
+    def nbytes(self):
+        return sum(t.nbytes for t in self.tables.values())
+
+    def save(self, path):
+        """
+        Write the plan to directory path (created if needed).
+        """
+        os.makedirs(path, exist_ok=True)
+
+        for name, table in self.tables.items():
+            np.save(os.path.join(path, name + ".npy"), table)
+
+        header = {
+            "version": FORMAT_VERSION,
+            "fingerprint": self.fingerprint,
+            "angle_fft": self.angle_fft,
+            "config": _to_dict(self.config),
+            "tables": {
+                name: [list(t.shape), t.dtype.str]
+                for name, t in self.tables.items()
+            },
+        }
+
+        tmp = os.path.join(path, PLAN_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(header, f, indent=2)
+        os.replace(tmp, os.path.join(path, PLAN_FILE))
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a saved plan without recomputing any table.
+
+        Parameters
+        ----------
+        path : str
+        mmap : bool
+            Memory-map the tables (read-only, shared page cache)
+        """
+        with open(os.path.join(path, PLAN_FILE)) as f:
+            header = json.load(f)
+
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported plan version {header['version']}."
+            )
+
+        tables = {
+            name: np.load(os.path.join(path, name + ".npy"),
+                          mmap_mode="r" if mmap else None)
+            for name in header["tables"]
+        }
+
+        try:
+            config = SimulationConfig.from_dict(header["config"])
+        except TypeError as exc:
+            # Unknown RadarConfig / Target field
+            raise ValueError(f"Invalid plan {path}: {exc}") from None
+
+        plan = cls(config, tables, header["angle_fft"])
+
+        if plan.fingerprint != header["fingerprint"]:
+            raise ValueError("Plan configuration does not match its tables.")
+
+        return plan
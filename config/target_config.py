@@ -10,7 +10,7 @@ class Target:
 
     range_m: float
     velocity_mps: float
-    angle_rad: float
+    angle_rad: float = 0.0
     rcs: float = 1.0
 
 
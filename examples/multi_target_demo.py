@@ -1,10 +1,7 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from pipeline.simulation_runner import SimulationRunner, RadarConfig
-from pipeline.signal_generator import Target
-
-from dsp.rdm.rdm_visualization import RDMVisualizer
+from config.target_config import Target
 
 def main():
     cfg = RadarConfig(
@@ -30,7 +27,10 @@ def main():
 
     print("Targets:")
     for t in targets:
-        print(f"Range={t.r0} m, Velocity={t.v} m/s")
+        print(f"Range={t.range_m} m, Velocity={t.velocity_mps} m/s")
+
+    # Visualization only here (GUI dependencies stay optional)
+    from dsp.rdm.rdm_visualization import RDMVisualizer
 
     # plot_rdm(rdm, range_axis, velocity_axis, title="Multi Target RDM")
     viz = RDMVisualizer(log_scale=True)
@@ -1,11 +1,8 @@
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from pipeline.simulation_runner import SimulationRunner, RadarConfig
-from pipeline.signal_generator import Target
-
-from dsp.rdm.rdm_visualization import RDMVisualizer
+from config.target_config import Target
 
 def main():
     # Radar specification
@@ -32,8 +29,11 @@ def main():
 
     rdm, range_axis, velocity_axis = runner.run()
 
-    print("Expected range:", targets[0].r0, "m")
-    print("Expected velocity:", targets[0].v, "m/s")
+    print("Expected range:", targets[0].range_m, "m")
+    print("Expected velocity:", targets[0].velocity_mps, "m/s")
+
+    # Visualization only here (GUI dependencies stay optional)
+    from dsp.rdm.rdm_visualization import RDMVisualizer
 
     # plot_rdm(rdm, range_axis, velocity_axis)
     viz = RDMVisualizer(log_scale=True)
@@ -0,0 +1,147 @@
+import numpy as np
+
+from utils.fft_backend import get_fft_backend
+
+
+class AngleProcessor:
+    """
+    Range-Doppler-angle stage for a TDM-MIMO virtual array.
+
+    Runs a zero-padded angle FFT across the virtual-channel axis of a
+    complex range-Doppler cube [..., N_virt, Nc, Ns] (as produced by
+    RDMPipeline.process). The transform uses conjugate steering so that
+    the element phase exp(-j2π x sin θ) of AnalyticBeatModel peaks at
+    sin θ = f / d, with f the shifted spatial frequency and d the
+    element pitch in wavelengths.
+
+    Requires a uniform virtual array (AntennaConfig.is_uniform()).
+
+    Parameters
+    ----------
+    antenna : AntennaConfig
+    n_fft : int
+        Angle FFT size (≥ N_virt, zero-padded)
+    window : ndarray [N_virt] or None
+        Taper across virtual channels
+    fft_backend : str, backend or None
+    plan : config.simulation_plan.SimulationPlan or None
+        Supplies angle_axis and virtual slots (antenna and n_fft must
+        match the plan, ValueError otherwise)
+    """
+
+    def __init__(self, antenna, n_fft=64, window=None, fft_backend=None,
+                 plan=None):
+        if not antenna.is_uniform():
+            raise ValueError("Angle FFT requires a uniform virtual array.")
+
+        self.antenna = antenna
+        self.num_virtual = antenna.num_virtual
+        self.n_fft = int(n_fft)
+
+        if self.n_fft < self.num_virtual:
+            raise ValueError("n_fft must be at least the number of channels.")
+
+        self.fft = get_fft_backend(fft_backend)
+
+        self.window = None if window is None else np.asarray(window)
+
+        if plan is None:
+            spatial_freq = np.fft.fftshift(np.fft.fftfreq(self.n_fft))
+            sin_theta = np.clip(spatial_freq / antenna.rx_spacing, -1.0, 1.0)
+
+            self.angle_axis = np.arcsin(sin_theta)
+            self.angle_axis.setflags(write=False)
+
+            self.slots = antenna.virtual_slots()
+        else:
+            plan.check("AngleProcessor", antenna=antenna, angle_fft=self.n_fft)
+            self.angle_axis = plan.table("angle_axis", (self.n_fft,))
+            self.slots = plan.table("virtual_slots", (self.num_virtual,))
+
+    @classmethod
+    def from_plan(cls, plan, window=None, fft_backend=None):
+        """
+        Angle stage for a compiled SimulationPlan (N_virt > 1).
+        """
+        return cls(plan.radar.antenna, n_fft=plan.angle_fft, window=window,
+                   fft_backend=fft_backend, plan=plan)
+
+    def compensate_tdm(self, rd_cube, velocity_axis, wavelength, chirp_interval):
+        """
+        Remove the Doppler phase accumulated between TDM slots.
+
+        Virtual channel v fires slot_v chirp intervals after slot 0,
+        so a target at velocity u carries an extra phase
+        2π (2u/λ) slot_v T. The phase is removed per Doppler bin.
+
+        Parameters
+        ----------
+        rd_cube : complex ndarray [..., N_virt, Nc, Ns]
+        velocity_axis : ndarray [Nc]
+        wavelength : float
+        chirp_interval : float
+            Single chirp interval T (not N_tx · T)
+
+        Returns
+        -------
+        complex ndarray [..., N_virt, Nc, Ns]
+        """
+        f_d = 2 * np.asarray(velocity_axis) / wavelength
+        phase = np.exp(
+            -2j * np.pi * f_d[None, :] * self.slots[:, None] * chirp_interval
+        )
+        return rd_cube * phase.astype(rd_cube.dtype)[..., None]
+
+    def _transform(self, x, axis):
+        if self.window is not None:
+            shape = [1] * x.ndim
+            shape[axis] = self.num_virtual
+            x = x * self.window.reshape(shape)
+
+        spec = self.fft.ifft(x, n=self.n_fft, axis=axis) * self.n_fft
+        return self.fft.fftshift(spec, axes=axis)
+
+    def spectrum(self, rd_cube):
+        """
+        Full range-Doppler-angle magnitude cube.
+
+        Parameters
+        ----------
+        rd_cube : complex ndarray [..., N_virt, Nc, Ns]
+
+        Returns
+        -------
+        rda : ndarray [..., n_fft, Nc, Ns]
+        angle_axis : ndarray [n_fft] (rad)
+        """
+        assert rd_cube.shape[-3] == self.num_virtual
+
+        return np.abs(self._transform(rd_cube, axis=-3)), self.angle_axis
+
+    def estimate(self, rd_cube, detections):
+        """
+        Angle FFT only on detected cells.
+
+        Parameters
+        ----------
+        rd_cube : complex ndarray [N_virt, Nc, Ns] or [F, N_virt, Nc, Ns]
+        detections : structured ndarray (CFARDetector.detect output)
+
+        Returns
+        -------
+        angles : ndarray [D] (rad), peak of each cell's angle spectrum
+        spectra : ndarray [D, n_fft] magnitude
+        """
+        if rd_cube.ndim == 3:
+            rd_cube = rd_cube[None]
+
+        # Advanced indices around a slice → [D, N_virt]
+        cells = rd_cube[
+            detections["frame"], :, detections["doppler_bin"],
+            detections["range_bin"]
+        ]
+
+        spectra = np.abs(self._transform(cells, axis=-1))
+        angles = self.angle_axis[np.argmax(spectra, axis=-1)]
+
+        return angles, spectra
@@ -0,0 +1,391 @@
+"""
+Headless batch simulation.
+
+Runs N frames of a scenario described by a JSON or TOML file (or a
+compiled plan directory, see config.simulation_plan) and writes ADC
+cubes, range-Doppler maps and/or CFAR detections plus throughput
+statistics. Nothing graphical is imported unless --plot is given, and
+the simulation modules load only once a command runs, so --help and
+argument errors return immediately.
+
+Usage (from the repository root):
+
+    python -m pipeline.batch run scenario.toml -o out/ --frames 100 \\
+        --outputs rdm detections
+    python -m pipeline.batch compile scenario.toml -o plan/
+    python -m pipeline.batch run plan/ -o out/ --frames 100 --seed 7
+
+Scenario file (TOML; JSON uses the same keys, see
+SimulationConfig.from_dict):
+
+    frame_time = 0.05
+    enable_noise = true
+
+    [radar]
+    fc = 77e9
+    num_chirps = 128
+    num_samples = 256
+    snr_db = 20.0
+
+    [radar.antenna]
+    num_tx = 2
+    num_rx = 4
+
+    [[targets]]
+    range_m = 30.0
+    velocity_mps = 5.0
+
+Output directory:
+    adc/             frame store (pipeline.frame_store) + ground truth
+    rdm.npy          [N, Nc, Ns] magnitude maps
+    axes.npz         range_axis, velocity_axis
+    detections.npy   CFAR detections (pipeline.cfar.DETECTION_DTYPE,
+                     REFINED_DTYPE with --refine)
+    stats.json       frame count, timings, throughput and the fraction
+                     of clipped ADC values
+    rdm_last.png     last RDM (--plot, needs matplotlib)
+
+Running again into the same output directory replaces these files.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+
+OUTPUTS = ("adc", "rdm", "detections")
+
+
+def load_scenario(path):
+    """
+    SimulationConfig from a .json / .toml file.
+    """
+    from config.simulation_config import SimulationConfig
+
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".json":
+        with open(path) as f:
+            data = json.load(f)
+    elif ext == ".toml":
+        try:
+            import tomllib
+        except ImportError:         # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError(
+                    "Reading TOML needs Python 3.11+ or the tomli package."
+                ) from None
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        raise ValueError(
+            f"Unknown scenario format '{ext}'. Use .json or .toml."
+        )
+
+    try:
+        return SimulationConfig.from_dict(data)
+    except TypeError as exc:
+        # Unknown RadarConfig / Target field
+        raise ValueError(f"Invalid scenario {path}: {exc}") from None
+
+
+def load_plan(path, precision=None):
+    """
+    Compiled plan from a plan directory or a scenario file.
+    """
+    from dataclasses import replace
+
+    from config.simulation_plan import PLAN_FILE, SimulationPlan
+
+    if os.path.isdir(path):
+        if precision is not None:
+            raise ValueError("--precision cannot override a compiled plan.")
+        if not os.path.exists(os.path.join(path, PLAN_FILE)):
+            raise ValueError(f"{path} is not a plan directory.")
+        return SimulationPlan.load(path)
+
+    sim_cfg = load_scenario(path)
+    if precision is not None:
+        sim_cfg = replace(sim_cfg, precision=precision)
+
+    return sim_cfg.compile()
+
+
+def _save_plot(path, rdm, range_axis, velocity_axis):
+    """
+    Log-magnitude image of one RDM (matplotlib, non-interactive).
+    """
+    try:
+        import matplotlib
+    except ImportError:
+        raise ValueError("--plot needs matplotlib.") from None
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    image = ax.imshow(
+        20 * np.log10(rdm + 1e-12),
+        aspect="auto",
+        origin="lower",
+        extent=[range_axis[0], range_axis[-1],
+                velocity_axis[0], velocity_axis[-1]],
+    )
+    ax.set_xlabel("Range [m]")
+    ax.set_ylabel("Velocity [m/s]")
+    fig.colorbar(image, ax=ax, label="dB")
+    fig.savefig(path, dpi=100)
+    plt.close(fig)
+
+
+def run_batch(plan, output_dir, num_frames, outputs=("rdm", "detections"),
+              seed=None, cfar="ca", pfa=1e-4, refine=False, profile=False,
+              plot=False, log=None):
+    """
+    Simulate num_frames frames of a compiled plan and write outputs.
+
+    Returns
+    -------
+    stats : dict (also written to output_dir/stats.json)
+    """
+    import numpy as np
+
+    from pipeline.simulation_runner import SimulationRunner
+
+    if num_frames <= 0:
+        raise ValueError("num_frames must be positive.")
+
+    unknown = set(outputs) - set(OUTPUTS)
+    if unknown:
+        raise ValueError(f"Unknown outputs {sorted(unknown)}; use {OUTPUTS}.")
+
+    if plot:
+        from importlib.util import find_spec
+        if find_spec("matplotlib") is None:
+            raise ValueError("--plot needs matplotlib.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    radar = plan.radar
+
+    # ADC cube of the default sensor
+    frame_shape = (radar.num_chirps, radar.num_samples)
+    if radar.antenna.num_virtual > 1:
+        frame_shape = (radar.antenna.num_virtual,) + frame_shape
+
+    observer = None
+    if profile:
+        from utils.instrumentation import StageRecorder
+        observer = StageRecorder()
+
+    start = time.perf_counter()
+
+    runner = SimulationRunner.from_plan(
+        plan, seed=seed, observer=observer, workspace=True
+    )
+    pipe = runner.rdm_pipeline
+
+    want_rdm = "rdm" in outputs or "detections" in outputs or plot
+
+    store = None
+    if "adc" in outputs:
+        from pipeline.frame_store import FrameStoreWriter
+
+    rdm_out = None
+    if "rdm" in outputs:
+        rdm_out = np.lib.format.open_memmap(
+            os.path.join(output_dir, "rdm.npy"), mode="w+",
+            dtype=radar.real_dtype,
+            shape=(num_frames, radar.num_chirps, radar.num_samples)
+        )
+
+    detector = refiner = None
+    detections = []
+    if "detections" in outputs:
+        from pipeline.cfar import CFARDetector
+        detector = CFARDetector(method=cfar, pfa=pfa)
+        if refine:
+            from pipeline.refinement import ZoomRefiner
+            refiner = ZoomRefiner(pipe)
+
+    setup_time = time.perf_counter() - start
+    sim_time = 0.0
+    output_time = 0.0
+    last_rdm = None
+
+    frames = runner.stream(num_frames, compute_rdm=want_rdm)
+    while True:
+        t0 = time.perf_counter()
+        frame = next(frames, None)
+        t1 = time.perf_counter()
+        if frame is None:
+            break
+
+        if "adc" in outputs:
+            if store is None:
+                # dtype (or packed codes) known from the first frame
+                # Like rdm.npy and the other outputs, a rerun replaces
+                # the previous store
+                store = FrameStoreWriter.like(
+                    os.path.join(output_dir, "adc"), radar, frame.adc_cube,
+                    overwrite=True
+                )
+            store.append(frame.adc_cube, ground_truth=frame.ground_truth,
+                         timestamp=frame.timestamp)
+        if rdm_out is not None:
+            rdm_out[frame.frame_index] = frame.rdm
+
+        if detector is not None:
+            det = detector.detect(frame.rdm, pipe.range_axis,
+                                  pipe.velocity_axis)
+            det["frame"] = frame.frame_index
+            if refiner is not None:
+                # Multi-channel: refine on the channel-summed power,
+                # like the RDM the detections came from
+                det = refiner.refine(frame.adc_cube, det,
+                                     multichannel=frame.adc_cube.ndim == 3)
+            detections.append(det)
+
+        if plot and frame.frame_index == num_frames - 1:
+            last_rdm = np.array(frame.rdm)
+
+        t2 = time.perf_counter()
+        sim_time += t1 - t0
+        output_time += t2 - t1
+
+    if store is not None:
+        store.close()
+    if rdm_out is not None:
+        rdm_out.flush()
+        del rdm_out
+    if "rdm" in outputs or plot:
+        np.savez(os.path.join(output_dir, "axes.npz"),
+                 range_axis=pipe.range_axis,
+                 velocity_axis=pipe.velocity_axis)
+    if detector is not None:
+        detections = np.concatenate(detections)
+        np.save(os.path.join(output_dir, "detections.npy"), detections)
+    if last_rdm is not None:
+        _save_plot(os.path.join(output_dir, "rdm_last.png"), last_rdm,
+                   pipe.range_axis, pipe.velocity_axis)
+
+    total_time = time.perf_counter() - start
+    samples = num_frames * int(np.prod(frame_shape))
+
+    stats = {
+        "frames": num_frames,
+        "frame_shape": list(frame_shape),
+        "precision": radar.precision,
+        "outputs": sorted(outputs),
+        "setup_s": setup_time,
+        "simulate_s": sim_time,
+        "output_s": output_time,
+        "total_s": total_time,
+        "frames_per_s": num_frames / sim_time if sim_time > 0 else None,
+        "msamples_per_s": samples / sim_time / 1e6 if sim_time > 0 else None,
+        "realtime_factor": (
+            num_frames * plan.config.frame_time / sim_time
+            if sim_time > 0 else None
+        ),
+        "detections": (
+            int(detections.shape[0]) if detector is not None else None
+        ),
+        "adc_clip_fraction": runner.sensor.adc.clip_fraction,
+        "plan_fingerprint": plan.fingerprint,
+    }
+    if observer is not None:
+        stats["stages"] = observer.summary()
+
+    with open(os.path.join(output_dir, "stats.json"), "w") as f:
+        json.dump(stats, f, indent=2)
+
+    if log is not None:
+        print(
+            f"{num_frames} frames {tuple(stats['frame_shape'])} in "
+            f"{sim_time:.3f} s: {stats['frames_per_s'] or 0:.1f} frames/s, "
+            f"{stats['msamples_per_s'] or 0:.1f} Msamples/s, "
+            f"{stats['realtime_factor'] or 0:.2f}x real time "
+            f"(setup {setup_time:.3f} s, outputs {output_time:.3f} s)",
+            file=log
+        )
+        if observer is not None:
+            print(observer.report(), file=log)
+
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pipeline.batch",
+        description="Headless batch runs of the radar simulator."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="simulate frames, write outputs")
+    run.add_argument("scenario", help="scenario .json / .toml or plan dir")
+    run.add_argument("-o", "--output", required=True, help="output directory")
+    run.add_argument("-n", "--frames", type=int, default=10)
+    run.add_argument("--outputs", nargs="+", default=["rdm", "detections"],
+                     choices=OUTPUTS)
+    run.add_argument("--seed", type=int, default=None)
+    run.add_argument("--precision", choices=["double", "single"],
+                     default=None)
+    run.add_argument("--cfar", choices=["ca", "go", "so", "os"], default="ca")
+    run.add_argument("--pfa", type=float, default=1e-4)
+    run.add_argument("--refine", action="store_true",
+                     help="zoom-DFT refinement of detections (on the "
+                          "channel-summed power for multi-channel radars)")
+    run.add_argument("--profile", action="store_true",
+                     help="per-stage timing in stats.json")
+    run.add_argument("--plot", action="store_true",
+                     help="save the last RDM as PNG (matplotlib)")
+
+    comp = sub.add_parser("compile", help="compile a scenario into a plan")
+    comp.add_argument("scenario", help="scenario .json / .toml")
+    comp.add_argument("-o", "--output", required=True, help="plan directory")
+    comp.add_argument("--precision", choices=["double", "single"],
+                      default=None)
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "compile":
+            if os.path.isdir(args.scenario):
+                raise ValueError("compile expects a scenario file.")
+            plan = load_plan(args.scenario, args.precision)
+            plan.save(args.output)
+            print(f"plan {plan.fingerprint} ({plan.nbytes} bytes of tables) "
+                  f"written to {args.output}")
+            return 0
+
+        if args.frames <= 0:
+            raise ValueError("--frames must be positive.")
+
+        plan = load_plan(args.scenario, args.precision)
+        run_batch(
+            plan,
+            args.output,
+            args.frames,
+            outputs=args.outputs,
+            seed=args.seed,
+            cfar=args.cfar,
+            pfa=args.pfa,
+            refine=args.refine,
+            profile=args.profile,
+            plot=args.plot,
+            log=sys.stdout
+        )
+
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
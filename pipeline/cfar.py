@@ -0,0 +1,326 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+DETECTION_DTYPE = np.dtype([
+    ("frame", np.int64),
+    ("doppler_bin", np.int64),
+    ("range_bin", np.int64),
+    ("range", np.float64),
+    ("velocity", np.float64),
+    ("snr_db", np.float64),
+])
+
+
+def ca_scale(num_train, pfa):
+    """
+    CA-CFAR threshold factor for square-law detection:
+        α = N (Pfa^(-1/N) - 1)
+    """
+    return num_train * (pfa ** (-1.0 / num_train) - 1.0)
+
+
+def os_scale(num_train, rank, pfa, iterations=200):
+    """
+    OS-CFAR threshold factor (Rohling), solved by bisection:
+        Pfa = Π_{i=0}^{k-1} (N - i) / (N - i + α)
+    """
+    i = np.arange(rank)
+
+    def log_pfa(alpha):
+        return np.sum(np.log(num_train - i) - np.log(num_train - i + alpha))
+
+    target = np.log(pfa)
+    lo, hi = 0.0, 1.0
+    while log_pfa(hi) > target:
+        hi *= 2.0
+
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        if log_pfa(mid) > target:
+            lo = mid
+        else:
+            hi = mid
+
+    return 0.5 * (lo + hi)
+
+
+class CFARDetector:
+    """
+    2-D CFAR detector on range-Doppler magnitude maps.
+
+    Methods
+    -------
+    ca : cell averaging over the full training ring
+    go : greatest-of the leading / lagging range halves
+    so : smallest-of the leading / lagging range halves
+    os : ordered statistic (rank-th smallest training cell)
+
+    CA/GO/SO noise estimates are box sums from integral images, so the
+    cost per cell is constant regardless of window size. All methods
+    accept a single RDM [Nc, Ns] or a batch [F, Nc, Ns].
+
+    Boundaries: the Doppler axis wraps (it is circular after the FFT).
+    Along range, CA/GO/SO average only the cells that exist (GO/SO use
+    the remaining half where one half lies outside the map); OS
+    mirrors the edge cells.
+
+    Parameters
+    ----------
+    method : str
+        "ca", "go", "so" or "os"
+    guard : (int, int)
+        Guard cells (Doppler, range) on each side of the CUT
+    train : (int, int)
+        Training cells (Doppler, range) beyond the guard cells
+    pfa : float
+        Design false-alarm probability (ignored if scale is given).
+        The GO/SO factor uses the CA formula for one half-window,
+        which is a close approximation.
+    scale : float or None
+        Explicit threshold factor α (power domain)
+    os_rank : int or None
+        1-based rank for OS-CFAR (default: 3/4 of the training cells)
+    block_rows : int
+        Doppler rows per OS block (bounds OS memory)
+    """
+
+    METHODS = ("ca", "go", "so", "os")
+
+    def __init__(self, method="ca", guard=(2, 2), train=(4, 8), pfa=1e-4,
+                 scale=None, os_rank=None, block_rows=32):
+        if method not in self.METHODS:
+            raise ValueError(
+                f"Unknown CFAR method '{method}'. Choose from {self.METHODS}."
+            )
+
+        self.method = method
+        self.gd, self.gr = (int(g) for g in guard)
+        self.td, self.tr = (int(t) for t in train)
+        self.pfa = pfa
+        self.block_rows = int(block_rows)
+
+        # Half extents of the full window
+        self.pd = self.gd + self.td
+        self.pr = self.gr + self.tr
+
+        outer = (2 * self.pd + 1) * (2 * self.pr + 1)
+        inner = (2 * self.gd + 1) * (2 * self.gr + 1)
+        self.num_train = outer - inner
+
+        if self.num_train <= 0:
+            raise ValueError("CFAR window has no training cells.")
+
+        self.os_rank = (
+            int(os_rank) if os_rank is not None
+            else max(1, (3 * self.num_train) // 4)
+        )
+
+        if scale is not None:
+            self.scale = float(scale)
+        elif method == "ca":
+            self.scale = ca_scale(self.num_train, pfa)
+        elif method in ("go", "so"):
+            self.scale = ca_scale(self._half_cells(), pfa)
+        else:
+            self.scale = os_scale(self.num_train, self.os_rank, pfa)
+
+        self._count_cache = {}
+
+    def _half_cells(self):
+        rows = 2 * self.pd + 1
+        guard_rows = 2 * self.gd + 1
+        return rows * self.pr - guard_rows * self.gr
+
+    # ------------------------------------------------------------------
+    # Noise estimation
+    # ------------------------------------------------------------------
+
+    def noise_level(self, power):
+        """
+        Per-cell noise power estimate.
+
+        Parameters
+        ----------
+        power : ndarray [..., Nc, Ns]
+            Power map (|rdm|^2)
+
+        Returns
+        -------
+        noise : ndarray [..., Nc, Ns]
+        """
+        if self.method == "os":
+            return self._os_noise(power)
+
+        nc, ns = power.shape[-2:]
+        integral = self._integral(power)
+        counts = self._counts(nc, ns)
+
+        if self.method == "ca":
+            total = self._ring(integral, nc, ns)
+            return total / counts["ring"]
+
+        left, right = self._halves(integral, nc, ns)
+        left = left / np.maximum(counts["left"], 1.0)
+        right = right / np.maximum(counts["right"], 1.0)
+
+        # At the range edges one half has no training cells: its zero
+        # mean must not win, so the other half decides
+        empty = np.inf if self.method == "so" else -np.inf
+        left = np.where(counts["left"] > 0, left, empty)
+        right = np.where(counts["right"] > 0, right, empty)
+
+        if self.method == "go":
+            return np.maximum(left, right)
+        return np.minimum(left, right)
+
+    def _integral(self, x):
+        """
+        Zero-led integral image of x padded by the window extent
+        (Doppler wrapped, range zero).
+        """
+        pad = [(0, 0)] * (x.ndim - 2)
+        x = np.pad(x, pad + [(self.pd, self.pd), (0, 0)], mode="wrap")
+        x = np.pad(x, pad + [(0, 0), (self.pr, self.pr)], mode="constant")
+
+        integral = np.zeros(
+            x.shape[:-2] + (x.shape[-2] + 1, x.shape[-1] + 1),
+            dtype=np.float64
+        )
+        np.cumsum(x, axis=-2, out=integral[..., 1:, 1:])
+        np.cumsum(integral[..., 1:, 1:], axis=-1, out=integral[..., 1:, 1:])
+
+        return integral
+
+    @staticmethod
+    def _box(integral, nc, ns, r0, r1, c0, c1):
+        """
+        Sum over rows [i + r0, i + r1) and cols [j + c0, j + c1) of the
+        padded map, for every output cell (i, j).
+        """
+        return (
+            integral[..., r1:r1 + nc, c1:c1 + ns]
+            - integral[..., r0:r0 + nc, c1:c1 + ns]
+            - integral[..., r1:r1 + nc, c0:c0 + ns]
+            + integral[..., r0:r0 + nc, c0:c0 + ns]
+        )
+
+    def _ring(self, integral, nc, ns):
+        rows = 2 * self.pd + 1
+        cols = 2 * self.pr + 1
+
+        outer = self._box(integral, nc, ns, 0, rows, 0, cols)
+        inner = self._box(
+            integral, nc, ns,
+            self.td, self.td + 2 * self.gd + 1,
+            self.tr, self.tr + 2 * self.gr + 1
+        )
+        return outer - inner
+
+    def _halves(self, integral, nc, ns):
+        """
+        Leading (lower range) and lagging (higher range) training cells.
+        The CUT column itself belongs to neither half.
+        """
+        rows = 2 * self.pd + 1
+        g0, g1 = self.td, self.td + 2 * self.gd + 1
+
+        left = (
+            self._box(integral, nc, ns, 0, rows, 0, self.pr)
+            - self._box(integral, nc, ns, g0, g1, self.tr, self.pr)
+        )
+        right = (
+            self._box(integral, nc, ns, 0, rows, self.pr + 1, 2 * self.pr + 1)
+            - self._box(integral, nc, ns, g0, g1,
+                        self.pr + 1, self.pr + 1 + self.gr)
+        )
+        return left, right
+
+    def _counts(self, nc, ns):
+        """
+        Number of existing training cells per output cell (depends only
+        on the range position, cached per map shape). Halves at the
+        range edges can be empty (count 0).
+        """
+        key = (nc, ns)
+        if key not in self._count_cache:
+            integral = self._integral(np.ones((nc, ns)))
+            left, right = self._halves(integral, nc, ns)
+            self._count_cache[key] = {
+                "ring": np.maximum(self._ring(integral, nc, ns), 1.0),
+                "left": np.rint(left),
+                "right": np.rint(right),
+            }
+        return self._count_cache[key]
+
+    def _os_noise(self, power):
+        batch_shape = power.shape[:-2]
+        nc, ns = power.shape[-2:]
+
+        pad = [(0, 0)] * len(batch_shape)
+        x = np.pad(power, pad + [(self.pd, self.pd), (0, 0)], mode="wrap")
+        x = np.pad(x, pad + [(0, 0), (self.pr, self.pr)], mode="symmetric")
+
+        mask = np.ones((2 * self.pd + 1, 2 * self.pr + 1), dtype=bool)
+        mask[self.td:self.td + 2 * self.gd + 1,
+             self.tr:self.tr + 2 * self.gr + 1] = False
+
+        k = self.os_rank - 1
+        noise = np.empty(power.shape, dtype=np.float64)
+
+        for start in range(0, nc, self.block_rows):
+            stop = min(start + self.block_rows, nc)
+            rows = x[..., start:stop + 2 * self.pd, :]
+
+            # [..., rows, Ns, wd, wr] view → [..., rows, Ns, N_train] copy
+            windows = sliding_window_view(
+                rows, mask.shape, axis=(-2, -1)
+            )[..., mask]
+
+            noise[..., start:stop, :] = np.partition(windows, k, axis=-1)[..., k]
+
+        return noise
+
+    # ------------------------------------------------------------------
+    # Detection
+    # ------------------------------------------------------------------
+
+    def detect(self, rdm, range_axis, velocity_axis):
+        """
+        Run CFAR and return a compact detection list.
+
+        Parameters
+        ----------
+        rdm : ndarray [Nc, Ns] or [F, Nc, Ns]
+            Magnitude map(s) from RDMPipeline
+        range_axis : ndarray [Ns]
+        velocity_axis : ndarray [Nc]
+
+        Returns
+        -------
+        detections : structured ndarray [D] (DETECTION_DTYPE)
+            frame, doppler_bin, range_bin, range, velocity, snr_db
+        """
+        rdm = np.asarray(rdm)
+        if rdm.ndim == 2:
+            rdm = rdm[None]
+
+        power = np.abs(rdm)**2
+        noise = self.noise_level(power)
+
+        # No noise estimate (no training cells, or an all-zero
+        # neighbourhood): no detection
+        hits = (power > self.scale * noise) & (noise > 0)
+        frame, d_idx, r_idx = np.nonzero(hits)
+
+        det = np.empty(frame.shape[0], dtype=DETECTION_DTYPE)
+        det["frame"] = frame
+        det["doppler_bin"] = d_idx
+        det["range_bin"] = r_idx
+        det["range"] = np.asarray(range_axis)[r_idx]
+        det["velocity"] = np.asarray(velocity_axis)[d_idx]
+        det["snr_db"] = 10 * np.log10(
+            power[frame, d_idx, r_idx] / noise[frame, d_idx, r_idx]
+        )
+
+        return det
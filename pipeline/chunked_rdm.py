@@ -0,0 +1,287 @@
+import os
+import tempfile
+
+import numpy as np
+
+from radar.adc import PackedIQ
+
+
+class ChunkedRDMPipeline:
+    """
+    Out-of-core range-Doppler processing under a memory ceiling.
+
+    Frames too large for RDMPipeline.run ([..., Nc, Ns] with thousands
+    of chirps and samples per virtual channel) are processed in two
+    passes over a scratch cube of range spectra:
+
+        1. push(): range FFT of each block of chirps as it is captured,
+           written transposed into scratch [..., N_range, Nc]
+           (blocked transpose: one [N_range x chirps] tile per block)
+        2. finish(): Doppler FFT over contiguous blocks of range bins
+           of the scratch, transposed back into the [..., Nc, N_range]
+           output
+
+    Block sizes are chosen so the working buffers (plus the scratch,
+    when it is kept in memory) stay below max_bytes. The scratch goes
+    to a memory-mapped file when it does not fit. The output array
+    itself is not counted: pass out= (e.g. an np.memmap) for outputs
+    larger than memory.
+
+    Windows, FFT backend, rfft mode and axes are those of the
+    pipeline, and the output matches RDMPipeline.run / process on the
+    whole frame.
+
+    Parameters
+    ----------
+    pipeline : RDMPipeline
+    max_bytes : int
+        Memory ceiling for working buffers and in-memory scratch
+    leading_shape : tuple
+        Extra axes of each frame, e.g. (N_virt,) for [N_virt, Nc, Ns]
+    scratch : str
+        "auto" (memory if it fits, else disk), "memory" or "disk"
+    scratch_dir : str or None
+        Directory of the scratch file (default: system temp dir)
+
+    Example
+    -------
+        cp = ChunkedRDMPipeline(pipe, max_bytes=2**30, leading_shape=(16,))
+        for block in capture:            # [16, chirps, Ns]
+            cp.push(block)
+        rdm, range_axis, velocity_axis = cp.finish(out=rdm_memmap)
+    """
+
+    # Frame-sized temporaries per chirp / range bin in each pass
+    # (windowed input, FFT output, shifted or magnitude copy)
+    _PASS_COPIES = 3
+
+    def __init__(self, pipeline, max_bytes=256 * 2**20, leading_shape=(),
+                 scratch="auto", scratch_dir=None):
+        if scratch not in ("auto", "memory", "disk"):
+            raise ValueError(
+                f"Unknown scratch '{scratch}'. "
+                f"Choose 'auto', 'memory' or 'disk'."
+            )
+
+        self.pipeline = pipeline
+        self.Nc = pipeline.Nc
+        self.Ns = pipeline.Ns
+        self.fft = pipeline.fft
+        self.observer = pipeline.observer
+        self.max_bytes = int(max_bytes)
+        self.leading_shape = tuple(leading_shape)
+        self.scratch_mode = scratch
+        self.scratch_dir = scratch_dir
+
+        self.num_leading = int(np.prod(self.leading_shape, dtype=np.int64))
+
+        self.num_chirps = 0
+        self._scratch = None
+        self._scratch_path = None
+        self.range_axis = None
+
+    # ------------------------------------------------------------------
+    # Scratch and block sizes
+    # ------------------------------------------------------------------
+
+    def _allocate(self, num_range, dtype):
+        """
+        Scratch cube [..., num_range, Nc] and block sizes for both passes.
+        """
+        itemsize = np.dtype(dtype).itemsize
+        scratch_bytes = self.num_leading * num_range * self.Nc * itemsize
+
+        per_chirp = self._PASS_COPIES * self.num_leading * self.Ns * itemsize
+        per_bin = self._PASS_COPIES * self.num_leading * self.Nc * itemsize
+        unit = max(per_chirp, per_bin)
+
+        in_memory = self.scratch_mode == "memory" or (
+            self.scratch_mode == "auto"
+            and scratch_bytes + unit <= self.max_bytes
+        )
+
+        budget = self.max_bytes - (scratch_bytes if in_memory else 0)
+        if budget < unit:
+            raise ValueError(
+                f"max_bytes={self.max_bytes} is too small: one chirp or range "
+                f"bin needs {unit} bytes"
+                + (f" on top of {scratch_bytes} bytes of scratch." if in_memory
+                   else ".")
+            )
+
+        self.chirp_block = int(min(self.Nc, budget // per_chirp))
+        self.range_block = int(min(num_range, budget // per_bin))
+
+        shape = self.leading_shape + (num_range, self.Nc)
+        if in_memory:
+            self._scratch = np.empty(shape, dtype=dtype)
+        else:
+            fd, self._scratch_path = tempfile.mkstemp(
+                suffix=".rdm_scratch", dir=self.scratch_dir
+            )
+            os.close(fd)
+            self._scratch = np.memmap(
+                self._scratch_path, dtype=dtype, mode="w+", shape=shape
+            )
+
+    @property
+    def on_disk(self):
+        return isinstance(self._scratch, np.memmap)
+
+    def close(self):
+        """
+        Release the scratch cube (and delete its file).
+        """
+        if self._scratch is not None:
+            if self.on_disk:
+                self._scratch._mmap.close()
+            self._scratch = None
+
+        if self._scratch_path is not None:
+            os.remove(self._scratch_path)
+            self._scratch_path = None
+
+        self.num_chirps = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Pass 1: range FFT per chirp block
+    # ------------------------------------------------------------------
+
+    def push(self, block):
+        """
+        Range-process the next block of consecutive chirps.
+
+        Parameters
+        ----------
+        block : ndarray or PackedIQ [..., chirps, Ns]
+        """
+        shape = block.shape
+        assert shape[:-2] == self.leading_shape and shape[-1] == self.Ns
+
+        count = shape[-2]
+        if self.num_chirps + count > self.Nc:
+            raise ValueError(
+                f"Frame has {self.Nc} chirps; got {self.num_chirps + count}."
+            )
+
+        # Until the scratch exists (spectrum size and dtype known from
+        # the first chirp), process a single chirp
+        start = 0
+        while start < count:
+            step = 1 if self._scratch is None else self.chirp_block
+            stop = min(start + step, count)
+            self._range_block(self._slice(block, start, stop))
+            start = stop
+
+    @staticmethod
+    def _slice(block, start, stop):
+        if isinstance(block, PackedIQ):
+            return PackedIQ(block.data[..., start:stop, :, :],
+                            block.scale, block.num_bits)
+        return block[..., start:stop, :]
+
+    def _range_block(self, block):
+        pipe = self.pipeline
+        c0 = self.num_chirps
+        c1 = c0 + block.shape[-2]
+        win = pipe.win_2d[c0:c1]
+
+        with self.observer.stage("chunked.range_fft") as st:
+            if isinstance(block, PackedIQ):
+                x = block.to_complex(pipe.dtype, weights=win)
+            else:
+                x = np.asarray(block) * win
+
+            if pipe.use_rfft and np.isrealobj(x):
+                spectrum = self.fft.rfft(x, axis=-1)
+                range_axis = pipe.range_axis_rfft
+            else:
+                spectrum = self.fft.fft(x, axis=-1)
+                range_axis = pipe.range_axis
+            st.output(spectrum)
+
+        if self._scratch is None:
+            self.range_axis = range_axis
+            self._allocate(spectrum.shape[-1], spectrum.dtype)
+
+        # Tile [..., N_range, chirps] of the transposed scratch
+        self._scratch[..., :, c0:c1] = np.swapaxes(spectrum, -1, -2)
+        self.num_chirps = c1
+
+    # ------------------------------------------------------------------
+    # Pass 2: Doppler FFT per range block
+    # ------------------------------------------------------------------
+
+    def finish(self, out=None, magnitude=True):
+        """
+        Doppler-process the scratch cube once all Nc chirps are pushed.
+
+        Parameters
+        ----------
+        out : ndarray or None
+            [..., Nc, N_range] destination (real for magnitude=True,
+            complex otherwise), e.g. an np.memmap
+        magnitude : bool
+            |rd| like RDMPipeline.run, or the complex cube like
+            RDMPipeline.process
+
+        Returns
+        -------
+        rdm : ndarray [..., Nc, N_range]
+        range_axis : ndarray [N_range]
+        velocity_axis : ndarray [Nc]
+        """
+        if self.num_chirps != self.Nc:
+            raise ValueError(
+                f"Only {self.num_chirps} of {self.Nc} chirps were pushed."
+            )
+
+        scratch = self._scratch
+        num_range = scratch.shape[-2]
+        shape = self.leading_shape + (self.Nc, num_range)
+
+        dtype = scratch.dtype
+        if magnitude:
+            dtype = np.finfo(dtype).dtype
+
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        elif out.shape != shape:
+            raise ValueError(f"out must have shape {shape}.")
+
+        for r0 in range(0, num_range, self.range_block):
+            r1 = min(r0 + self.range_block, num_range)
+
+            with self.observer.stage("chunked.doppler_fft") as st:
+                # Contiguous rows of the scratch  → [..., bins, Nc]
+                rd = self.fft.fftshift(
+                    self.fft.fft(np.asarray(scratch[..., r0:r1, :]), axis=-1),
+                    axes=-1
+                )
+                if magnitude:
+                    rd = np.abs(rd)
+                st.output(rd)
+
+            out[..., :, r0:r1] = np.swapaxes(rd, -1, -2)
+
+        self.close()
+
+        return out, self.range_axis, self.pipeline.velocity_axis
+
+    def run(self, beat, out=None, magnitude=True):
+        """
+        Process a whole (e.g. memory-mapped) frame [..., Nc, Ns] block
+        by block; same result as push() over all chirps + finish().
+        """
+        assert beat.shape[-2:] == (self.Nc, self.Ns)
+
+        self.close()
+        self.push(beat)
+
+        return self.finish(out=out, magnitude=magnitude)
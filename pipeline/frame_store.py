@@ -0,0 +1,347 @@
+import json
+import os
+from dataclasses import fields, is_dataclass
+
+import numpy as np
+
+from config.radar_config import RadarConfig
+from radar.adc import PackedIQ
+
+
+HEADER_FILE = "header.json"
+FRAMES_FILE = "frames.bin"
+TRUTH_FILE = "ground_truth.jsonl"
+
+FORMAT_VERSION = 1
+
+
+def _radar_to_dict(cfg: RadarConfig):
+    """
+    Primary (init) fields only; derived fields are recomputed on load.
+    """
+    return {
+        f.name: (
+            _radar_to_dict(getattr(cfg, f.name))
+            if is_dataclass(getattr(cfg, f.name))
+            else getattr(cfg, f.name)
+        )
+        for f in fields(cfg) if f.init
+    }
+
+
+def _to_json(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+class FrameStoreWriter:
+    """
+    Append-only on-disk ADC cube store.
+
+    Layout (directory):
+        header.json         RadarConfig, dtype, frame shape, frame count
+        frames.bin          raw C-order frames, memory-mapped
+        ground_truth.jsonl  one JSON record per frame (scene state)
+
+    frames.bin grows in chunks of chunk_frames frames, so appending
+    does not rewrite existing data. Frames may be [Nc, Ns] or
+    [Nrx, Nc, Ns]; all frames of a store share one shape and dtype.
+
+    Integer ADC frames (PackedIQ, ADC(output="int")) are stored as
+    their interleaved int16 / int8 codes: pass packed=(scale, num_bits)
+    and the integer dtype, or build the writer with like(). The LSB
+    scale and bit count go to header.json.
+
+    An existing store at path is not replaced unless overwrite=True
+    (FileExistsError otherwise).
+    """
+
+    def __init__(self, path, radar_cfg: RadarConfig, frame_shape,
+                 dtype=np.complex128, chunk_frames=256, packed=None,
+                 overwrite=False):
+        """
+        Parameters
+        ----------
+        frame_shape : tuple
+            Complex sample shape of one frame
+        dtype : numpy dtype
+            Sample dtype (integer code dtype when packed)
+        packed : (float, int) or None
+            (scale, num_bits) of PackedIQ frames
+        overwrite : bool
+            Truncate an existing store at path
+        """
+        self.path = path
+        self.radar_cfg = radar_cfg
+        self.frame_shape = tuple(int(n) for n in frame_shape)
+        self.dtype = np.dtype(dtype)
+        self.chunk_frames = int(chunk_frames)
+
+        if self.chunk_frames <= 0:
+            raise ValueError("chunk_frames must be positive.")
+
+        self.packed = None
+        self.storage_shape = self.frame_shape
+        if packed is not None:
+            if self.dtype not in (np.dtype(np.int8), np.dtype(np.int16)):
+                raise ValueError("Packed frames need an int8 or int16 dtype.")
+            scale, num_bits = packed
+            self.packed = (float(scale), int(num_bits))
+            self.storage_shape = self.frame_shape + (2,)
+
+        if not overwrite and any(
+            os.path.exists(os.path.join(path, name))
+            for name in (HEADER_FILE, FRAMES_FILE)
+        ):
+            raise FileExistsError(
+                f"{path} already holds a frame store; "
+                f"pass overwrite=True to replace it."
+            )
+
+        os.makedirs(path, exist_ok=True)
+
+        self.frame_bytes = (
+            int(np.prod(self.storage_shape)) * self.dtype.itemsize
+        )
+        self.num_frames = 0
+        self.capacity = 0
+        self._mm = None
+
+        # Start empty
+        open(os.path.join(path, FRAMES_FILE), "wb").close()
+        self._truth = open(os.path.join(path, TRUTH_FILE), "w")
+
+        self._write_header()
+
+    @classmethod
+    def like(cls, path, radar_cfg: RadarConfig, cube, chunk_frames=256,
+             overwrite=False):
+        """
+        Writer for frames shaped and typed like cube (ndarray or PackedIQ).
+        """
+        if isinstance(cube, PackedIQ):
+            return cls(path, radar_cfg, cube.shape, dtype=cube.data.dtype,
+                       chunk_frames=chunk_frames,
+                       packed=(cube.scale, cube.num_bits),
+                       overwrite=overwrite)
+        return cls(path, radar_cfg, cube.shape, dtype=cube.dtype,
+                   chunk_frames=chunk_frames, overwrite=overwrite)
+
+    def _grow(self):
+        if self._mm is not None:
+            self._mm.flush()
+            del self._mm
+
+        self.capacity += self.chunk_frames
+
+        with open(os.path.join(self.path, FRAMES_FILE), "r+b") as f:
+            f.truncate(self.capacity * self.frame_bytes)
+
+        self._mm = np.memmap(
+            os.path.join(self.path, FRAMES_FILE),
+            dtype=self.dtype,
+            mode="r+",
+            shape=(self.capacity,) + self.storage_shape,
+        )
+
+    def append(self, cube, ground_truth=None, timestamp=None):
+        """
+        Append one frame.
+
+        Parameters
+        ----------
+        cube : ndarray or PackedIQ (frame_shape)
+        ground_truth : dict of arrays, list of dict or None
+            Scene state for this frame (Scenario.snapshot())
+        timestamp : float or None
+        """
+        if cube.shape != self.frame_shape:
+            raise ValueError(
+                f"Frame shape {cube.shape} does not match store "
+                f"shape {self.frame_shape}."
+            )
+
+        if self.packed is not None:
+            if not isinstance(cube, PackedIQ):
+                raise ValueError("Store holds PackedIQ frames.")
+            if (cube.scale, cube.num_bits) != self.packed:
+                raise ValueError(
+                    f"PackedIQ scale / bits ({cube.scale}, {cube.num_bits}) "
+                    f"do not match the store {self.packed}."
+                )
+            cube = cube.data
+        elif isinstance(cube, PackedIQ):
+            raise ValueError(
+                "PackedIQ frames need a packed store (see "
+                "FrameStoreWriter.like)."
+            )
+
+        if self.num_frames == self.capacity:
+            self._grow()
+
+        self._mm[self.num_frames] = cube
+
+        record = {"frame": self.num_frames, "timestamp": timestamp,
+                  "targets": ground_truth}
+        self._truth.write(json.dumps(record, default=_to_json) + "\n")
+
+        self.num_frames += 1
+
+    def extend(self, frames):
+        """
+        Append frames from SimulationRunner.stream().
+        """
+        for frame in frames:
+            self.append(
+                frame.adc_cube,
+                ground_truth=frame.ground_truth,
+                timestamp=frame.timestamp
+            )
+
+    def _write_header(self):
+        header = {
+            "version": FORMAT_VERSION,
+            "radar": _radar_to_dict(self.radar_cfg),
+            "dtype": self.dtype.str,
+            "frame_shape": list(self.frame_shape),
+            "num_frames": self.num_frames,
+            "packed": (
+                None if self.packed is None
+                else {"scale": self.packed[0], "num_bits": self.packed[1]}
+            ),
+        }
+
+        tmp = os.path.join(self.path, HEADER_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(header, f, indent=2, default=_to_json)
+        os.replace(tmp, os.path.join(self.path, HEADER_FILE))
+
+    def flush(self):
+        """
+        Make all appended frames visible to readers.
+        """
+        if self._mm is not None:
+            self._mm.flush()
+        self._truth.flush()
+        self._write_header()
+
+    def close(self):
+        """
+        Flush and trim unused chunk capacity.
+        """
+        if self._mm is not None:
+            self._mm.flush()
+            del self._mm
+            self._mm = None
+
+        with open(os.path.join(self.path, FRAMES_FILE), "r+b") as f:
+            f.truncate(self.num_frames * self.frame_bytes)
+
+        self.capacity = self.num_frames
+        self._truth.close()
+        self._write_header()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class FrameStoreReader:
+    """
+    Zero-copy reader for a frame store.
+
+    Indexing returns read-only memmap views into frames.bin; nothing is
+    read until the data is touched, and pages are served by the OS
+    cache. Views can be passed directly to RDMPipeline.run (single
+    frame) or RDMPipeline.run_batch (slice of frames). Packed stores
+    return PackedIQ views of the stored codes; frames holds the raw
+    [N, ..., Ns, 2] integer array.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+        with open(os.path.join(path, HEADER_FILE)) as f:
+            self.header = json.load(f)
+
+        if self.header["version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported frame store version {self.header['version']}."
+            )
+
+        self.dtype = np.dtype(self.header["dtype"])
+        self.frame_shape = tuple(self.header["frame_shape"])
+        self.num_frames = self.header["num_frames"]
+
+        # Stores written before packed frames existed have no entry
+        self.packed = None
+        storage_shape = self.frame_shape
+        packed = self.header.get("packed")
+        if packed is not None:
+            self.packed = (float(packed["scale"]), int(packed["num_bits"]))
+            storage_shape = self.frame_shape + (2,)
+
+        if self.num_frames > 0:
+            self.frames = np.memmap(
+                os.path.join(path, FRAMES_FILE),
+                dtype=self.dtype,
+                mode="r",
+                shape=(self.num_frames,) + storage_shape,
+            )
+        else:
+            self.frames = np.empty((0,) + storage_shape, dtype=self.dtype)
+
+        self._truth_offsets = None
+
+    def radar_config(self):
+        """
+        Rebuild the RadarConfig the frames were recorded with.
+        """
+        return RadarConfig(**self.header["radar"])
+
+    def __len__(self):
+        return self.num_frames
+
+    def _view(self, data):
+        if self.packed is None:
+            return data
+        return PackedIQ(data, *self.packed)
+
+    def __getitem__(self, index):
+        if self.packed is None:
+            return self.frames[index]
+        # Indexes the sample axes; the I/Q axis is kept
+        return self._view(self.frames)[index]
+
+    def batches(self, batch_size):
+        """
+        Yield consecutive [B, ...] views (last batch may be shorter).
+        """
+        for start in range(0, self.num_frames, batch_size):
+            yield self._view(self.frames[start:start + batch_size])
+
+    def ground_truth(self, index):
+        """
+        Ground-truth record of one frame:
+            {frame, timestamp, targets}
+        """
+        if self._truth_offsets is None:
+            self._index_truth()
+
+        with open(os.path.join(self.path, TRUTH_FILE), "rb") as f:
+            f.seek(self._truth_offsets[index])
+            return json.loads(f.readline())
+
+    def _index_truth(self):
+        offsets = []
+        pos = 0
+        with open(os.path.join(self.path, TRUTH_FILE), "rb") as f:
+            for line in f:
+                offsets.append(pos)
+                pos += len(line)
+        self._truth_offsets = np.asarray(offsets[:self.num_frames], dtype=np.int64)
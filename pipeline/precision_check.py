@@ -0,0 +1,62 @@
+from dataclasses import replace
+
+import numpy as np
+
+from .simulation_runner import SimulationRunner
+
+
+def compare_precision(cfg, targets, num_frames=1, frame_time=0.05):
+    """
+    Accuracy of the single-precision chain against double precision.
+
+    Both chains run noise-free on the same scene, so the difference is
+    purely numerical (float32 storage, float32 FFTs and occasional
+    ADC code flips at quantization boundaries).
+
+    Parameters
+    ----------
+    cfg : RadarConfig
+    targets : list of config.target_config.Target
+    num_frames : int
+    frame_time : float
+
+    Returns
+    -------
+    dict
+        adc_max_error_lsb : worst ADC sample error in LSBs
+        rdm_rel_error : max |rdm32 - rdm64| / max |rdm64|
+        rdm_error_db : rdm_rel_error in dB (relative to the RDM peak)
+        peak_match : RDM peak cell identical in every frame
+    """
+    runners = [
+        SimulationRunner(
+            replace(cfg, precision=precision), targets,
+            frame_time=frame_time, enable_noise=False
+        )
+        for precision in ("double", "single")
+    ]
+
+    lsb = 1.0 / (2**runners[0].sensor.adc.num_bits - 1)
+
+    adc_err = 0.0
+    rdm_err = 0.0
+    peak_match = True
+
+    streams = [r.stream(num_frames=num_frames) for r in runners]
+    for f64, f32 in zip(*streams):
+        adc_err = max(
+            adc_err,
+            float(np.max(np.abs(f32.adc_cube - f64.adc_cube))) / lsb
+        )
+
+        peak = np.max(f64.rdm)
+        rdm_err = max(rdm_err, float(np.max(np.abs(f32.rdm - f64.rdm)) / peak))
+
+        peak_match &= np.argmax(f32.rdm) == np.argmax(f64.rdm)
+
+    return {
+        "adc_max_error_lsb": adc_err,
+        "rdm_rel_error": rdm_err,
+        "rdm_error_db": float(20 * np.log10(rdm_err + 1e-300)),
+        "peak_match": bool(peak_match),
+    }
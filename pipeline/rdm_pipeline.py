@@ -1,11 +1,15 @@
 import numpy as np
 
 from dsp.core.window import hann_window
-from dsp.range_processing.range_fft import range_fft
-from dsp.doppler_processing.doppler_fft import doppler_fft
 from dsp.doppler_processing.velocity_axis import VelocityAxis
 from dsp.range_processing.range_axis import RangeAxis
 
+from radar.adc import PackedIQ
+
+from utils.fft_backend import get_fft_backend
+from utils.instrumentation import NULL_OBSERVER
+from utils.workspace import resolve_workspace
+
 
 class RDMPipeline:
     """
@@ -20,15 +24,56 @@ class RDMPipeline:
     rdm : ndarray [Nc, Ns] (magnitude)
     range_axis : ndarray [Ns]
     velocity_axis : ndarray [Nc]
+
+    FFTs run through a pluggable backend (utils.fft_backend).
+    With use_rfft=True and real-valued input, the range FFT keeps only
+    the non-negative beat frequencies: rdm is [Nc, Ns//2 + 1].
+
+    dtype sets the processing precision: with complex64 the windows are
+    float32, so single-precision input stays single precision end to end
+    (numpy >= 2 or scipy backend).
+
+    chirp_interval is the slow-time sampling period of the velocity axis
+    (defaults to chirp_duration; N_tx x chirp_duration for TDM-MIMO).
+
+    Integer ADC output (radar.adc.PackedIQ) is accepted wherever an
+    array is: codes are scaled, windowed and converted to dtype in one
+    pass, so no full-precision copy of the cube is made first.
+
+    observer (utils.instrumentation) records the stages
+        rdm.window, rdm.range_fft, rdm.doppler_fft, rdm.magnitude
+
+    Workspace mode (workspace=True or a shared utils.workspace.Workspace)
+    runs every stage into preallocated buffers (FFTs write through
+    out=; for even Nc the Doppler fftshift is folded into the window as
+    a (-1)^m modulation). Returned rdm / rd arrays are then views of
+    the workspace, valid until the next call.
+
+    plan (config.simulation_plan.SimulationPlan) supplies the windows
+    and axes instead of computing them; the other arguments must match
+    the plan (ValueError otherwise). See from_plan().
     """
 
-    def __init__(self, fc, bandwidth, chirp_duration, num_chirps, num_samples, fs):
+    def __init__(self, fc, bandwidth, chirp_duration, num_chirps, num_samples, fs,
+                 fft_backend=None, use_rfft=False, dtype=np.complex128,
+                 chirp_interval=None, observer=None, workspace=None,
+                 plan=None):
         self.fc = fc
         self.B = bandwidth
         self.Tc = chirp_duration
         self.Nc = num_chirps
         self.Ns = num_samples
         self.fs = fs
+        self.chirp_interval = (
+            chirp_duration if chirp_interval is None else chirp_interval
+        )
+
+        self.fft = get_fft_backend(fft_backend)
+        self.use_rfft = use_rfft
+        self.observer = NULL_OBSERVER if observer is None else observer
+
+        self.dtype = np.dtype(dtype)
+        self.real_dtype = np.finfo(self.dtype).dtype
 
         # Axes helpers
         self.range_axis_gen = RangeAxis(
@@ -40,32 +85,252 @@ class RDMPipeline:
         )
         self.vel_axis_gen = VelocityAxis(
             fc=self.fc,
-            chirp_interval=self.Tc,
+            chirp_interval=self.chirp_interval,
             n_fft=self.Nc
         )
 
+        # Precomputed once: windows and axes never change per config
+        if plan is None:
+            self.win_r = np.asarray(hann_window(self.Ns), dtype=self.real_dtype)
+            self.win_d = np.asarray(hann_window(self.Nc), dtype=self.real_dtype)
+            self.win_2d = self.win_d[:, None] * self.win_r[None, :]
+
+            self.range_axis = self.range_axis_gen.generate(shift=False)
+            self.velocity_axis = self.vel_axis_gen.generate(shift=True)
+        else:
+            plan.check(
+                "RDMPipeline", fc=self.fc, bandwidth=self.B,
+                chirp_duration=self.Tc, num_chirps=self.Nc,
+                num_samples=self.Ns, fs=self.fs,
+                chirp_interval=self.chirp_interval
+            )
+            self.win_r = plan.table("win_range", (self.Ns,), self.real_dtype)
+            self.win_d = plan.table("win_doppler", (self.Nc,), self.real_dtype)
+            self.win_2d = plan.table(
+                "win_2d", (self.Nc, self.Ns), self.real_dtype
+            )
+
+            self.range_axis = plan.table("range_axis", (self.Ns,))
+            self.velocity_axis = plan.table("velocity_axis", (self.Nc,))
+
+        # Axes are shared between calls → read-only
+        self.range_axis.setflags(write=False)
+        self.velocity_axis.setflags(write=False)
+
+        # Range axis of the one-sided (rfft) range spectrum
+        self.range_axis_rfft = self.range_axis[:self.Ns // 2 + 1]
+
+        self.workspace = resolve_workspace(workspace, self.fft.empty)
+
+        if self.workspace is not None:
+            # FFT(x · (-1)^m) = fftshift(FFT(x)) along m for even Nc
+            self.shift_in_window = self.Nc % 2 == 0
+            win_d = self.win_d
+            if self.shift_in_window:
+                win_d = win_d * (1 - 2 * (np.arange(self.Nc) % 2))
+            self.win_2d_ws = (win_d[:, None] * self.win_r[None, :]).astype(
+                self.real_dtype
+            )
+            # Same window per I/Q pair: a zero-stride broadcast over the
+            # pair axis would make the ufunc buffer
+            self.win_iq_ws = np.repeat(self.win_2d_ws[..., None], 2, axis=-1)
+            self._packed_gain = (None, None)
+
+            # Single-frame buffers up front (sized from the config)
+            self.workspace.get("rdm.window", (self.Nc, self.Ns), self.dtype)
+            self.workspace.get("rdm.range", (self.Nc, self.Ns), self.dtype)
+            self.workspace.get("rdm.magnitude", (self.Nc, self.Ns),
+                               self.real_dtype)
+
+    @classmethod
+    def from_plan(cls, plan, **kwargs):
+        """
+        Pipeline for a compiled SimulationPlan (TDM chirp interval,
+        plan precision), sharing its windows and axes.
+
+        kwargs : fft_backend, use_rfft, observer, workspace
+        """
+        radar = plan.radar
+        return cls(
+            fc=radar.fc,
+            bandwidth=radar.bandwidth,
+            chirp_duration=radar.chirp_duration,
+            num_chirps=radar.num_chirps,
+            num_samples=radar.num_samples,
+            fs=radar.sampling_rate,
+            dtype=radar.complex_dtype,
+            chirp_interval=radar.chirp_duration * radar.antenna.num_tx,
+            plan=plan,
+            **kwargs
+        )
+
     def run(self, beat_matrix):
         """
         Full RDM processing.
         """
         assert beat_matrix.shape == (self.Nc, self.Ns)
 
-        # Windowing
-        win_r = hann_window(self.Ns)
-        win_d = hann_window(self.Nc)
+        rdm_c, range_axis = self.process(beat_matrix)
+
+        with self.observer.stage("rdm.magnitude") as st:
+            rdm = st.output(self._magnitude(rdm_c))
 
-        x = beat_matrix * win_r[None, :]
-        x = x * win_d[:, None]
+        return rdm, range_axis, self.velocity_axis
+
+    def run_batch(self, beat_stack):
+        """
+        Batched RDM processing over multiple frames.
+
+        Parameters
+        ----------
+        beat_stack : ndarray or PackedIQ [F, Nc, Ns]
+
+        Returns
+        -------
+        rdm : ndarray [F, Nc, Ns] (magnitude)
+        range_axis : ndarray [Ns]
+        velocity_axis : ndarray [Nc]
+        """
+        assert beat_stack.ndim == 3
+        assert beat_stack.shape[1:] == (self.Nc, self.Ns)
+
+        rdm_c, range_axis = self.process(beat_stack)
+
+        with self.observer.stage("rdm.magnitude") as st:
+            rdm = st.output(self._magnitude(rdm_c))
+
+        return rdm, range_axis, self.velocity_axis
+
+    def process(self, beat):
+        """
+        Complex range-Doppler cube for any leading dimensions.
+
+        Parameters
+        ----------
+        beat : ndarray or PackedIQ [..., Nc, Ns]
+            e.g. [Nc, Ns], [F, Nc, Ns], [N_virt, Nc, Ns], [F, N_virt, Nc, Ns]
+
+        Returns
+        -------
+        rd : complex ndarray [..., Nc, Ns] (Doppler axis shifted)
+        range_axis : ndarray
+        """
+        assert beat.shape[-2:] == (self.Nc, self.Ns)
+
+        if self.workspace is not None:
+            return self._process_into(beat)
+
+        obs = self.observer
+
+        # Windowing (single pass with the combined 2-D window)
+        with obs.stage("rdm.window") as st:
+            if isinstance(beat, PackedIQ):
+                x = beat.to_complex(self.dtype, weights=self.win_2d)
+            else:
+                x = beat * self.win_2d
+            st.output(x)
+
+        # Range FFT (fast time), then shifted Doppler FFT (slow time)
+        with obs.stage("rdm.range_fft") as st:
+            if self.use_rfft and np.isrealobj(x):
+                rng_fft = self.fft.rfft(x, axis=-1)
+                range_axis = self.range_axis_rfft
+            else:
+                rng_fft = self.fft.fft(x, axis=-1)
+                range_axis = self.range_axis
+            st.output(rng_fft)
+
+        with obs.stage("rdm.doppler_fft") as st:
+            rd = st.output(
+                self.fft.fftshift(self.fft.fft(rng_fft, axis=-2), axes=-2)
+            )
+
+        return rd, range_axis
+
+    def _magnitude(self, rd):
+        if self.workspace is None:
+            return np.abs(rd)
+
+        out = self.workspace.get("rdm.magnitude", rd.shape, self.real_dtype)
+        return np.abs(rd, out=out)
+
+    def _process_into(self, beat):
+        """
+        process() on workspace buffers (no frame-sized allocations).
+        """
+        obs = self.observer
+        ws = self.workspace
+        shape = beat.shape
+
+        real_input = (
+            self.use_rfft
+            and not isinstance(beat, PackedIQ)
+            and np.isrealobj(beat)
+        )
 
-        # Range FFT (along fast-time axis)
-        rng_fft = range_fft(x, axis=1, shift=False)
+        with obs.stage("rdm.window") as st:
+            if isinstance(beat, PackedIQ):
+                # LSB scale folded into the cached window
+                if self._packed_gain[0] != beat.scale:
+                    self._packed_gain = (
+                        beat.scale,
+                        self.win_iq_ws * self.real_dtype.type(beat.scale)
+                    )
+                x = ws.get("rdm.window", shape, self.dtype)
+                np.multiply(
+                    beat.data, self._packed_gain[1],
+                    out=x.view(self.real_dtype).reshape(beat.data.shape),
+                    dtype=self.real_dtype
+                )
+            elif real_input:
+                x = np.multiply(
+                    beat, self.win_2d_ws,
+                    out=ws.get("rdm.window_real", shape, self.real_dtype),
+                    casting="same_kind"
+                )
+            else:
+                x = ws.get("rdm.window", shape, self.dtype)
+                if beat.dtype == self.dtype and beat.flags.c_contiguous:
+                    # Real-by-real on the interleaved view (no casting
+                    # buffers, half the multiplies)
+                    pair_shape = shape + (2,)
+                    np.multiply(
+                        beat.view(self.real_dtype).reshape(pair_shape),
+                        self.win_iq_ws,
+                        out=x.view(self.real_dtype).reshape(pair_shape)
+                    )
+                else:
+                    np.multiply(beat, self.win_2d_ws, out=x,
+                                casting="same_kind")
+            st.output(x)
 
-        # Doppler FFT (along slow-time axis)
-        rdm_c = doppler_fft(rng_fft, axis=0, shift=True)
+        with obs.stage("rdm.range_fft") as st:
+            if real_input:
+                spec_shape = shape[:-1] + (self.Ns // 2 + 1,)
+                rng_fft = self.fft.rfft(
+                    x, axis=-1, out=ws.get("rdm.range", spec_shape, self.dtype)
+                )
+                range_axis = self.range_axis_rfft
+                doppler_out = ws.get("rdm.doppler", spec_shape, self.dtype)
+            else:
+                rng_fft = self.fft.fft(
+                    x, axis=-1, out=ws.get("rdm.range", shape, self.dtype)
+                )
+                range_axis = self.range_axis
+                doppler_out = x
+            st.output(rng_fft)
 
-        rdm = np.abs(rdm_c)
+        with obs.stage("rdm.doppler_fft") as st:
+            rd = self.fft.fft(rng_fft, axis=-2, out=doppler_out)
 
-        range_axis = self.range_axis_gen.generate(shift=False)
-        velocity_axis = self.vel_axis_gen.generate(shift=True)
+            if not self.shift_in_window:
+                # Odd Nc: shift into the (now free) range buffer
+                half = self.Nc // 2
+                rest = self.Nc - half
+                shifted = rng_fft
+                shifted[..., half:, :] = rd[..., :rest, :]
+                shifted[..., :half, :] = rd[..., rest:, :]
+                rd = shifted
+            st.output(rd)
 
-        return rdm, range_axis, velocity_axis
+        return rd, range_axis
@@ -0,0 +1,364 @@
+import asyncio
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+TimedFrame = namedtuple(
+    "TimedFrame",
+    ["tick", "release", "ready", "frame"],
+)
+TimedFrame.__doc__ = """
+Frame delivered by RealtimeScheduler.
+
+tick     : index of the frame_time slot the frame was released in
+release  : scheduled release time [s since scheduler start]
+ready    : time capture and RDM finished [s since scheduler start]
+frame    : pipeline.simulation_runner.Frame
+"""
+
+_DONE = object()
+
+
+class RealtimeMetrics:
+    """
+    Timing record of one RealtimeScheduler run.
+
+    All times in seconds; summary() and report() convert to ms.
+
+    Attributes
+    ----------
+    produced, delivered, dropped, skipped, deadline_misses : int
+        Frames computed, handed to the consumer, dropped by a full
+        queue, and frame slots skipped because the simulator ran
+        behind; frames finished after their deadline
+    start_lag : list of float
+        Actual start - scheduled release per produced frame (jitter)
+    processing : list of float
+        Capture + RDM time per produced frame
+    latency : list of float
+        Release → consumer done per delivered frame (end to end)
+    queue_depth : list of int
+        Queue length after each enqueue (backpressure)
+    """
+
+    def __init__(self, frame_time, deadline):
+        self.frame_time = frame_time
+        self.deadline = deadline
+        self.produced = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.deadline_misses = 0
+        self.wall_time = 0.0
+
+        self.start_lag = []
+        self.processing = []
+        self.latency = []
+        self.queue_depth = []
+
+    @staticmethod
+    def _stats(values, percentiles):
+        if not values:
+            return None
+
+        ms = np.asarray(values, dtype=np.float64) * 1e3
+        stats = {"mean_ms": float(ms.mean())}
+        for q, value in zip(percentiles, np.percentile(ms, percentiles)):
+            stats[f"p{q}_ms"] = float(value)
+        stats["max_ms"] = float(ms.max())
+        return stats
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """
+        Counters plus percentile statistics of start lag (jitter),
+        processing time and end-to-end latency.
+        """
+        achieved = (
+            self.produced / self.wall_time if self.wall_time > 0 else None
+        )
+
+        return {
+            "frame_time_ms": self.frame_time * 1e3,
+            "deadline_ms": self.deadline * 1e3,
+            "wall_time_s": self.wall_time,
+            "produced": self.produced,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "skipped": self.skipped,
+            "deadline_misses": self.deadline_misses,
+            "target_fps": 1.0 / self.frame_time,
+            "achieved_fps": achieved,
+            "jitter_std_ms": (
+                float(np.std(self.start_lag) * 1e3) if self.start_lag else None
+            ),
+            "start_lag": self._stats(self.start_lag, percentiles),
+            "processing": self._stats(self.processing, percentiles),
+            "latency": self._stats(self.latency, percentiles),
+            "max_queue_depth": max(self.queue_depth, default=0),
+        }
+
+    def report(self):
+        """
+        Text summary.
+        """
+        s = self.summary()
+
+        lines = [
+            f"frames: {s['produced']} produced, {s['delivered']} delivered, "
+            f"{s['dropped']} dropped, {s['skipped']} slots skipped",
+            f"deadline misses: {s['deadline_misses']} "
+            f"(deadline {s['deadline_ms']:.2f} ms)",
+            f"rate: {s['achieved_fps'] or 0:.2f} / {s['target_fps']:.2f} fps, "
+            f"max queue depth {s['max_queue_depth']}",
+            f"{'':<12}{'mean ms':>9}{'p50 ms':>9}{'p90 ms':>9}"
+            f"{'p99 ms':>9}{'max ms':>9}",
+        ]
+        for name in ("start_lag", "processing", "latency"):
+            st = s[name]
+            if st is None:
+                continue
+            lines.append(
+                f"{name:<12}{st['mean_ms']:>9.3f}{st['p50_ms']:>9.3f}"
+                f"{st['p90_ms']:>9.3f}{st['p99_ms']:>9.3f}{st['max_ms']:>9.3f}"
+            )
+
+        return "\n".join(lines)
+
+
+class RealtimeScheduler:
+    """
+    Runs a SimulationRunner against the wall clock (asyncio).
+
+    Frame k is released at start + k · frame_time. Capture, noise and
+    RDMPipeline run in an executor so the event loop stays free for
+    consumers (sockets, queues, other services). Finished frames go
+    through a bounded queue to the consumer.
+
+    Backpressure (on_full), when the consumer falls behind:
+        "drop_oldest" : discard the oldest queued frame (live sensor)
+        "drop_newest" : discard the new frame
+        "block"       : wait for space; the producer then falls behind
+
+    Overruns (on_overrun), when the producer is behind its schedule:
+        "skip"    : skip the missed frame slots and advance the scene by
+                    the same time, staying locked to the wall clock
+        "catchup" : release late frames back to back
+
+    Nothing is hidden: start lag (jitter), deadline misses, drops,
+    skipped slots and end-to-end latency are recorded in metrics.
+
+    Parameters
+    ----------
+    runner : SimulationRunner
+    queue_size : int
+        Frames buffered between producer and consumer
+    on_full : str
+    on_overrun : str
+    deadline : float or None
+        Release → ready budget per frame [s] (None → frame_time)
+    executor : concurrent.futures.Executor or None
+        None → one worker thread owned by the scheduler
+    compute_rdm : bool
+        Run RDMPipeline in the executor as well
+    copy_frames : bool or None
+        Copy frame arrays before queuing (None → only for workspace
+        runners, whose arrays are overwritten by the next frame)
+
+    Example
+    -------
+        scheduler = RealtimeScheduler(runner, queue_size=2)
+        async for item in scheduler.frames(num_frames=200):
+            await publish(item.frame.rdm)
+        print(scheduler.metrics.report())
+    """
+
+    FULL_POLICIES = ("drop_oldest", "drop_newest", "block")
+    OVERRUN_POLICIES = ("skip", "catchup")
+
+    def __init__(self, runner, queue_size=2, on_full="drop_oldest",
+                 on_overrun="skip", deadline=None, executor=None,
+                 compute_rdm=True, copy_frames=None):
+        if on_full not in self.FULL_POLICIES:
+            raise ValueError(
+                f"Unknown on_full '{on_full}'. "
+                f"Choose from {self.FULL_POLICIES}."
+            )
+        if on_overrun not in self.OVERRUN_POLICIES:
+            raise ValueError(
+                f"Unknown on_overrun '{on_overrun}'. "
+                f"Choose from {self.OVERRUN_POLICIES}."
+            )
+        if queue_size <= 0:
+            raise ValueError("queue_size must be positive.")
+
+        self.runner = runner
+        self.frame_time = runner.frame_time
+        self.queue_size = int(queue_size)
+        self.on_full = on_full
+        self.on_overrun = on_overrun
+        self.deadline = self.frame_time if deadline is None else deadline
+        self.executor = executor
+        self.compute_rdm = compute_rdm
+        self.copy_frames = (
+            runner.workspace is not None if copy_frames is None
+            else copy_frames
+        )
+
+        self.metrics = RealtimeMetrics(self.frame_time, self.deadline)
+        self._stopping = False
+
+    def stop(self):
+        """
+        Stop releasing frames; queued frames are still delivered.
+        """
+        self._stopping = True
+
+    @staticmethod
+    def _copy(frame):
+        return frame._replace(
+            adc_cube=np.copy(frame.adc_cube),
+            rdm=None if frame.rdm is None else np.copy(frame.rdm),
+        )
+
+    async def _enqueue(self, queue, item):
+        m = self.metrics
+
+        if self.on_full == "block":
+            await queue.put(item)
+        elif not queue.full():
+            queue.put_nowait(item)
+        elif self.on_full == "drop_oldest":
+            queue.get_nowait()
+            queue.put_nowait(item)
+            m.dropped += 1
+        else:
+            m.dropped += 1
+
+        m.queue_depth.append(queue.qsize())
+
+    async def _produce(self, queue, num_frames, executor):
+        loop = asyncio.get_running_loop()
+        m = self.metrics
+        ft = self.frame_time
+
+        stream = self.runner.stream(compute_rdm=self.compute_rdm)
+        tick = 0
+        cancelled = False
+
+        try:
+            while not self._stopping and (
+                num_frames is None or m.produced < num_frames
+            ):
+                release = self._t0 + tick * ft
+                now = loop.time()
+
+                if now < release:
+                    await asyncio.sleep(release - now)
+                elif self.on_overrun == "skip" and now - release >= ft:
+                    # Behind by whole slots: drop them, scene follows
+                    # the wall clock (the stream steps once itself)
+                    missed = int((now - release) // ft)
+                    for _ in range(missed):
+                        self.runner.scenario.step(ft)
+                    m.skipped += missed
+                    tick += missed
+                    continue
+
+                start = loop.time()
+                frame = await loop.run_in_executor(executor, next, stream)
+                ready = loop.time()
+
+                if self.copy_frames:
+                    frame = self._copy(frame)
+
+                m.produced += 1
+                m.start_lag.append(start - release)
+                m.processing.append(ready - start)
+                if ready - release > self.deadline:
+                    m.deadline_misses += 1
+
+                await self._enqueue(queue, TimedFrame(
+                    tick, release - self._t0, ready - self._t0, frame
+                ))
+                tick += 1
+
+        except asyncio.CancelledError:
+            # The executor may still be inside the stream: leave it
+            cancelled = True
+            raise
+
+        finally:
+            if not cancelled:
+                stream.close()
+                await queue.put(_DONE)
+
+    async def frames(self, num_frames=None):
+        """
+        Async iterator of TimedFrame at the frame_time cadence.
+
+        End-to-end latency of a frame is measured when the consumer
+        asks for the next one (release → consumer done).
+
+        Parameters
+        ----------
+        num_frames : int or None
+            Frames to produce (None → until stop())
+        """
+        loop = asyncio.get_running_loop()
+        m = self.metrics = RealtimeMetrics(self.frame_time, self.deadline)
+        self._stopping = False
+
+        executor = self.executor
+        owned = executor is None
+        if owned:
+            executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="radar-sim"
+            )
+
+        queue = asyncio.Queue(self.queue_size)
+        self._t0 = loop.time()
+        producer = asyncio.ensure_future(
+            self._produce(queue, num_frames, executor)
+        )
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+
+                m.delivered += 1
+                yield item
+                m.latency.append(loop.time() - self._t0 - item.release)
+
+            # Re-raise producer errors
+            await producer
+
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
+            m.wall_time = loop.time() - self._t0
+            if owned:
+                executor.shutdown(wait=False)
+
+    async def run(self, consumer, num_frames=None):
+        """
+        Feed every delivered frame to consumer (sync or async callable).
+
+        Returns
+        -------
+        RealtimeMetrics
+        """
+        async for item in self.frames(num_frames):
+            result = consumer(item)
+            if asyncio.iscoroutine(result):
+                await result
+
+        return self.metrics
@@ -0,0 +1,317 @@
+import numpy as np
+
+from pipeline.cfar import DETECTION_DTYPE
+from radar.adc import PackedIQ
+
+
+# CFAR detections + fractional bins and refined peak magnitude
+REFINED_DTYPE = np.dtype(DETECTION_DTYPE.descr + [
+    ("doppler_bin_fine", np.float64),
+    ("range_bin_fine", np.float64),
+    ("peak", np.float64),
+])
+
+
+def parabolic_offset(left, center, right):
+    """
+    Vertex of the parabola through three equally spaced samples.
+
+    Returns
+    -------
+    offset : ndarray
+        Peak position relative to the center sample, in samples,
+        clipped to [-0.5, 0.5]
+    """
+    left, center, right = np.broadcast_arrays(left, center, right)
+
+    denom = left - 2 * center + right
+    with np.errstate(divide="ignore", invalid="ignore"):
+        offset = np.where(denom < 0, 0.5 * (left - right) / denom, 0.0)
+
+    return np.clip(offset, -0.5, 0.5)
+
+
+def _interpolate(mag, axis, index, method):
+    """
+    Sub-sample offsets around index along axis of mag (batched over
+    the leading axis).
+
+    "parabolic" fits the magnitude, "gaussian" its logarithm (exact
+    for a Gaussian main lobe, close for Hann / Hamming).
+    """
+    n = mag.shape[axis]
+    rows = np.arange(mag.shape[0])
+
+    def take(i):
+        i = np.clip(i, 0, n - 1)
+        if axis == 1:
+            return mag[rows, i, index[1]]
+        return mag[rows, index[0], i]
+
+    i = index[axis - 1]
+    left, center, right = take(i - 1), take(i), take(i + 1)
+
+    if method == "gaussian":
+        tiny = np.finfo(np.float64).tiny
+        left, center, right = (np.log(np.maximum(v, tiny))
+                               for v in (left, center, right))
+
+    # Edge of the grid: no neighbour on one side → keep the sample
+    inside = (i > 0) & (i < n - 1)
+    return np.where(inside, parabolic_offset(left, center, right), 0.0)
+
+
+def _bins_to_axis(bins, axis):
+    """
+    Fractional bin → physical value on a uniform pipeline axis.
+    """
+    axis = np.asarray(axis)
+    return axis[0] + bins * (axis[1] - axis[0])
+
+
+def interpolate_peaks(rdm, detections, range_axis, velocity_axis,
+                      method="parabolic"):
+    """
+    Sub-bin refinement of detections on existing range-Doppler maps.
+
+    No extra transforms: three-point interpolation around each detected
+    cell along Doppler (circular) and range. Cheap, but biased for
+    peaks far from a bin centre; see ZoomRefiner for a finer grid.
+
+    Parameters
+    ----------
+    rdm : ndarray [Nc, Ns] or [F, Nc, Ns]
+        Magnitude map(s) the detections were made on
+    detections : structured ndarray [D] (DETECTION_DTYPE)
+    range_axis, velocity_axis : ndarray
+        Axes returned by RDMPipeline.run
+    method : str
+        "parabolic" or "gaussian"
+
+    Returns
+    -------
+    refined : structured ndarray [D] (REFINED_DTYPE)
+    """
+    if method not in ("parabolic", "gaussian"):
+        raise ValueError(
+            f"Unknown interpolation '{method}'. "
+            f"Choose 'parabolic' or 'gaussian'."
+        )
+
+    rdm = np.abs(np.asarray(rdm))
+    if rdm.ndim == 2:
+        rdm = rdm[None]
+    nc, ns = rdm.shape[-2:]
+
+    frame = detections["frame"]
+    d_idx = detections["doppler_bin"]
+    r_idx = detections["range_bin"]
+
+    # 3 x 3 neighbourhood per detection (Doppler wraps)  → [D, 3, 3]
+    offsets = np.arange(-1, 2)
+    rows = (d_idx[:, None] + offsets[None, :]) % nc
+    cols = np.clip(r_idx[:, None] + offsets[None, :], 0, ns - 1)
+    patch = rdm[frame[:, None, None], rows[:, :, None], cols[:, None, :]]
+
+    center = (np.ones_like(d_idx), np.ones_like(r_idx))
+    d_off = _interpolate(patch, 1, center, method)
+    r_off = _interpolate(patch, 2, center, method)
+
+    # No range neighbour beyond the map edges
+    r_off = np.where((r_idx > 0) & (r_idx < ns - 1), r_off, 0.0)
+
+    return _refined(detections, d_idx + d_off, r_idx + r_off,
+                    patch[:, 1, 1], range_axis, velocity_axis)
+
+
+def _refined(detections, d_fine, r_fine, peak, range_axis, velocity_axis):
+    refined = np.empty(detections.shape[0], dtype=REFINED_DTYPE)
+    for name in DETECTION_DTYPE.names:
+        refined[name] = detections[name]
+
+    refined["doppler_bin_fine"] = d_fine
+    refined["range_bin_fine"] = r_fine
+    refined["peak"] = peak
+    refined["range"] = _bins_to_axis(r_fine, range_axis)
+    refined["velocity"] = _bins_to_axis(d_fine, velocity_axis)
+
+    return refined
+
+
+class ZoomRefiner:
+    """
+    Fine range-Doppler estimates around detections (zoom DFT).
+
+    For every detection the windowed 2-D DFT of its frame is evaluated
+    on a small grid of fractional bins around the detected cell:
+
+        X(q, k) = Σ_m Σ_n w[m, n] x[m, n] e^{-j2π(q' m / Nc + k n / Ns)}
+
+    with q' = q - Nc // 2 the unshifted Doppler bin. The grid spans
+    ±span bins at 1/zoom bin spacing on both axes, and the grid maximum
+    is refined by three-point interpolation. The full-frame FFT size
+    is unchanged: cost per detection is O(Nc · Ns · L) with L the grid
+    points per axis, computed as one matmul per frame over all of its
+    detections.
+
+    Windows, axes and precision are those of the pipeline, so fine
+    bins map onto the same RangeAxis / VelocityAxis conventions
+    (range_axis starts at bin 0, velocity_axis is shifted).
+
+    Parameters
+    ----------
+    pipeline : RDMPipeline
+    zoom : int
+        Grid points per coarse bin
+    span : float
+        Half-width of the grid in coarse bins
+    interpolation : str or None
+        "parabolic", "gaussian" (log-parabolic) or None (grid maximum)
+    """
+
+    def __init__(self, pipeline, zoom=8, span=1.0, interpolation="parabolic"):
+        if zoom < 1:
+            raise ValueError("zoom must be at least 1.")
+        if span <= 0:
+            raise ValueError("span must be positive.")
+        if interpolation not in ("parabolic", "gaussian", None):
+            raise ValueError(
+                f"Unknown interpolation '{interpolation}'. "
+                f"Choose 'parabolic', 'gaussian' or None."
+            )
+
+        self.pipeline = pipeline
+        self.Nc = pipeline.Nc
+        self.Ns = pipeline.Ns
+        self.zoom = int(zoom)
+        self.span = float(span)
+        self.interpolation = interpolation
+        self.dtype = pipeline.dtype
+
+        # Fine grid offsets in coarse bins  → [L]
+        half = int(np.ceil(self.span * self.zoom))
+        self.grid = np.arange(-half, half + 1) / self.zoom
+
+        self._m = np.arange(self.Nc)
+        self._n = np.arange(self.Ns)
+
+    def _windowed(self, beat, f):
+        """
+        Windowed frame f of beat  → [Nc, Ns]
+        """
+        win = self.pipeline.win_2d
+        frame = beat if beat.ndim == 2 else beat[f]
+
+        if isinstance(frame, PackedIQ):
+            return frame.to_complex(self.dtype, weights=win)
+        return (frame * win).astype(self.dtype, copy=False)
+
+    def zoom_spectra(self, beat, detections):
+        """
+        Fine-grid complex spectra around each detection.
+
+        Parameters
+        ----------
+        beat : ndarray or PackedIQ [Nc, Ns] or [F, Nc, Ns]
+            Beat frames the detections were made from
+        detections : structured ndarray [D] (DETECTION_DTYPE)
+
+        Returns
+        -------
+        spectra : complex ndarray [D, L, L] (Doppler, range)
+        doppler_bins, range_bins : ndarray [D, L]
+            Fractional bins of the grid (Doppler shifted)
+        """
+        assert beat.shape[-2:] == (self.Nc, self.Ns)
+
+        num = detections.shape[0]
+        size = self.grid.shape[0]
+
+        doppler_bins = detections["doppler_bin"][:, None] + self.grid[None, :]
+        range_bins = detections["range_bin"][:, None] + self.grid[None, :]
+
+        spectra = np.empty((num, size, size), dtype=self.dtype)
+
+        frames = detections["frame"]
+        for f in np.unique(frames):
+            sel = np.flatnonzero(frames == f)
+            x = self._windowed(beat, f)
+
+            # Range kernels of every detection in the frame  → [Ns, d·L]
+            k = range_bins[sel].reshape(-1)
+            e_r = np.exp(
+                -2j * np.pi * np.outer(self._n, k) / self.Ns
+            ).astype(self.dtype)
+
+            # [Nc, d·L] → [d, Nc, L]
+            y = (x @ e_r).reshape(self.Nc, sel.size, size).transpose(1, 0, 2)
+
+            # Doppler kernels  → [d, L, Nc]
+            q = doppler_bins[sel] - self.Nc // 2
+            e_d = np.exp(
+                -2j * np.pi * q[:, :, None] * self._m[None, None, :] / self.Nc
+            ).astype(self.dtype)
+
+            spectra[sel] = e_d @ y
+
+        return spectra, doppler_bins, range_bins
+
+    def refine(self, beat, detections, multichannel=False):
+        """
+        Refined range and velocity for each detection.
+
+        Parameters
+        ----------
+        beat : ndarray or PackedIQ [Nc, Ns] or [F, Nc, Ns]
+            or [N_virt, Nc, Ns] with multichannel=True
+        detections : structured ndarray [D] (DETECTION_DTYPE)
+        multichannel : bool
+            beat is one frame of virtual channels: the grid is refined
+            on the channel-summed power (non-coherent integration, as
+            for SimulationRunner's multi-channel RDM)
+
+        Returns
+        -------
+        refined : structured ndarray [D] (REFINED_DTYPE)
+            range / velocity replaced by the refined values; fractional
+            bins and the refined peak magnitude added
+        """
+        pipe = self.pipeline
+        range_axis = pipe.range_axis
+        velocity_axis = pipe.velocity_axis
+
+        if detections.shape[0] == 0:
+            return _refined(detections, np.zeros(0), np.zeros(0),
+                            np.zeros(0), range_axis, velocity_axis)
+
+        if multichannel:
+            power = 0.0
+            for channel in range(beat.shape[0]):
+                spectra, doppler_bins, range_bins = self.zoom_spectra(
+                    beat[channel], detections
+                )
+                power = power + np.abs(spectra).astype(np.float64)**2
+            mag = np.sqrt(power)
+        else:
+            spectra, doppler_bins, range_bins = self.zoom_spectra(
+                beat, detections
+            )
+            mag = np.abs(spectra).astype(np.float64)
+
+        num, size = mag.shape[:2]
+        best = np.argmax(mag.reshape(num, -1), axis=1)
+        i_d, i_r = np.unravel_index(best, (size, size))
+
+        d_off = np.zeros(num)
+        r_off = np.zeros(num)
+        if self.interpolation is not None:
+            d_off = _interpolate(mag, 1, (i_d, i_r), self.interpolation)
+            r_off = _interpolate(mag, 2, (i_d, i_r), self.interpolation)
+
+        rows = np.arange(num)
+        step = 1.0 / self.zoom
+        d_fine = doppler_bins[rows, i_d] + d_off * step
+        r_fine = range_bins[rows, i_r] + r_off * step
+
+        return _refined(detections, d_fine, r_fine, mag[rows, i_d, i_r],
+                        range_axis, velocity_axis)
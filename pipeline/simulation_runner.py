@@ -1,13 +1,16 @@
-from dataclasses import dataclass
+import warnings
+from collections import namedtuple
 from typing import List
 
-# from .signal_generator import SignalGenerator, Target
+import numpy as np
+
 from radar.radar_sensor import RadarSensor
-from radar.waveform import FMCWWaveform
-from radar.channel import RadarChannel
-from radar.mixer import Mixer
+from radar.beat_model import AnalyticBeatModel
 from radar.adc import ADC
 
+from baseband.noise import BasebandNoise
+
+from scene.scenario import Scenario
 
 from .rdm_pipeline import RDMPipeline
 
@@ -15,38 +18,109 @@ from config.radar_config import RadarConfig
 from config.target_config import Target, TargetScenario
 from config.simulation_config import SimulationConfig
 
+from utils.instrumentation import NULL_OBSERVER
+from utils.workspace import resolve_workspace
+
+
+Frame = namedtuple(
+    "Frame",
+    ["frame_index", "timestamp", "adc_cube", "rdm", "ground_truth"],
+)
 
 
 class SimulationRunner:
     """
     Orchestrates:
         Targets -> Beat Signal -> RDM
+
+    Frames are produced one at a time by stream(); every stage after
+    capture is optional so consumers only pay for what they use.
+
+    With a multi-channel antenna config the ADC cube is
+    [N_virt, Nc, Ns] and rdm is the non-coherent sum over channels.
     """
 
-    def __init__(self, cfg: RadarConfig, targets: List[Target]):
+    def __init__(self, cfg: RadarConfig, targets: List[Target],
+                 frame_time=0.05, enable_noise=True, enable_clutter=False,
+                 sensor=None, seed=None, observer=None, workspace=None,
+                 plan=None):
+        """
+        Parameters
+        ----------
+        cfg : RadarConfig
+        targets : list of config.target_config.Target
+        frame_time : float
+            Scene time step between frames [s]
+        enable_noise : bool
+            Add AWGN at cfg.snr_db (skipped if snr_db is None)
+        enable_clutter : bool
+            Add clutter floor
+        sensor : RadarSensor or None
+            None → analytic beat-synthesis sensor built from cfg, with
+            an ADC sized to the scene (default_adc).
+            Noise and clutter are added to its analog beat signal,
+            before the ADC
+        seed : None, int, SeedSequence or Generator
+            Seed of the noise stream
+        observer : utils.instrumentation observer or None
+            Per-stage profiling (sensor, noise, RDM); events are tagged
+            with the frame index
+        workspace : bool or utils.workspace.Workspace
+            Preallocated frame buffers shared by the default sensor,
+            the noise stage and the RDM pipeline. adc_cube and rdm of
+            a yielded Frame are then overwritten by the next frame.
+        plan : config.simulation_plan.SimulationPlan or None
+            Compiled tables shared by the default sensor and the RDM
+            pipeline; cfg must match plan.radar (see from_plan)
+        """
         self.cfg = cfg
         self.targets = targets
+        self.frame_time = frame_time
+        self.observer = NULL_OBSERVER if observer is None else observer
+        self.workspace = resolve_workspace(workspace)
 
-        # self.generator = SignalGenerator(
-        #     fc=cfg.fc,
-        #     bandwidth=cfg.bandwidth,
-        #     chirp_duration=cfg.chirp_duration,
-        #     num_chirps=cfg.num_chirps,
-        #     num_samples=cfg.num_samples,
-        #     fs=cfg.sampling_rate,
-        #     targets=targets,
-        #     snr_db=cfg.snr_db
-        # )
+        if plan is not None:
+            plan.check("SimulationRunner", radar=cfg)
 
-        # 2. Radar 구성
-        waveform = FMCWWaveform(...)
-        channel = RadarChannel(...)
-        mixer = Mixer(...)
-        adc = ADC(...)
+        # 1. Scene
+        self.scenario = Scenario.from_config(TargetScenario(list(targets)))
+
+        antenna = cfg.antenna if cfg.antenna.num_virtual > 1 else None
 
-        sensor = RadarSensor(waveform, channel, mixer, adc)
-        noise = AWGN(snr_db=20)
+        # 2. Radar 구성
+        if sensor is None:
+            synthesizer = AnalyticBeatModel(
+                fc=cfg.fc,
+                bandwidth=cfg.bandwidth,
+                chirp_duration=cfg.chirp_duration,
+                num_chirps=cfg.num_chirps,
+                num_samples=cfg.num_samples,
+                fs=cfg.sampling_rate,
+                dtype=cfg.complex_dtype,
+                antenna=antenna,
+                plan=plan,
+                workspace=self.workspace
+            )
+            sensor = RadarSensor.analytic(
+                synthesizer,
+                self.default_adc(
+                    [t.rcs for t in targets],
+                    snr_db=cfg.snr_db if enable_noise else None,
+                    clutter=enable_clutter
+                ),
+                observer=observer,
+                workspace=self.workspace
+            )
+        self.sensor = sensor
+        self._clipped = getattr(sensor.adc, "clipped", 0)
+        self._clip_warned = False
 
+        # 3. Baseband impairments
+        self.noise = None
+        if (enable_noise and cfg.snr_db is not None) or enable_clutter:
+            self.noise = BasebandNoise(snr_db=cfg.snr_db, rng=seed)
+        self.enable_noise = enable_noise and cfg.snr_db is not None
+        self.enable_clutter = enable_clutter
 
         self.rdm_pipeline = RDMPipeline(
             fc=cfg.fc,
@@ -54,9 +128,192 @@ class SimulationRunner:
             chirp_duration=cfg.chirp_duration,
             num_chirps=cfg.num_chirps,
             num_samples=cfg.num_samples,
-            fs=cfg.sampling_rate
+            fs=cfg.sampling_rate,
+            dtype=cfg.complex_dtype,
+            chirp_interval=cfg.chirp_duration * cfg.antenna.num_tx,
+            observer=observer,
+            workspace=self.workspace,
+            plan=plan
+        )
+
+    @staticmethod
+    def default_adc(amplitudes, snr_db=None, clutter=False, headroom=5.0):
+        """
+        ADC whose full scale fits the scene.
+
+        The analytic beat is a sum of unit tones scaled by the target
+        amplitudes, so |I|, |Q| ≤ Σ|rcs| per channel. Noise and clutter
+        are relative to the signal power (≤ (Σ|rcs|)^2) and get
+        headroom standard deviations per I / Q component on top.
+
+        Parameters
+        ----------
+        amplitudes : array_like [K]
+            Target amplitudes (rcs)
+        snr_db : float or None
+            AWGN SNR (None → no noise)
+        clutter : bool
+            Clutter floor enabled
+        headroom : float
+            Noise standard deviations above the signal peak
+        """
+        peak = float(np.sum(np.abs(amplitudes)))
+        if peak == 0:
+            return ADC()
+
+        relative_power = 0.0
+        if snr_db is not None:
+            relative_power += 10**(-snr_db / 10)
+        if clutter:
+            relative_power += 10**(-40 / 10)       # BasebandNoise default
+
+        sigma = peak * np.sqrt(relative_power / 2)
+        return ADC(v_ref=peak + headroom * sigma)
+
+    @classmethod
+    def from_config(cls, sim_cfg: SimulationConfig, sensor=None, seed=None,
+                    observer=None, workspace=None):
+        """
+        Build a runner from a top-level SimulationConfig.
+        """
+        return cls(
+            sim_cfg.radar,
+            sim_cfg.scenario.targets,
+            frame_time=sim_cfg.frame_time,
+            enable_noise=sim_cfg.enable_noise,
+            enable_clutter=sim_cfg.enable_clutter,
+            sensor=sensor,
+            seed=seed,
+            observer=observer,
+            workspace=workspace
+        )
+
+    @classmethod
+    def from_plan(cls, plan, sensor=None, seed=None, observer=None,
+                  workspace=None):
+        """
+        Build a runner from a compiled SimulationPlan
+        (SimulationConfig.compile() or SimulationPlan.load()): no
+        validation or table construction at startup.
+        """
+        sim_cfg = plan.config
+        return cls(
+            sim_cfg.radar,
+            sim_cfg.scenario.targets,
+            frame_time=sim_cfg.frame_time,
+            enable_noise=sim_cfg.enable_noise,
+            enable_clutter=sim_cfg.enable_clutter,
+            sensor=sensor,
+            seed=seed,
+            observer=observer,
+            workspace=workspace,
+            plan=plan
         )
 
+    def stream(self, num_frames=None, compute_rdm=True, add_noise=True):
+        """
+        Lazily generate frames.
+
+        Each iteration captures one frame at the current scene time,
+        yields it, then advances the scene by frame_time. Nothing is
+        retained between frames, so memory is constant in the number
+        of frames. In workspace mode the frame arrays are reused: copy
+        them to keep them past the next iteration.
+
+        Parameters
+        ----------
+        num_frames : int or None
+            None → infinite stream
+        compute_rdm : bool
+            Run RDMPipeline (rdm is None otherwise)
+        add_noise : bool
+            Apply enabled noise / clutter stages (to the beat signal,
+            before the ADC)
+
+        Yields
+        ------
+        Frame
+            (frame_index, timestamp, adc_cube, rdm, ground_truth)
+            ground_truth is a snapshot of the scene arrays
+            {range, velocity, rcs, phase, angle}, each [K]
+        """
+        frame_index = 0
+        obs = self.observer
+
+        while num_frames is None or frame_index < num_frames:
+            timestamp = self.scenario.time
+            ground_truth = self.scenario.snapshot()
+
+            obs.set_frame(frame_index)
+
+            with obs.stage("runner.frame"):
+                impair = None
+                if add_noise and self.noise is not None:
+                    impair = self._impair
+                adc_cube = self.sensor.capture(ground_truth, impair=impair)
+                self._check_clipping(frame_index)
+
+                rdm = None
+                if compute_rdm:
+                    rdm = self._rdm(adc_cube)
+
+            yield Frame(frame_index, timestamp, adc_cube, rdm, ground_truth)
+
+            self.scenario.step(self.frame_time)
+            frame_index += 1
+
+    def _check_clipping(self, frame_index):
+        """
+        Warn (once per runner) when the ADC starts clipping.
+        """
+        clipped = getattr(self.sensor.adc, "clipped", 0)
+        if clipped > self._clipped:
+            if not self._clip_warned:
+                adc = self.sensor.adc
+                warnings.warn(
+                    f"ADC clipped {clipped - self._clipped} I/Q values in "
+                    f"frame {frame_index} (v_ref={adc.v_ref:g}); see "
+                    f"sensor.adc.clip_fraction.",
+                    RuntimeWarning,
+                    stacklevel=3
+                )
+                self._clip_warned = True
+            self._clipped = clipped
+
+    def _impair(self, beat):
+        """
+        Noise / clutter on the analog beat signal (before the ADC).
+        """
+        # In place on workspace frames
+        out = beat if self.workspace is not None else None
+        with self.observer.stage("runner.noise") as st:
+            if self.enable_noise:
+                beat = self.noise.awgn(beat, out=out)
+            if self.enable_clutter:
+                beat = self.noise.clutter_floor(beat, out=out)
+            st.output(beat)
+        return beat
+
+    def _rdm(self, adc_cube):
+        if adc_cube.ndim == 2:
+            rdm, _, _ = self.rdm_pipeline.run(adc_cube)
+            return rdm
+
+        # Multi-channel: non-coherent integration over virtual channels
+        rd, _ = self.rdm_pipeline.process(adc_cube)
+        if self.workspace is None:
+            return np.sqrt(np.sum(np.abs(rd)**2, axis=0))
+
+        power = self.workspace.get(
+            "runner.channel_power", rd.shape, self.rdm_pipeline.real_dtype
+        )
+        rdm = self.workspace.get(
+            "runner.rdm", rd.shape[1:], self.rdm_pipeline.real_dtype
+        )
+        np.abs(rd, out=power)
+        power *= power
+        return np.sqrt(np.sum(power, axis=0, out=rdm), out=rdm)
+
     def run(self):
         """
         Returns
@@ -65,6 +322,9 @@ class SimulationRunner:
         range_axis : ndarray
         velocity_axis : ndarray
         """
-        beat = self.generator.generate()
-        rdm, r_axis, v_axis = self.rdm_pipeline.run(beat)
-        return rdm, r_axis, v_axis
+        frame = next(self.stream(num_frames=1))
+        return (
+            frame.rdm,
+            self.rdm_pipeline.range_axis,
+            self.rdm_pipeline.velocity_axis
+        )
@@ -0,0 +1,249 @@
+import numpy as np
+
+from radar.adc import PackedIQ
+
+
+def _cosine_sum_terms(window, max_terms=4, tol=1e-10):
+    """
+    Express a window as a cosine sum  w[j] = Σ_c a_c cos(2π c j / P).
+
+    Tries the periodic (P = N) and symmetric (P = N - 1) forms, which
+    cover Hann, Hamming, Blackman and Blackman-Harris.
+
+    Returns
+    -------
+    list of (amplitude, frequency offset [cycles/chirp]) or None
+        w[j] = Σ amplitude · exp(+j2π offset j)
+    """
+    window = np.asarray(window, dtype=np.float64)
+    n = window.shape[0]
+    j = np.arange(n)
+
+    for period in (n, n - 1):
+        if period < 2:
+            continue
+
+        basis = np.cos(
+            2 * np.pi * np.arange(max_terms)[None, :] * j[:, None] / period
+        )
+        coefs, *_ = np.linalg.lstsq(basis, window, rcond=None)
+
+        residual = np.max(np.abs(basis @ coefs - window))
+        if residual > tol * np.max(np.abs(window)):
+            continue
+
+        terms = [(coefs[0], 0.0)]
+        for c in range(1, max_terms):
+            if abs(coefs[c]) > tol:
+                terms.append((coefs[c] / 2, c / period))
+                terms.append((coefs[c] / 2, -c / period))
+        return terms
+
+    return None
+
+
+class SlidingDopplerProcessor:
+    """
+    Chirp-by-chirp range-Doppler processing.
+
+    Each pushed chirp is range-FFT'd immediately and enters a sliding
+    window of the last Nc chirps. The windowed Doppler DFT of that
+    window is kept as a bank of sliding DFTs per range bin:
+
+        G_p(ν) = Σ_j r[p-Nc+1+j] e^{-j2πνj}
+        G_p(ν) = (G_{p-1}(ν) - r_old) e^{j2πν} + r_new e^{-j2πν(Nc-1)}
+
+    A cosine-sum Doppler window (Hann, Hamming, Blackman …, periodic
+    or symmetric) is a sum of complex exponentials, so the windowed DFT
+    is a weighted sum of sliding DFTs at shifted frequencies: one
+    update costs O(terms x Nc x Ns) instead of a 2-D FFT. Other windows
+    fall back to a Doppler FFT of the chirp history per update.
+
+    The recursion state is rebuilt directly from the chirp history
+    every `resync` chirps (default Nc, i.e. on frame boundaries), which
+    bounds round-off drift and makes frame-boundary outputs equal to
+    RDMPipeline.run on that frame (to FFT round-off).
+
+    Chirps follow the pipeline's input handling: PackedIQ chirps are
+    unpacked with the range window folded in, and with
+    pipeline.use_rfft the range FFT is an rfft (Ns // 2 + 1 bins), so
+    chirps must then be real-valued.
+
+    Parameters
+    ----------
+    pipeline : RDMPipeline
+        Source of windows, axes, FFT backend and dtype
+    leading_shape : tuple
+        Extra axes of each chirp, e.g. (N_virt,) for [N_virt, Ns]
+    resync : int or None
+        Chirps between exact state rebuilds (None → Nc)
+    """
+
+    def __init__(self, pipeline, leading_shape=(), resync=None):
+        self.pipeline = pipeline
+        self.Nc = pipeline.Nc
+        self.Ns = pipeline.Ns
+        self.fft = pipeline.fft
+        self.dtype = pipeline.dtype
+        self.leading_shape = tuple(leading_shape)
+        self.resync = self.Nc if resync is None else int(resync)
+
+        if self.resync <= 0:
+            raise ValueError("resync must be positive.")
+
+        self.win_r = pipeline.win_r
+        self.win_d = np.asarray(pipeline.win_d, dtype=np.float64)
+
+        # rfft mode keeps only the non-negative range bins
+        self.use_rfft = pipeline.use_rfft
+        if self.use_rfft:
+            self.num_range = self.Ns // 2 + 1
+            self.range_axis = pipeline.range_axis_rfft
+        else:
+            self.num_range = self.Ns
+            self.range_axis = pipeline.range_axis
+
+        # History of range spectra, ring buffer along the chirp axis
+        # (complex128 for the recursion)  → [*leading, Nc, N_range]
+        self.history = np.zeros(
+            self.leading_shape + (self.Nc, self.num_range),
+            dtype=np.complex128
+        )
+        self.num_chirps = 0
+        self._pos = 0
+
+        terms = _cosine_sum_terms(self.win_d)
+        self.recursive = terms is not None
+
+        if self.recursive:
+            amps = np.array([a for a, _ in terms])
+            offsets = np.array([f for _, f in terms])
+
+            # Term t, Doppler bin q: ν = q / Nc - offset_t  → [T, Nc]
+            # (bins already in fftshift order)
+            bins = np.fft.fftshift(np.arange(self.Nc))
+            nu = bins[None, :] / self.Nc - offsets[:, None]
+
+            # [T, *leading(1), Nc, 1]
+            lead = (1,) * len(self.leading_shape)
+            bank = (len(terms),) + lead + (self.Nc, 1)
+
+            self._amps = amps
+            self._rotate = np.exp(2j * np.pi * nu).reshape(bank)
+            self._enter = np.exp(
+                -2j * np.pi * nu * (self.Nc - 1)
+            ).reshape(bank)
+
+            # Direct DFT for resync  → [T * Nc(q), Nc(j)]
+            self._direct = np.exp(
+                -2j * np.pi * nu[:, :, None] * np.arange(self.Nc)[None, None, :]
+            ).reshape(len(terms) * self.Nc, self.Nc)
+
+            self.state = np.zeros(
+                (len(terms),) + self.history.shape, dtype=np.complex128
+            )
+
+    @property
+    def ready(self):
+        """
+        True once a full window of Nc chirps has been pushed.
+        """
+        return self.num_chirps >= self.Nc
+
+    def reset(self):
+        self.history[...] = 0
+        self.num_chirps = 0
+        self._pos = 0
+        if self.recursive:
+            self.state[...] = 0
+
+    def _ordered_history(self):
+        """
+        History oldest → newest  → [*leading, Nc, N_range]
+        """
+        return np.roll(self.history, -self._pos, axis=-2)
+
+    def _resync(self):
+        """
+        Rebuild the sliding-DFT state from the chirp history (one matmul).
+        """
+        direct = self._direct @ self._ordered_history()
+        direct = direct.reshape(
+            self.leading_shape + (-1, self.Nc, self.num_range)
+        )
+        self.state[...] = np.moveaxis(direct, -3, 0)
+
+    def push(self, chirp):
+        """
+        Add one chirp and return the updated range-Doppler estimate.
+
+        Before Nc chirps have arrived, missing chirps count as zeros.
+
+        Parameters
+        ----------
+        chirp : ndarray or PackedIQ [*leading, Ns]
+            Real-valued when pipeline.use_rfft is set
+
+        Returns
+        -------
+        rd : complex ndarray [*leading, Nc, N_range] (Doppler axis
+             shifted, same layout as RDMPipeline.process)
+        """
+        if not isinstance(chirp, PackedIQ):
+            chirp = np.asarray(chirp)
+
+        expected = self.leading_shape + (self.Ns,)
+        if chirp.shape != expected:
+            raise ValueError(
+                f"chirp shape {chirp.shape} does not match {expected}."
+            )
+
+        if self.use_rfft and (
+            isinstance(chirp, PackedIQ) or not np.isrealobj(chirp)
+        ):
+            raise ValueError(
+                "use_rfft pipelines need real-valued chirps; "
+                "build the pipeline with use_rfft=False for complex input."
+            )
+
+        # Range FFT right away (fast-time window)
+        if isinstance(chirp, PackedIQ):
+            x = chirp.to_complex(self.dtype, weights=self.win_r)
+        else:
+            x = chirp * self.win_r
+
+        if self.use_rfft:
+            spectrum = self.fft.rfft(x, axis=-1)
+        else:
+            spectrum = self.fft.fft(x, axis=-1)
+        spectrum = spectrum[..., None, :]
+
+        old = self.history[..., self._pos:self._pos + 1, :].copy()
+        self.history[..., self._pos:self._pos + 1, :] = spectrum
+        self._pos = (self._pos + 1) % self.Nc
+        self.num_chirps += 1
+
+        if not self.recursive:
+            rd = self.fft.fft(
+                self._ordered_history() * self.win_d[:, None], axis=-2
+            )
+            rd = np.fft.fftshift(rd, axes=-2)
+        else:
+            if self.num_chirps % self.resync == 0:
+                self._resync()
+            else:
+                self.state -= old
+                self.state *= self._rotate
+                self.state += self._enter * spectrum
+
+            rd = np.tensordot(self._amps, self.state, axes=1)
+
+        return rd.astype(self.dtype, copy=False)
+
+    def push_rdm(self, chirp):
+        """
+        push() returning (rdm, range_axis, velocity_axis) like
+        RDMPipeline.run.
+        """
+        rd = self.push(chirp)
+        return np.abs(rd), self.range_axis, self.pipeline.velocity_axis
@@ -0,0 +1,297 @@
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import Dict, List
+
+import numpy as np
+
+from config.simulation_config import SimulationConfig
+
+from .simulation_runner import SimulationRunner
+
+
+def expand_grid(base: SimulationConfig, grid):
+    """
+    Expand a parameter grid into SimulationConfig variants.
+
+    Parameters
+    ----------
+    base : SimulationConfig
+    grid : dict
+        Dotted attribute path → list of values, e.g.
+            {"radar.snr_db": [0, 10, 20],
+             "radar.num_chirps": [64, 128],
+             "scenario.targets": [layout_a, layout_b]}
+
+    Returns
+    -------
+    configs : list of SimulationConfig
+    points : list of dict
+        Grid point (path → value) for every config
+    """
+    keys = list(grid)
+    configs, points = [], []
+
+    for values in itertools.product(*(grid[k] for k in keys)):
+        point = dict(zip(keys, values))
+
+        cfg = base
+        for path, value in point.items():
+            cfg = _replace_path(cfg, path.split("."), value)
+
+        configs.append(cfg)
+        points.append(point)
+
+    return configs, points
+
+
+def _replace_path(obj, path, value):
+    """
+    dataclasses.replace along a dotted path (derived fields recomputed).
+    """
+    if len(path) == 1:
+        return replace(obj, **{path[0]: value})
+
+    child = getattr(obj, path[0])
+    return replace(obj, **{path[0]: _replace_path(child, path[1:], value)})
+
+
+def peak_metrics(frame, runner):
+    """
+    Default per-trial metrics from the RDM peak.
+
+    Compares the strongest RDM cell with the strongest (max rcs)
+    ground-truth target.
+
+    Returns
+    -------
+    dict of float
+        range_error, velocity_error, peak_snr_db
+    """
+    rdm = frame.rdm
+    d_idx, r_idx = np.unravel_index(np.argmax(rdm), rdm.shape)
+
+    truth = frame.ground_truth
+    k = np.argmax(truth["rcs"])
+
+    range_axis = runner.rdm_pipeline.range_axis
+    velocity_axis = runner.rdm_pipeline.velocity_axis
+
+    noise_floor = np.median(rdm) + 1e-12
+
+    return {
+        "range_error": float(range_axis[r_idx] - truth["range"][k]),
+        "velocity_error": float(velocity_axis[d_idx] - truth["velocity"][k]),
+        "peak_snr_db": float(20 * np.log10(rdm[d_idx, r_idx] / noise_floor)),
+    }
+
+
+class RunningStats:
+    """
+    Mergeable per-metric accumulator (count, sum, sum of squares, min, max).
+
+    Only these scalars cross process boundaries.
+    """
+
+    __slots__ = ("n", "total", "total_sq", "min", "max")
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def add(self, value):
+        self.n += 1
+        self.total += value
+        self.total_sq += value * value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        self.n += other.n
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def summary(self):
+        if self.n == 0:
+            return {"n": 0}
+
+        mean = self.total / self.n
+        var = max(self.total_sq / self.n - mean * mean, 0.0)
+
+        return {
+            "n": self.n,
+            "mean": mean,
+            "std": float(np.sqrt(var)),
+            "rms": float(np.sqrt(self.total_sq / self.n)),
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+def _run_chunk(config_index, sim_cfg, seeds, num_frames, metric_fn):
+    """
+    Worker entry point: run a chunk of trials for one config.
+
+    Returns
+    -------
+    config_index : int
+    stats : dict metric → RunningStats
+    """
+    stats = {}
+
+    for seed in seeds:
+        runner = SimulationRunner.from_config(sim_cfg, seed=seed)
+
+        for frame in runner.stream(num_frames=num_frames):
+            for name, value in metric_fn(frame, runner).items():
+                stats.setdefault(name, RunningStats()).add(value)
+
+    return config_index, stats
+
+
+@dataclass
+class SweepResult:
+    """
+    Aggregated sweep output.
+    """
+
+    configs: List[SimulationConfig]
+    points: List[dict]
+    stats: List[Dict[str, dict]]
+    num_trials: int
+    elapsed: float
+    trials_per_sec: float = field(init=False)
+
+    def __post_init__(self):
+        self.trials_per_sec = (
+            self.num_trials / self.elapsed if self.elapsed > 0 else float("inf")
+        )
+
+    def rows(self):
+        """
+        Flat records: grid point + metric summaries per config.
+        """
+        return [
+            {**point, **{f"{m}_{k}": v for m, s in stats.items() for k, v in s.items()}}
+            for point, stats in zip(self.points, self.stats)
+        ]
+
+
+class SweepEngine:
+    """
+    Monte Carlo / parameter sweep over SimulationConfig variants.
+
+    Trials are split into chunks and fanned out to a process pool.
+    Each trial gets its own SeedSequence child, so results are
+    reproducible for a given seed regardless of worker count or
+    scheduling order. Workers return only metric accumulators.
+
+    Parameters
+    ----------
+    metric_fn : callable(frame, runner) -> dict of float
+        Must be picklable (module-level function)
+    num_frames : int
+        Frames per trial
+    chunk_size : int
+        Trials per task
+    max_workers : int or None
+        Process count (None → os.cpu_count())
+    seed : int, SeedSequence or None
+        Root of all trial streams
+    """
+
+    def __init__(self, metric_fn=peak_metrics, num_frames=1, chunk_size=16,
+                 max_workers=None, seed=None, mp_context=None):
+        self.metric_fn = metric_fn
+        self.num_frames = num_frames
+        self.chunk_size = int(chunk_size)
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+
+        if isinstance(seed, np.random.SeedSequence):
+            self.seed_seq = seed
+        else:
+            self.seed_seq = np.random.SeedSequence(seed)
+
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+
+    def run(self, configs, num_trials, points=None, progress=None):
+        """
+        Run num_trials trials for every config.
+
+        Parameters
+        ----------
+        configs : list of SimulationConfig
+        num_trials : int
+            Trials per config
+        points : list of dict or None
+            Labels for each config (defaults to {"config": index})
+        progress : callable(done, total, trials_per_sec) or None
+
+        Returns
+        -------
+        SweepResult
+        """
+        configs = list(configs)
+        if points is None:
+            points = [{"config": i} for i in range(len(configs))]
+
+        # One child stream per config, one grandchild per trial
+        config_seeds = self.seed_seq.spawn(len(configs))
+
+        tasks = []
+        for ci, (cfg, cseed) in enumerate(zip(configs, config_seeds)):
+            trial_seeds = cseed.spawn(num_trials)
+            for start in range(0, num_trials, self.chunk_size):
+                chunk = trial_seeds[start:start + self.chunk_size]
+                tasks.append((ci, cfg, chunk))
+
+        merged = [{} for _ in configs]
+        total = len(configs) * num_trials
+        done = 0
+
+        t0 = time.perf_counter()
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=self.mp_context
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _run_chunk, ci, cfg, chunk, self.num_frames, self.metric_fn
+                ): len(chunk)
+                for ci, cfg, chunk in tasks
+            }
+
+            for fut in as_completed(futures):
+                ci, stats = fut.result()
+                for name, s in stats.items():
+                    merged[ci].setdefault(name, RunningStats()).merge(s)
+
+                done += futures[fut]
+                if progress is not None:
+                    elapsed = time.perf_counter() - t0
+                    progress(done, total, done / elapsed if elapsed > 0 else 0.0)
+
+        elapsed = time.perf_counter() - t0
+
+        return SweepResult(
+            configs=configs,
+            points=points,
+            stats=[{m: s.summary() for m, s in st.items()} for st in merged],
+            num_trials=total,
+            elapsed=elapsed,
+        )
+
+    def run_grid(self, base: SimulationConfig, grid, num_trials, progress=None):
+        """
+        Expand a parameter grid and run it.
+        """
+        configs, points = expand_grid(base, grid)
+        return self.run(configs, num_trials, points=points, progress=progress)
@@ -1,31 +1,197 @@
+from dataclasses import dataclass
+
 import numpy as np
 
 
+@dataclass(frozen=True)
+class PackedIQ:
+    """
+    Integer ADC samples with interleaved I/Q storage.
+
+    data[..., n, 0] = I code, data[..., n, 1] = Q code, so a C-ordered
+    array is laid out I0 Q0 I1 Q1 … (int16, or int8 for ≤ 8 bits):
+    4x (int16) or 8x (int8) smaller than complex128.
+
+    Attributes
+    ----------
+    data : int8 / int16 ndarray [..., Ns, 2]
+    scale : float
+        Volts per LSB (value = code * scale)
+    num_bits : int
+    """
+
+    data: np.ndarray
+    scale: float
+    num_bits: int
+
+    @property
+    def shape(self):
+        """Shape of the complex sample array."""
+        return self.data.shape[:-1]
+
+    @property
+    def ndim(self):
+        return self.data.ndim - 1
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def __getitem__(self, index):
+        """
+        Index the complex sample axes (e.g. one frame of a stack).
+        """
+        if not isinstance(index, tuple):
+            index = (index,)
+        return PackedIQ(self.data[index + (Ellipsis, slice(None))],
+                        self.scale, self.num_bits)
+
+    def to_complex(self, dtype=np.complex64, weights=None):
+        """
+        Convert to complex samples in one pass.
+
+        Parameters
+        ----------
+        dtype : complex64 or complex128
+        weights : real ndarray or None
+            Broadcastable to shape (e.g. a 2-D window); applied
+            together with the LSB scale, so windowing costs no extra
+            pass over the data
+
+        Returns
+        -------
+        complex ndarray (shape)
+        """
+        dtype = np.dtype(dtype)
+        real_dtype = np.finfo(dtype).dtype
+
+        gain = real_dtype.type(self.scale)
+        if weights is not None:
+            gain = (np.asarray(weights, dtype=real_dtype) * gain)[..., None]
+
+        out = np.empty(self.shape, dtype=dtype)
+        pairs = out.view(real_dtype).reshape(self.data.shape)
+        np.multiply(self.data, gain, out=pairs, dtype=real_dtype)
+
+        return out
+
+
 class ADC:
     """
     Analog-to-Digital Converter model.
 
     Includes:
         - sampling
-        - quantization
+        - quantization (I and Q clipped and quantized independently)
+
+    Output modes:
+        "float" : values rounded to the quantization grid, in the input
+                  precision
+        "int"   : signed num_bits integer codes in PackedIQ
+                  (full scale ±(2^(num_bits-1) - 1) = ±v_ref)
+
+    Clipping is counted, not hidden: clipped / samples count the I and
+    Q values beyond ±v_ref and all values converted so far
+    (clip_fraction is their ratio). Checking costs two reductions per
+    call; values are only counted when a frame actually clips.
     """
 
-    def __init__(self, num_bits=12, v_ref=1.0):
+    def __init__(self, num_bits=12, v_ref=1.0, output="float"):
         self.num_bits = num_bits
         self.v_ref = v_ref
+        self.output = output
 
-    def quantize(self, signal):
+        if output not in ("float", "int"):
+            raise ValueError(
+                f"Unknown ADC output '{output}'. Choose 'float' or 'int'."
+            )
+
+        if output == "int" and not 2 <= num_bits <= 16:
+            raise ValueError("Integer output supports 2 to 16 bits.")
+
+        if v_ref <= 0:
+            raise ValueError("v_ref must be positive.")
+
+        self.clipped = 0
+        self.samples = 0
+
+    @property
+    def clip_fraction(self):
+        return self.clipped / self.samples if self.samples else 0.0
+
+    def _count_clipping(self, parts, limit):
+        """
+        Count I / Q values of parts beyond ±limit.
+        """
+        self.samples += parts.size
+        if parts.size and (parts.max() > limit or parts.min() < -limit):
+            self.clipped += int(np.count_nonzero(np.abs(parts) > limit))
+
+    def quantize(self, signal, out=None):
         """
         Uniform quantization model.
+
+        Output keeps the input precision (complex64 stays complex64).
+
+        out : C-contiguous ndarray or None
+            Destination (may be signal itself)
         """
         max_level = 2**self.num_bits - 1
 
-        normalized = signal / self.v_ref
-        normalized = np.clip(normalized, -1, 1)
+        if out is None:
+            dtype = np.result_type(signal, np.float16)
+            out = np.empty(np.shape(signal), dtype=dtype)
+        elif not out.flags.c_contiguous:
+            raise ValueError("out must be C-contiguous.")
+
+        np.divide(signal, self.v_ref, out=out)
+
+        # I and Q clipped and rounded independently (interleaved view)
+        parts = out
+        if np.iscomplexobj(out):
+            parts = out.view(np.finfo(out.dtype).dtype)
+        self._count_clipping(parts, 1)
+        np.clip(parts, -1, 1, out=parts)
+        parts *= max_level
+        np.rint(parts, out=parts)
+        parts /= max_level
 
-        quantized = np.round(normalized * max_level) / max_level
-        return quantized
+        return out
 
-    def sample(self, analog_signal):
-        """ADC sampling + quantization."""
-        return self.quantize(analog_signal)
+    def quantize_int(self, signal):
+        """
+        Quantize I and Q to signed num_bits integer codes.
+
+        Returns
+        -------
+        PackedIQ
+            data int16 (int8 for num_bits ≤ 8) [..., Ns, 2]
+        """
+        full_scale = 2**(self.num_bits - 1) - 1
+        int_dtype = np.int8 if self.num_bits <= 8 else np.int16
+
+        signal = np.asarray(signal)
+        real_dtype = np.finfo(np.result_type(signal, np.float32)).dtype
+
+        iq = np.empty(signal.shape + (2,), dtype=real_dtype)
+        iq[..., 0] = signal.real
+        iq[..., 1] = signal.imag if np.iscomplexobj(signal) else 0
+
+        iq *= full_scale / self.v_ref
+        np.rint(iq, out=iq)
+        self._count_clipping(iq, full_scale)
+        np.clip(iq, -full_scale, full_scale, out=iq)
+
+        return PackedIQ(
+            iq.astype(int_dtype), self.v_ref / full_scale, self.num_bits
+        )
+
+    def sample(self, analog_signal, out=None):
+        """
+        ADC sampling + quantization.
+
+        out is used by the float output only (see quantize).
+        """
+        if self.output == "int":
+            return self.quantize_int(analog_signal)
+        return self.quantize(analog_signal, out=out)
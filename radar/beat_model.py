@@ -0,0 +1,298 @@
+import numpy as np
+
+from utils.workspace import resolve_workspace
+
+from .target import target_arrays, target_field
+
+
+class AnalyticBeatModel:
+    """
+    Closed-form dechirped (beat) signal synthesizer.
+
+    Produces the mixer output directly in baseband without
+    generating RF-rate waveforms:
+
+        beat(t) = A · exp(j2π (f_c τ(t) + S τ(t) t - S/2 τ(t)^2) + jφ)
+
+    where the round-trip delay follows the target motion
+
+        τ(t) = 2 (R + v (m T + t)) / c
+
+    with m the chirp index, T the chirp interval and t the fast time.
+    This matches the homodyne convention of Mixer (tx · conj(rx)).
+
+    range_migration=False uses the stop-and-hop approximation:
+    the beat frequency is fixed by the initial range and the motion
+    only contributes the Doppler phase.
+
+    With an AntennaConfig the output is a TDM-MIMO cube [N_virt, Nc, Ns]:
+    TX k fires in its TDM slot (chirp start (m N_tx + slot_k) T) and
+    virtual element (tx, rx) adds the phase exp(-j2π (x_tx + x_rx) sin θ).
+    Nc is then the number of chirp loops per virtual channel.
+
+    Phases are evaluated in float64; dtype sets the output precision.
+
+    plan (config.simulation_plan.SimulationPlan) supplies the fast and
+    slow time axes instead of computing them; the other arguments must
+    match the plan (ValueError otherwise). See from_plan().
+
+    workspace (True or a shared utils.workspace.Workspace) holds the
+    per-chunk delay / phase / tone buffers of the range-migration model,
+    which are then computed in place: after the first frame synthesis
+    allocates no frame-sized arrays.
+    """
+
+    C = 299792458.0
+
+    def __init__(self, fc, bandwidth, chirp_duration, num_chirps, num_samples,
+                 fs, chirp_interval=None, range_migration=True, chunk_size=16,
+                 dtype=np.complex128, antenna=None, plan=None,
+                 workspace=None):
+        self.fc = fc
+        self.B = bandwidth
+        self.Tc = chirp_duration
+        self.Nc = num_chirps
+        self.Ns = num_samples
+        self.fs = fs
+
+        self.slope = bandwidth / chirp_duration
+        self.chirp_interval = (
+            chirp_duration if chirp_interval is None else chirp_interval
+        )
+        self.range_migration = range_migration
+        self.chunk_size = int(chunk_size)
+        self.dtype = np.dtype(dtype)
+        self.antenna = antenna
+        self.workspace = resolve_workspace(workspace)
+
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+
+        # Geometry (1 x 1 at the origin without antenna config)
+        if antenna is None:
+            self.num_tx, self.num_rx = 1, 1
+            self.tx_pos = np.zeros(1)
+            self.rx_pos = np.zeros(1)
+            tx_slots = np.zeros(1)
+        else:
+            self.num_tx, self.num_rx = antenna.num_tx, antenna.num_rx
+            self.tx_pos = antenna.tx_positions()
+            self.rx_pos = antenna.rx_positions()
+            tx_slots = antenna.tx_slots()
+
+        # Output of synthesize: [Nc, Ns] or [N_virt, Nc, Ns]
+        if antenna is None:
+            self.frame_shape = (self.Nc, self.Ns)
+        else:
+            self.frame_shape = (self.num_tx * self.num_rx, self.Nc, self.Ns)
+
+        if plan is None:
+            self.t_fast = np.arange(self.Ns) / self.fs
+
+            # Chirp start time per TX and loop  → [N_tx, Nc]
+            self.t_slow = (
+                np.arange(self.Nc)[None, :] * self.num_tx + tx_slots[:, None]
+            ) * self.chirp_interval
+        else:
+            plan.check(
+                "AnalyticBeatModel", fc=self.fc, bandwidth=self.B,
+                chirp_duration=self.Tc, num_chirps=self.Nc,
+                num_samples=self.Ns, fs=self.fs,
+                chirp_period=self.chirp_interval, tx_slots=tx_slots
+            )
+            self.t_fast = plan.table("t_fast", (self.Ns,))
+            self.t_slow = plan.table("t_slow", (self.num_tx, self.Nc))
+
+        # Built on first use by the range-migration model
+        self._t_total = None
+        self._f_inst = None
+
+    @classmethod
+    def from_plan(cls, plan, **kwargs):
+        """
+        Synthesizer for a compiled SimulationPlan, sharing its time axes.
+
+        kwargs : range_migration, chunk_size, workspace
+        """
+        radar = plan.radar
+        antenna = radar.antenna if radar.antenna.num_virtual > 1 else None
+        return cls(
+            fc=radar.fc,
+            bandwidth=radar.bandwidth,
+            chirp_duration=radar.chirp_duration,
+            num_chirps=radar.num_chirps,
+            num_samples=radar.num_samples,
+            fs=radar.sampling_rate,
+            dtype=radar.complex_dtype,
+            antenna=antenna,
+            plan=plan,
+            **kwargs
+        )
+
+    def synthesize(self, target_states, out=None):
+        """
+        Synthesize the beat matrix for one frame.
+
+        Parameters
+        ----------
+        target_states : list of dict or mapping of arrays
+            {range, velocity, rcs[, phase, angle]}
+        out : complex ndarray (frame_shape) or None
+
+        Returns
+        -------
+        beat : complex ndarray [Nc, Ns] (or [N_virt, Nc, Ns] with antenna)
+        """
+        ranges, velocities, rcs = target_arrays(target_states)
+        phases = target_field(target_states, "phase", default=0.0)
+        angles = target_field(target_states, "angle", default=0.0)
+
+        return self.synthesize_arrays(
+            ranges, velocities, rcs, phases, angles, out=out
+        )
+
+    def synthesize_arrays(self, ranges, velocities, amplitudes, phases=None,
+                          angles=None, out=None):
+        """
+        Vectorized synthesis from target parameter arrays.
+
+        Parameters
+        ----------
+        ranges : ndarray [K]
+            Initial ranges [m]
+        velocities : ndarray [K]
+            Radial velocities [m/s]
+        amplitudes : ndarray [K]
+        phases : ndarray [K] or None
+            Initial phase [rad]
+        angles : ndarray [K] or None
+            Azimuth [rad] (used with an antenna config)
+        out : C-contiguous complex ndarray (frame_shape) or None
+            Destination of the beat signal
+
+        Returns
+        -------
+        beat : complex ndarray [Nc, Ns] (or [N_virt, Nc, Ns] with antenna)
+        """
+        ranges = np.atleast_1d(np.asarray(ranges, dtype=np.float64))
+        velocities = np.atleast_1d(np.asarray(velocities, dtype=np.float64))
+        amplitudes = np.atleast_1d(np.asarray(amplitudes))
+
+        gain = amplitudes.astype(np.complex128)
+        if phases is not None:
+            gain = gain * np.exp(1j * np.asarray(phases, dtype=np.float64))
+
+        if angles is None:
+            sin_theta = np.zeros_like(ranges)
+        else:
+            sin_theta = np.sin(np.asarray(angles, dtype=np.float64))
+
+        if out is None:
+            out = np.empty(self.frame_shape, dtype=self.dtype)
+        elif out.shape != self.frame_shape or not out.flags.c_contiguous:
+            raise ValueError(
+                f"out must be a C-contiguous array of shape {self.frame_shape}."
+            )
+
+        beat = out.reshape(self.num_tx, self.num_rx, self.Nc, self.Ns)
+        beat[...] = 0
+
+        for start in range(0, ranges.shape[0], self.chunk_size):
+            block = slice(start, start + self.chunk_size)
+
+            # Per-element steering  → [K, N_tx], [K, N_rx]
+            tx_steer = np.exp(-2j * np.pi * sin_theta[block, None] * self.tx_pos)
+            rx_steer = np.exp(-2j * np.pi * sin_theta[block, None] * self.rx_pos)
+            tx_steer *= gain[block, None]
+
+            if self.range_migration:
+                self._migrating_block(
+                    ranges[block], velocities[block], tx_steer, rx_steer, beat
+                )
+            else:
+                beat += self._stop_and_hop_block(
+                    ranges[block], velocities[block], tx_steer, rx_steer
+                )
+
+        return out
+
+    def _buffer(self, name, shape, dtype):
+        """
+        Chunk buffer from the workspace (fresh array without one).
+        """
+        if self.workspace is None:
+            return np.empty(shape, dtype=dtype)
+        return self.workspace.get("beat." + name, shape, dtype)
+
+    def _migrating_block(self, ranges, velocities, tx_steer, rx_steer, beat):
+        """
+        Exact delay model: fused phase over [K, N_tx, Nc, Ns], added to
+        beat [N_tx, N_rx, Nc, Ns].
+
+        All [K, N_tx, Nc, Ns] arrays live in chunk_size-sized buffers and
+        are computed in place (views [:K] for the last, shorter chunk).
+        """
+        if self._t_total is None:
+            # Time since frame start and instantaneous TX frequency
+            self._t_total = (
+                self.t_slow[:, :, None] + self.t_fast[None, None, :]
+            )
+            self._f_inst = self.fc + self.slope * self.t_fast
+
+        num = ranges.shape[0]
+        shape = (self.chunk_size, self.num_tx, self.Nc, self.Ns)
+        real_dtype = np.finfo(self.dtype).dtype
+
+        tau = self._buffer("tau", shape, np.float64)[:num]
+        cycles = self._buffer("cycles", shape, np.float64)[:num]
+        tone = self._buffer("tone", shape, self.dtype)[:num]
+
+        # τ = 2 (R + v t) / c
+        np.multiply(velocities[:, None, None, None], self._t_total[None],
+                    out=tau)
+        tau += ranges[:, None, None, None]
+        tau *= 2 / self.C
+
+        # Phase in cycles: τ (f(t) - S τ / 2), then radians
+        np.multiply(tau, -0.5 * self.slope, out=cycles)
+        cycles += self._f_inst
+        cycles *= tau
+        cycles *= 2 * np.pi
+
+        tone_iq = tone.view(real_dtype).reshape(tone.shape + (2,))
+        np.cos(cycles, out=tone_iq[..., 0])
+        np.sin(cycles, out=tone_iq[..., 1])
+
+        # Σ_k tx[k, t] rx[k, r] tone[k, t]  per TX: [N_rx, K] @ [K, Nc·Ns]
+        weights = (
+            tx_steer[:, :, None] * rx_steer[:, None, :]
+        ).astype(self.dtype)
+        acc = self._buffer("accumulate", (self.num_rx, self.Nc * self.Ns),
+                           self.dtype)
+        for t in range(self.num_tx):
+            np.matmul(weights[:, t, :].T, tone[:, t].reshape(num, -1), out=acc)
+            beat[t] += acc.reshape(self.num_rx, self.Nc, self.Ns)
+
+    def _stop_and_hop_block(self, ranges, velocities, tx_steer, rx_steer):
+        """
+        Separable model: slow-time [N_tx, Nc, K] x fast-time [K, Ns].
+        """
+        tau0 = 2 * ranges / self.C
+        f_d = 2 * velocities * self.fc / self.C
+        f_b = self.slope * tau0
+
+        fast = np.exp(2j * np.pi * (f_b + f_d)[:, None] * self.t_fast[None, :])
+
+        phase0 = self.fc * tau0 - 0.5 * self.slope * tau0**2
+        slow = np.exp(
+            2j * np.pi * (phase0 + f_d * self.t_slow[:, :, None])
+        )
+        slow *= tx_steer.T[:, None, :]
+
+        return np.einsum(
+            "tmk,kr,kn->trmn",
+            slow.astype(self.dtype, copy=False),
+            rx_steer.astype(self.dtype),
+            fast.astype(self.dtype, copy=False),
+            optimize=True
+        )
@@ -10,8 +10,16 @@ class Mixer:
     """
 
     @staticmethod
-    def mix(tx_signal, rx_signal):
+    def mix(tx_signal, rx_signal, out=None):
         """
         Perform dechirping (homodyne mixing).
+
+        out : ndarray or None
+            Destination (may be rx_signal itself)
         """
-        return tx_signal * np.conj(rx_signal)
+        if out is None:
+            return tx_signal * np.conj(rx_signal)
+
+        np.conjugate(rx_signal, out=out)
+        out *= tx_signal
+        return out
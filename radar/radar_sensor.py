@@ -1,5 +1,8 @@
 import numpy as np
 
+from utils.instrumentation import NULL_OBSERVER
+from utils.workspace import resolve_workspace
+
 
 class RadarSensor:
     """
@@ -10,50 +13,158 @@ class RadarSensor:
 
     Each component must implement:
         waveform.generate() -> tx_signal
-        channel.propagate(tx_signal, target_states) -> rx_signal
+        channel.propagate_frame(tx_signal, target_states) -> rx_signal [Nc, Ns]
         mixer.mix(tx_signal, rx_signal) -> beat_signal
         adc.sample(analog_signal) -> digital_samples
+
+    Analog impairments (noise, clutter) are applied to the beat signal
+    before the ADC through capture(..., impair=), so they are quantized
+    and clipped like a real front end.
+
+    Analytic mode (synthesizer given) replaces waveform → channel → mixer
+    with a closed-form beat model:
+        synthesizer.synthesize(target_states) -> beat_signal [Nc, Ns]
+
+    observer (utils.instrumentation) records every stage of capture:
+        sensor.synthesize | sensor.waveform, sensor.channel, sensor.mixer
+        sensor.adc
+
+    Workspace mode (workspace=True or a shared utils.workspace.Workspace)
+    writes every frame into one preallocated buffer: the channel /
+    synthesizer fills it, the mixer and the ADC update it in place
+    (components must then accept out=). The returned samples are a
+    view of that buffer, valid until the next capture.
     """
 
-    def __init__(self, waveform, channel, mixer, adc):
+    def __init__(self, waveform, channel, mixer, adc, synthesizer=None,
+                 observer=None, workspace=None):
         self.waveform = waveform
         self.channel = channel
         self.mixer = mixer
         self.adc = adc
+        self.synthesizer = synthesizer
+        self.observer = NULL_OBSERVER if observer is None else observer
+        self.workspace = resolve_workspace(workspace)
+
+        # Frame buffer up front when the shape is known from the config
+        if self.workspace is not None and synthesizer is not None:
+            self.workspace.get(
+                "sensor.frame", synthesizer.frame_shape, synthesizer.dtype
+            )
+
+    @classmethod
+    def analytic(cls, synthesizer, adc, observer=None, workspace=None):
+        """
+        Build a sensor that synthesizes the beat signal directly.
+
+        No RF-rate waveform is ever generated in this mode.
+        """
+        return cls(None, None, None, adc, synthesizer=synthesizer,
+                   observer=observer, workspace=workspace)
 
-    def capture(self, target_states):
+    def capture(self, target_states, impair=None):
         """
         Perform one radar measurement frame.
 
         Parameters
         ----------
-        target_states : list[dict]
+        target_states : list[dict] or dict of arrays
             Each dict must contain:
                 range : float
                 velocity : float
                 rcs : float
+            or a mapping of [K] arrays with the same keys
+            (Scenario.get_arrays / Scenario.snapshot)
+        impair : callable or None
+            impair(beat) -> beat, applied to the analog beat signal
+            before the ADC (may update beat in place)
 
         Returns
         -------
         np.ndarray
             Complex baseband samples [Nc, Ns]
         """
+        if self.workspace is not None:
+            return self._capture_into(target_states, impair)
+
+        obs = self.observer
+
+        if self.synthesizer is not None:
+            with obs.stage("sensor.synthesize") as st:
+                beat_signal = st.output(
+                    self.synthesizer.synthesize(target_states)
+                )
+            if impair is not None:
+                beat_signal = impair(beat_signal)
+            with obs.stage("sensor.adc") as st:
+                return st.output(self.adc.sample(beat_signal))
 
         # 1) Transmit waveform
-        tx_signal = self.waveform.generate()
+        with obs.stage("sensor.waveform") as st:
+            tx_signal = st.output(self.waveform.generate())
 
-        # 2) Propagation & reflection
-        rx_signal = self.channel.propagate(tx_signal, target_states)
+        # 2) Propagation & reflection (all targets, all chirps)
+        with obs.stage("sensor.channel") as st:
+            rx_signal = st.output(
+                self.channel.propagate_frame(tx_signal, target_states)
+            )
 
         # 3) Beat signal generation
-        beat_signal = self.mixer.mix(tx_signal, rx_signal)
+        with obs.stage("sensor.mixer") as st:
+            beat_signal = st.output(self.mixer.mix(tx_signal, rx_signal))
+
+        if impair is not None:
+            beat_signal = impair(beat_signal)
 
         # 4) ADC sampling
-        samples = self.adc.sample(beat_signal)
+        with obs.stage("sensor.adc") as st:
+            samples = st.output(self.adc.sample(beat_signal))
 
         return samples
 
+    def _capture_into(self, target_states, impair=None):
+        """
+        capture() on the workspace frame buffer.
+        """
+        obs = self.observer
+        ws = self.workspace
+
+        if self.synthesizer is not None:
+            frame = ws.get(
+                "sensor.frame", self.synthesizer.frame_shape,
+                self.synthesizer.dtype
+            )
+            with obs.stage("sensor.synthesize") as st:
+                st.output(self.synthesizer.synthesize(target_states, out=frame))
+        else:
+            with obs.stage("sensor.waveform") as st:
+                tx_signal = st.output(self.waveform.generate())
+
+            frame = ws.get(
+                "sensor.frame",
+                (self.channel.num_chirps, tx_signal.shape[-1]),
+                self.channel.dtype
+            )
+            with obs.stage("sensor.channel") as st:
+                st.output(self.channel.propagate_frame(
+                    tx_signal, target_states, out=frame
+                ))
+            with obs.stage("sensor.mixer") as st:
+                st.output(self.mixer.mix(tx_signal, frame, out=frame))
+
+        if impair is not None:
+            frame = impair(frame)
+
+        with obs.stage("sensor.adc") as st:
+            return st.output(self.adc.sample(frame, out=frame))
+
     def __repr__(self):
+        if self.synthesizer is not None:
+            return (
+                f"RadarSensor("
+                f"synthesizer={self.synthesizer.__class__.__name__}, "
+                f"adc={self.adc.__class__.__name__})"
+            )
         return (
             f"RadarSensor("
             f"waveform={self.waveform.__class__.__name__}, "
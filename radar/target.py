@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+
 import numpy as np
 
 C = 3e8  # speed of light
@@ -37,3 +39,52 @@ class RadarTarget:
         amplitude ∝ sqrt(RCS) / R^2
         """
         return np.sqrt(self.rcs) / (self.range**2 + 1e-6)
+
+
+def target_field(target_states, name, default=None):
+    """
+    One target parameter as a float64 array [K].
+
+    Parameters
+    ----------
+    target_states : list of dict or mapping of arrays
+        [{range, velocity, rcs, ...}, ...] or
+        {"range": ndarray, "velocity": ndarray, ...} (Scenario.get_arrays)
+    name : str
+    default : float or None
+        Used when the parameter is absent (None → KeyError)
+    """
+    if isinstance(target_states, Mapping):
+        if name not in target_states and default is not None:
+            n = len(target_states["range"])
+            return np.full(n, default, dtype=np.float64)
+        return np.asarray(target_states[name], dtype=np.float64)
+
+    if default is None:
+        return np.array([s[name] for s in target_states], dtype=np.float64)
+
+    return np.array(
+        [s.get(name, default) for s in target_states], dtype=np.float64
+    )
+
+
+def target_arrays(target_states):
+    """
+    Convert target states into contiguous parameter arrays.
+
+    Parameters
+    ----------
+    target_states : list of dict or mapping of arrays
+        {range, velocity, rcs}
+
+    Returns
+    -------
+    ranges : ndarray [K]
+    velocities : ndarray [K]
+    rcs : ndarray [K]
+    """
+    return (
+        target_field(target_states, "range"),
+        target_field(target_states, "velocity"),
+        target_field(target_states, "rcs"),
+    )
@@ -1,5 +1,7 @@
 import numpy as np
 
+from utils.array_cache import TABLE_CACHE
+
 
 class FMCWWaveform:
     """
@@ -13,28 +15,68 @@ class FMCWWaveform:
     where:
         f_c : carrier frequency
         S   : chirp slope = B / T_chirp
+
+    The phase is always evaluated in float64 (f_c · t reaches millions
+    of cycles); dtype only sets the storage of the output samples.
+
+    The chirp depends only on (fc, bandwidth, chirp_duration,
+    sample_rate, dtype), so generate() serves it from a process-wide
+    LRU cache (utils.array_cache.TABLE_CACHE) and returns a read-only
+    array shared by every waveform with the same parameters
+    (cache=None → build on every call). from_plan() serves it from a
+    compiled SimulationPlan instead.
     """
 
-    def __init__(self, fc, bandwidth, chirp_duration, sample_rate):
+    def __init__(self, fc, bandwidth, chirp_duration, sample_rate,
+                 dtype=np.complex128, cache=TABLE_CACHE):
         self.fc = fc
         self.bandwidth = bandwidth
         self.T = chirp_duration
         self.fs = sample_rate
+        self.dtype = np.dtype(dtype)
+        self.cache = cache
 
         self.slope = bandwidth / chirp_duration
         self.num_samples = int(self.T * self.fs)
 
+        self._table = None
+
+    @classmethod
+    def from_plan(cls, plan):
+        """
+        Waveform whose chirp is the plan's precomputed "chirp" table.
+        """
+        radar = plan.radar
+        waveform = cls(radar.fc, radar.bandwidth, radar.chirp_duration,
+                       radar.sampling_rate, dtype=radar.complex_dtype,
+                       cache=None)
+        waveform._table = plan.table("chirp", (waveform.num_samples,))
+        return waveform
+
     def time_axis(self):
         """Generate time axis for one chirp."""
         return np.arange(self.num_samples) / self.fs
 
+    def cache_key(self):
+        return ("chirp", self.fc, self.bandwidth, self.T, self.fs,
+                self.dtype.str)
+
     def generate(self):
-        """Generate complex FMCW transmit signal."""
+        """
+        Complex FMCW transmit signal (read-only when cached).
+        """
+        if self._table is not None:
+            return self._table
+        if self.cache is None:
+            return self._build()
+        return self.cache.get(self.cache_key(), self._build)
+
+    def _build(self):
         t = self.time_axis()
 
         phase = 2 * np.pi * (
             self.fc * t + 0.5 * self.slope * t**2
         )
 
-        tx_signal = np.exp(1j * phase)
+        tx_signal = np.exp(1j * phase).astype(self.dtype, copy=False)
         return tx_signal
@@ -1,28 +1,247 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from .target import Target
+
+
+class TargetList(Sequence):
+    """
+    List-like view of a scenario's targets (Scenario.targets).
+
+    Indexing and iteration give Target views; append / extend add
+    targets through Scenario.add_target. Targets cannot be removed
+    individually: assign a new list to Scenario.targets instead.
+    """
+
+    def __init__(self, scenario):
+        self._scenario = scenario
+
+    def __len__(self):
+        return len(self._scenario)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._scenario._view(i)
+                    for i in range(*index.indices(len(self)))]
+
+        count = len(self)
+        if not -count <= index < count:
+            raise IndexError("target index out of range")
+        return self._scenario._view(index % count)
+
+    def append(self, target):
+        self._scenario.add_target(target)
+
+    def extend(self, targets):
+        for target in targets:
+            self._scenario.add_target(target)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class Scenario:
     """
     Radar scene containing multiple targets.
+
+    Target parameters are stored as contiguous float64 arrays
+    (struct of arrays), so the whole scene steps in one vector
+    operation and is handed to the signal model as arrays.
+    Target objects returned by `targets` / passed to add_target are
+    thin views into these arrays.
+
+    `targets` is a TargetList: it supports indexing, iteration, append
+    and extend like the former plain list, and assigning a new list
+    replaces the scene. Adding targets may reallocate the arrays, so
+    arrays from get_arrays() or the range / velocity / … properties
+    must be fetched again after targets are added.
     """
 
-    def __init__(self, targets=None):
-        self.targets = targets if targets is not None else []
+    FIELDS = ("range", "velocity", "rcs", "phase", "angle")
+    DEFAULTS = {"rcs": 1.0, "phase": 0.0, "angle": 0.0}
+
+    def __init__(self, targets=None, capacity=16):
+        self._data = {
+            name: np.empty(max(int(capacity), 1), dtype=np.float64)
+            for name in self.FIELDS
+        }
+        self._count = 0
+        self._views = {}
         self.time = 0.0
 
+        for tgt in targets if targets is not None else []:
+            self.add_target(tgt)
+
+    @classmethod
+    def from_arrays(cls, ranges, velocities, rcs=1.0, phase=0.0, angle=0.0):
+        """
+        Build a scene directly from parameter arrays (clutter fields,
+        extended targets).
+        """
+        ranges = np.atleast_1d(np.asarray(ranges, dtype=np.float64))
+        scenario = cls(capacity=ranges.shape[0])
+        scenario.add_targets(ranges, velocities, rcs=rcs, phase=phase, angle=angle)
+        return scenario
+
+    @classmethod
+    def from_config(cls, target_scenario):
+        """
+        Build a scene from config.target_config.TargetScenario.
+        """
+        targets = target_scenario.targets
+        return cls.from_arrays(
+            [t.range_m for t in targets],
+            [t.velocity_mps for t in targets],
+            rcs=[t.rcs for t in targets],
+            angle=[t.angle_rad for t in targets],
+        )
+
+    def _reserve(self, count):
+        """
+        Grow the arrays to hold count targets (amortized doubling).
+
+        Growing allocates new arrays, which detaches any views handed
+        out before.
+        """
+        capacity = self._data["range"].shape[0]
+        if count <= capacity:
+            return
+
+        new_capacity = max(count, 2 * capacity)
+        for name, arr in self._data.items():
+            grown = np.empty(new_capacity, dtype=np.float64)
+            grown[:self._count] = arr[:self._count]
+            self._data[name] = grown
+
     def add_target(self, target):
-        self.targets.append(target)
+        """
+        Append a Target; the object becomes a view into the scene.
+        """
+        state = target.get_state()
+
+        self._reserve(self._count + 1)
+        for name in self.FIELDS:
+            self._data[name][self._count] = state.get(
+                name, self.DEFAULTS.get(name, 0.0)
+            )
+
+        target._bind(self, self._count)
+        self._views[self._count] = target
+        self._count += 1
+
+    def add_targets(self, ranges, velocities, rcs=1.0, phase=0.0, angle=0.0):
+        """
+        Append many targets at once (scalars broadcast).
+        """
+        ranges = np.atleast_1d(np.asarray(ranges, dtype=np.float64))
+        n = ranges.shape[0]
+
+        values = {
+            "range": ranges,
+            "velocity": velocities,
+            "rcs": rcs,
+            "phase": phase,
+            "angle": angle,
+        }
+
+        self._reserve(self._count + n)
+        for name in self.FIELDS:
+            self._data[name][self._count:self._count + n] = values[name]
+
+        self._count += n
+
+    # === Array views (length = number of targets) ===
+
+    @property
+    def range(self):
+        return self._data["range"][:self._count]
+
+    @property
+    def velocity(self):
+        return self._data["velocity"][:self._count]
+
+    @property
+    def rcs(self):
+        return self._data["rcs"][:self._count]
+
+    @property
+    def phase(self):
+        return self._data["phase"][:self._count]
+
+    @property
+    def angle(self):
+        return self._data["angle"][:self._count]
+
+    def _view(self, index):
+        """
+        Target view of entry index (created on demand).
+        """
+        tgt = self._views.get(index)
+        if tgt is None:
+            tgt = Target._view(self, index)
+            self._views[index] = tgt
+        return tgt
+
+    @property
+    def targets(self):
+        """
+        TargetList of views for every scatterer.
+        """
+        return TargetList(self)
+
+    @targets.setter
+    def targets(self, targets):
+        """
+        Replace every target. Earlier Target views are detached and
+        keep their last values.
+        """
+        targets = list(targets)
+        for tgt in self._views.values():
+            tgt._unbind()
+
+        self._views = {}
+        self._count = 0
+        for tgt in targets:
+            self.add_target(tgt)
 
     def step(self, dt):
         """
-        Advance scene time.
+        Advance scene time (constant velocity, all targets at once).
         """
-        for tgt in self.targets:
-            tgt.propagate(dt)
+        rng = self.range
+        rng += self.velocity * dt
         self.time += dt
 
+    def get_arrays(self):
+        """
+        Live array views {range, velocity, rcs, phase, angle}.
+
+        Views are updated in place by step(); use snapshot() to keep a
+        frame's state. Adding targets may reallocate the arrays, so
+        fetch the views again afterwards.
+        """
+        return {name: self._data[name][:self._count] for name in self.FIELDS}
+
+    def snapshot(self):
+        """
+        Copy of the current target arrays (ground truth of one frame).
+        """
+        return {
+            name: self._data[name][:self._count].copy() for name in self.FIELDS
+        }
+
     def get_targets(self):
         """
         Return list of target states for signal generator.
+
+        Kept for compatibility; get_arrays() avoids building a dict per
+        target.
         """
-        return [t.get_state() for t in self.targets]
+        return [
+            {name: float(self._data[name][i]) for name in self.FIELDS}
+            for i in range(self._count)
+        ]
 
     def __len__(self):
-        return len(self.targets)
+        return self._count
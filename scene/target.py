@@ -1,6 +1,29 @@
 import numpy as np
 
 
+class _Field:
+    """
+    Target attribute stored either on the target itself or, once the
+    target is added to a Scenario, in the scenario's arrays.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj._scenario is not None:
+            return float(obj._scenario._data[self.name][obj._index])
+        return obj._values[self.name]
+
+    def __set__(self, obj, value):
+        if obj._scenario is not None:
+            obj._scenario._data[self.name][obj._index] = value
+        else:
+            obj._values[self.name] = float(value)
+
+
 class Target:
     """
     Point target in radar scene.
@@ -15,13 +38,53 @@ class Target:
         Radar cross section scale
     phase : float
         Initial phase [rad]
+    angle : float
+        Azimuth angle [rad]
+
+    After Scenario.add_target the object is a view: its attributes
+    read and write the scenario's contiguous arrays.
     """
 
-    def __init__(self, range_m, velocity_mps, rcs=1.0, phase=0.0):
-        self.range = float(range_m)
-        self.velocity = float(velocity_mps)
-        self.rcs = float(rcs)
-        self.phase = float(phase)
+    range = _Field()
+    velocity = _Field()
+    rcs = _Field()
+    phase = _Field()
+    angle = _Field()
+
+    def __init__(self, range_m, velocity_mps, rcs=1.0, phase=0.0, angle=0.0):
+        self._scenario = None
+        self._index = None
+        self._values = {}
+
+        self.range = range_m
+        self.velocity = velocity_mps
+        self.rcs = rcs
+        self.phase = phase
+        self.angle = angle
+
+    @classmethod
+    def _view(cls, scenario, index):
+        """
+        View onto an array-only scenario entry.
+        """
+        tgt = cls.__new__(cls)
+        tgt._values = {}
+        tgt._bind(scenario, index)
+        return tgt
+
+    def _bind(self, scenario, index):
+        self._scenario = scenario
+        self._index = index
+
+    def _unbind(self):
+        """
+        Detach from the scenario, keeping the current values.
+        """
+        if self._scenario is not None:
+            values = self.get_state()
+            self._scenario = None
+            self._index = None
+            self._values = values
 
     def propagate(self, dt):
         """
@@ -39,4 +102,11 @@ class Target:
             "velocity": self.velocity,
             "rcs": self.rcs,
             "phase": self.phase,
+            "angle": self.angle,
         }
+
+    def __repr__(self):
+        return (
+            f"Target(range={self.range:.3f}, velocity={self.velocity:.3f}, "
+            f"rcs={self.rcs:.3f}, angle={self.angle:.3f})"
+        )
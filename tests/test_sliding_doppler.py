@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from radar.adc import ADC, PackedIQ
+from pipeline.rdm_pipeline import RDMPipeline
+from pipeline.sliding_doppler import SlidingDopplerProcessor
+
+
+NC = 16
+NS = 32
+
+
+def _pipeline(**kwargs):
+    return RDMPipeline(77e9, 1e9, 40e-6, NC, NS, 0.8e6, **kwargs)
+
+
+def _frame(real):
+    rng = np.random.default_rng(0)
+    beat = rng.standard_normal((2, NC, NS))
+    if not real:
+        beat = beat + 1j * rng.standard_normal((2, NC, NS))
+    return 0.1 * beat
+
+
+def _push_frame(sdp, chirps):
+    for j in range(NC):
+        rdm, range_axis, _ = sdp.push_rdm(chirps[:, j])
+    return rdm, range_axis
+
+
+@pytest.mark.parametrize("use_rfft, real", [
+    (False, False), (False, True), (True, True)
+])
+def test_frame_boundary_matches_pipeline(use_rfft, real):
+    pipe = _pipeline(use_rfft=use_rfft)
+    beat = _frame(real)
+
+    rdm, range_axis = _push_frame(
+        SlidingDopplerProcessor(pipe, leading_shape=(2,)), beat
+    )
+    expected, expected_axis = pipe.process(beat)
+
+    assert rdm.shape == expected.shape
+    np.testing.assert_array_equal(range_axis, expected_axis)
+    np.testing.assert_allclose(rdm, np.abs(expected), atol=1e-9)
+
+
+def test_packed_iq_matches_pipeline():
+    pipe = _pipeline()
+    packed = ADC(num_bits=12, output="int").sample(_frame(real=False))
+
+    sdp = SlidingDopplerProcessor(pipe, leading_shape=(2,))
+    for j in range(NC):
+        chirp = PackedIQ(packed.data[:, j], packed.scale, packed.num_bits)
+        rdm, _, _ = sdp.push_rdm(chirp)
+    expected, _ = pipe.process(packed)
+
+    np.testing.assert_allclose(rdm, np.abs(expected), atol=1e-9)
+
+
+def test_rejects_bad_chirps():
+    sdp = SlidingDopplerProcessor(_pipeline(use_rfft=True))
+
+    with pytest.raises(ValueError):
+        sdp.push(np.zeros(NS + 1))
+    with pytest.raises(ValueError):
+        sdp.push(np.zeros(NS, dtype=np.complex128))
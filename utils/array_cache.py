@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ArrayCache:
+    """
+    Byte-bounded LRU cache of read-only arrays.
+
+    Used for tables that depend only on the configuration (transmit
+    chirp, delay and phase-ramp tables), so they are built once per
+    process and shared between every object with the same config.
+
+    Cached arrays are returned read-only: callers must copy before
+    modifying. Arrays larger than max_bytes are built but not cached.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory bound of all cached arrays
+    """
+
+    def __init__(self, max_bytes=64 * 2**20):
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """
+        Cached array for key; build() is called on a miss.
+
+        Parameters
+        ----------
+        key : hashable
+        build : callable () -> ndarray
+
+        Returns
+        -------
+        ndarray (read-only)
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+
+        # Built outside the lock; concurrent misses may build twice
+        value = np.ascontiguousarray(build())
+        value.setflags(write=False)
+
+        if value.nbytes > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = value
+                self.nbytes += value.nbytes
+
+                while self.nbytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.nbytes -= evicted.nbytes
+
+            return self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        {entries, nbytes, max_bytes, hits, misses}
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide cache for waveform and channel tables
+TABLE_CACHE = ArrayCache()
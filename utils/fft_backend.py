@@ -0,0 +1,275 @@
+import pickle
+
+import numpy as np
+
+
+# numpy.fft accepts out= from numpy 2.0
+_NUMPY_FFT_OUT = np.lib.NumpyVersion(np.__version__) >= "2.0.0"
+
+
+def _into(result, out):
+    if out is None:
+        return result
+    np.copyto(out, result)
+    return out
+
+
+class NumpyFFTBackend:
+    """
+    FFT backend built on numpy.fft.
+
+    Every backend exposes the same small interface:
+        fft(x, n=None, axis=-1, out=None)
+        ifft(x, n=None, axis=-1, out=None)
+        rfft(x, n=None, axis=-1, out=None)
+        fftshift(x, axes=None)
+        empty(shape, dtype)
+
+    out (dtype of the transform result) receives the transform; it is
+    written directly where the library supports it (numpy >= 2,
+    pyFFTW) and copied into otherwise. empty() allocates buffers
+    suited to the backend (SIMD-aligned for pyFFTW).
+    """
+
+    name = "numpy"
+
+    def _transform(self, func, x, n, axis, out):
+        if out is not None and _NUMPY_FFT_OUT:
+            return func(x, n=n, axis=axis, out=out)
+        return _into(func(x, n=n, axis=axis), out)
+
+    def fft(self, x, n=None, axis=-1, out=None):
+        return self._transform(np.fft.fft, x, n, axis, out)
+
+    def ifft(self, x, n=None, axis=-1, out=None):
+        return self._transform(np.fft.ifft, x, n, axis, out)
+
+    def rfft(self, x, n=None, axis=-1, out=None):
+        return self._transform(np.fft.rfft, x, n, axis, out)
+
+    @staticmethod
+    def empty(shape, dtype=np.complex128):
+        return np.empty(shape, dtype=dtype)
+
+    @staticmethod
+    def fftshift(x, axes=None):
+        return np.fft.fftshift(x, axes=axes)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class ScipyFFTBackend(NumpyFFTBackend):
+    """
+    FFT backend built on scipy.fft with multi-threaded transforms.
+
+    Parameters
+    ----------
+    workers : int or None
+        Thread count passed to scipy.fft (-1 → all cores)
+    """
+
+    name = "scipy"
+
+    def __init__(self, workers=None):
+        try:
+            import scipy.fft
+        except ImportError as exc:
+            raise ImportError(
+                "ScipyFFTBackend requires scipy."
+            ) from exc
+
+        self._fft = scipy.fft
+        self.workers = workers
+
+    def fft(self, x, n=None, axis=-1, out=None):
+        return _into(
+            self._fft.fft(x, n=n, axis=axis, workers=self.workers), out
+        )
+
+    def ifft(self, x, n=None, axis=-1, out=None):
+        return _into(
+            self._fft.ifft(x, n=n, axis=axis, workers=self.workers), out
+        )
+
+    def rfft(self, x, n=None, axis=-1, out=None):
+        return _into(
+            self._fft.rfft(x, n=n, axis=axis, workers=self.workers), out
+        )
+
+    def __repr__(self):
+        return f"ScipyFFTBackend(workers={self.workers})"
+
+
+class PyFFTWBackend(NumpyFFTBackend):
+    """
+    FFT backend built on pyFFTW with cached plans.
+
+    Plans are keyed on (kind, shape, dtype, n, axis). Radar frame sizes
+    are fixed per configuration, so after the first frame every
+    transform reuses an existing plan.
+
+    Parameters
+    ----------
+    threads : int
+        FFTW thread count
+    planner_effort : str
+        FFTW_ESTIMATE / FFTW_MEASURE / FFTW_PATIENT / FFTW_EXHAUSTIVE
+    wisdom_file : str or None
+        Pickled FFTW wisdom loaded at construction (if present)
+        and written by save_wisdom()
+    """
+
+    name = "pyfftw"
+
+    def __init__(self, threads=1, planner_effort="FFTW_MEASURE",
+                 wisdom_file=None):
+        try:
+            import pyfftw
+            import pyfftw.builders
+        except ImportError as exc:
+            raise ImportError(
+                "PyFFTWBackend requires pyfftw."
+            ) from exc
+
+        self._pyfftw = pyfftw
+        self.threads = threads
+        self.planner_effort = planner_effort
+        self.wisdom_file = wisdom_file
+
+        self._plans = {}
+
+        if wisdom_file is not None:
+            self.load_wisdom(wisdom_file)
+
+    def _execute(self, kind, x, n, axis, out=None):
+        x = np.asarray(x)
+        key = (kind, x.shape, x.dtype.str, n, axis)
+
+        plan = self._plans.get(key)
+        if plan is None:
+            builder = getattr(self._pyfftw.builders, kind)
+            plan = builder(
+                self._pyfftw.empty_aligned(x.shape, dtype=x.dtype),
+                n=n,
+                axis=axis,
+                threads=self.threads,
+                planner_effort=self.planner_effort,
+            )
+            self._plans[key] = plan
+
+        # Fresh output per call unless given: the plan's internal array
+        # is reused
+        if out is None:
+            out = self._pyfftw.empty_aligned(
+                plan.output_shape, dtype=plan.output_dtype
+            )
+        plan(x, out)
+        return out
+
+    def fft(self, x, n=None, axis=-1, out=None):
+        return self._execute("fft", x, n, axis, out)
+
+    def ifft(self, x, n=None, axis=-1, out=None):
+        return self._execute("ifft", x, n, axis, out)
+
+    def rfft(self, x, n=None, axis=-1, out=None):
+        return self._execute("rfft", x, n, axis, out)
+
+    def empty(self, shape, dtype=np.complex128):
+        return self._pyfftw.empty_aligned(shape, dtype=dtype)
+
+    def load_wisdom(self, path):
+        """
+        Import pickled FFTW wisdom. Missing file is not an error.
+        """
+        try:
+            with open(path, "rb") as f:
+                self._pyfftw.import_wisdom(pickle.load(f))
+        except FileNotFoundError:
+            pass
+
+    def save_wisdom(self, path=None):
+        """
+        Export accumulated FFTW wisdom for later runs.
+        """
+        path = self.wisdom_file if path is None else path
+        if path is None:
+            raise ValueError("No wisdom file given.")
+
+        with open(path, "wb") as f:
+            pickle.dump(self._pyfftw.export_wisdom(), f)
+
+    def clear_plans(self):
+        self._plans.clear()
+
+    def __repr__(self):
+        return (
+            f"PyFFTWBackend(threads={self.threads}, "
+            f"planner_effort={self.planner_effort!r}, "
+            f"plans={len(self._plans)})"
+        )
+
+
+_BACKENDS = {
+    "numpy": NumpyFFTBackend,
+    "scipy": ScipyFFTBackend,
+    "pyfftw": PyFFTWBackend,
+}
+
+_default_backend = NumpyFFTBackend()
+
+
+def get_fft_backend(backend=None, workers=None, **kwargs):
+    """
+    Resolve an FFT backend.
+
+    Parameters
+    ----------
+    backend : str, backend instance or None
+        "numpy", "scipy", "pyfftw", "auto" or an existing backend.
+        None → process-wide default (see set_default_fft_backend)
+    workers : int or None
+        Thread count (scipy workers / pyFFTW threads)
+    **kwargs
+        Extra backend options (e.g. planner_effort, wisdom_file)
+
+    Returns
+    -------
+    backend instance
+    """
+    if backend is None:
+        return _default_backend
+
+    if not isinstance(backend, str):
+        return backend
+
+    if backend == "auto":
+        for name in ("pyfftw", "scipy"):
+            try:
+                return get_fft_backend(name, workers=workers, **kwargs)
+            except ImportError:
+                continue
+        return NumpyFFTBackend()
+
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown FFT backend '{backend}'. "
+            f"Choose from {sorted(_BACKENDS)} or 'auto'."
+        )
+
+    if backend == "numpy":
+        return NumpyFFTBackend()
+    if backend == "scipy":
+        return ScipyFFTBackend(workers=workers)
+
+    return PyFFTWBackend(threads=workers or 1, **kwargs)
+
+
+def set_default_fft_backend(backend, workers=None, **kwargs):
+    """
+    Set the process-wide backend used when none is given explicitly.
+    """
+    global _default_backend
+    _default_backend = get_fft_backend(backend, workers=workers, **kwargs)
+    return _default_backend
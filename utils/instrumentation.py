@@ -0,0 +1,396 @@
+import json
+import os
+import random
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+import numpy as np
+
+
+class _NullStage:
+    """
+    Shared no-op stage context.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def output(self, value):
+        return value
+
+
+class NullObserver:
+    """
+    Observer that records nothing.
+
+    stage() returns one shared no-op context, so instrumented code costs
+    one method call per stage when profiling is disabled.
+    """
+
+    enabled = False
+
+    _STAGE = _NullStage()
+
+    def stage(self, name):
+        return self._STAGE
+
+    def set_frame(self, frame):
+        pass
+
+
+NULL_OBSERVER = NullObserver()
+
+
+def _describe(value):
+    """
+    (shape, dtype, nbytes) of a stage output (first array of a tuple).
+    """
+    if isinstance(value, tuple):
+        value = next((v for v in value if isinstance(v, np.ndarray)), None)
+
+    if isinstance(value, np.ndarray):
+        return list(value.shape), value.dtype.str, int(value.nbytes)
+
+    return None, None, 0
+
+
+class _Stage:
+    """
+    Timing context of one stage execution (see StageRecorder.stage).
+    """
+
+    __slots__ = ("recorder", "name", "start", "mem_start", "child_peak",
+                 "shape", "dtype", "nbytes")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+        self.shape = None
+        self.dtype = None
+        self.nbytes = 0
+        self.child_peak = 0
+
+    def output(self, value):
+        """
+        Register the stage output (shape / dtype / bytes); returns value.
+        """
+        self.shape, self.dtype, self.nbytes = _describe(value)
+        return value
+
+    def __enter__(self):
+        rec = self.recorder
+        if rec.trace_memory:
+            self.mem_start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        rec._stack().append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        rec = self.recorder
+
+        stack = rec._stack()
+        stack.pop()
+
+        peak = None
+        if rec.trace_memory:
+            _, traced_peak = tracemalloc.get_traced_memory()
+            traced_peak = max(traced_peak, self.child_peak)
+            peak = traced_peak - self.mem_start
+
+            # reset_peak() above hid the parent's peak so far
+            if stack:
+                parent = stack[-1]
+                parent.child_peak = max(parent.child_peak, traced_peak)
+
+        rec._add(self, end, peak, depth=len(stack))
+        return False
+
+
+class _StageStats:
+    """
+    Running statistics of one stage: exact count / total / max, and a
+    reservoir sample of at most size durations for the percentiles.
+    """
+
+    __slots__ = ("size", "count", "total", "max", "peak", "samples")
+
+    def __init__(self, size):
+        self.size = size
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.peak = None
+        self.samples = []
+
+    def add(self, duration, peak, rng):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if peak is not None:
+            self.peak = peak if self.peak is None else max(self.peak, peak)
+
+        if self.size is None or len(self.samples) < self.size:
+            self.samples.append(duration)
+        else:
+            # Algorithm R: every duration so far is kept with equal
+            # probability size / count
+            slot = rng.randrange(self.count)
+            if slot < self.size:
+                self.samples[slot] = duration
+
+
+class StageRecorder:
+    """
+    Observer recording every stage of every frame.
+
+    Each event stores wall time, output shape / dtype / size and
+    (with trace_memory=True) the peak memory allocated by the stage,
+    measured with tracemalloc. Stages may nest.
+
+    Parameters
+    ----------
+    trace_memory : bool
+        Track peak allocation per stage (starts tracemalloc unless it
+        is already running, stopped again by close() or on leaving a
+        with block; NumPy buffers are reported to it, at some cost in
+        speed)
+    max_events : int or None
+        Keep only the newest events for the trace export (summaries
+        always cover every event)
+    max_samples : int or None
+        Durations kept per stage for the summary percentiles. Beyond
+        that, a uniform reservoir sample is kept, so memory stays
+        bounded on long runs; count, total, mean and max stay exact.
+        None keeps every duration.
+
+    Example
+    -------
+        rec = StageRecorder()
+        sensor = RadarSensor.analytic(model, ADC(), observer=rec)
+        ...
+        print(rec.report())
+        rec.export_chrome_trace("trace.json")   # chrome://tracing, Perfetto
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory=False, max_events=None,
+                 max_samples=10000):
+        if max_samples is not None and max_samples <= 0:
+            raise ValueError("max_samples must be positive.")
+
+        self.trace_memory = trace_memory
+        self.events = deque(maxlen=max_events)
+        self.max_samples = max_samples
+        self.frame = None
+
+        self._stats = {}
+        self._rng = random.Random(0)
+        self._shapes = defaultdict(set)
+        self._frame_peaks = {}
+        self._local = threading.local()
+        self._origin = time.perf_counter_ns()
+
+        # Only a tracemalloc session started here is stopped by close()
+        self._owns_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+        if self._owns_tracemalloc:
+            tracemalloc.start()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def stage(self, name):
+        """
+        Context manager timing one stage:
+
+            with observer.stage("sensor.adc") as st:
+                samples = st.output(adc.sample(beat))
+        """
+        return _Stage(self, name)
+
+    def set_frame(self, frame):
+        """
+        Tag subsequent events with a frame index.
+        """
+        self.frame = frame
+
+    def _add(self, stage, end, peak, depth):
+        duration = end - stage.start
+
+        stats = self._stats.get(stage.name)
+        if stats is None:
+            stats = self._stats[stage.name] = _StageStats(self.max_samples)
+        stats.add(duration, peak, self._rng)
+        if stage.shape is not None:
+            self._shapes[stage.name].add((tuple(stage.shape), stage.dtype))
+        if peak is not None and depth == 0:
+            self._frame_peaks[self.frame] = max(
+                self._frame_peaks.get(self.frame, 0), peak
+            )
+
+        self.events.append({
+            "name": stage.name,
+            "frame": self.frame,
+            "start_ns": stage.start - self._origin,
+            "duration_ns": duration,
+            "depth": depth,
+            "thread": threading.get_ident(),
+            "shape": stage.shape,
+            "dtype": stage.dtype,
+            "output_bytes": stage.nbytes,
+            "peak_bytes": peak,
+        })
+
+    def reset(self):
+        """
+        Drop all recorded events and the current frame index.
+        """
+        self.events.clear()
+        self._stats.clear()
+        self._shapes.clear()
+        self._frame_peaks.clear()
+        self.frame = None
+
+    def close(self):
+        """
+        Stop tracemalloc if this recorder started it (recorded events
+        are kept; later stages are timed without memory tracking).
+        """
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+        self.trace_memory = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def frame_memory(self):
+        """
+        Peak bytes allocated by the outermost stages of each frame
+        (trace_memory=True) → {frame: bytes}.
+
+        With workspace buffers this drops to (near) zero once every
+        buffer exists: only small Python objects (array views, stage
+        records) remain.
+        """
+        return dict(self._frame_peaks)
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """
+        Aggregated statistics per stage.
+
+        Percentiles are exact up to max_samples executions of a stage
+        and estimated from the reservoir sample beyond that.
+
+        Returns
+        -------
+        dict
+            stage name → {count, total_ms, mean_ms, p<q>_ms..., max_ms,
+                          peak_bytes_max, shapes}
+        """
+        result = {}
+
+        for name, running in self._stats.items():
+            ms = np.asarray(running.samples, dtype=np.float64) * 1e-6
+
+            stats = {
+                "count": running.count,
+                "total_ms": running.total * 1e-6,
+                "mean_ms": running.total * 1e-6 / running.count,
+            }
+            for q, value in zip(percentiles, np.percentile(ms, percentiles)):
+                stats[f"p{q}_ms"] = float(value)
+            stats["max_ms"] = running.max * 1e-6
+
+            stats["peak_bytes_max"] = (
+                int(running.peak) if running.peak is not None else None
+            )
+            stats["shapes"] = sorted(
+                [list(shape), dtype] for shape, dtype in self._shapes[name]
+            )
+
+            result[name] = stats
+
+        return result
+
+    def report(self):
+        """
+        Text table of summary(), slowest stage (total time) first.
+        """
+        summary = self.summary()
+
+        lines = [
+            f"{'stage':<24}{'count':>7}{'total ms':>11}{'p50 ms':>9}"
+            f"{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'peak MiB':>10}"
+        ]
+        ranked = sorted(summary.items(), key=lambda kv: -kv[1]["total_ms"])
+        for name, s in ranked:
+            peak = s["peak_bytes_max"]
+            peak = f"{peak / 2**20:10.2f}" if peak is not None else f"{'-':>10}"
+            lines.append(
+                f"{name:<24}{s['count']:>7}{s['total_ms']:>11.2f}"
+                f"{s['p50_ms']:>9.3f}{s['p90_ms']:>9.3f}{s['p99_ms']:>9.3f}"
+                f"{s['max_ms']:>9.3f}{peak}"
+            )
+
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """
+        Events in Chrome trace-event format ("X" complete events, µs).
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": e["name"],
+                    "cat": e["name"].split(".", 1)[0],
+                    "ph": "X",
+                    "ts": e["start_ns"] / 1e3,
+                    "dur": e["duration_ns"] / 1e3,
+                    "pid": pid,
+                    "tid": e["thread"],
+                    "args": {
+                        "frame": e["frame"],
+                        "shape": e["shape"],
+                        "dtype": e["dtype"],
+                        "output_bytes": e["output_bytes"],
+                        "peak_bytes": e["peak_bytes"],
+                    },
+                }
+                for e in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def export_chrome_trace(self, path):
+        """
+        Write chrome_trace() to path (open in chrome://tracing or Perfetto).
+        """
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def export_json(self, path):
+        """
+        Write raw events and the per-stage summary to path.
+        """
+        with open(path, "w") as f:
+            json.dump(
+                {"events": list(self.events), "summary": self.summary()},
+                f, indent=2
+            )
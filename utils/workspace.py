@@ -0,0 +1,73 @@
+import numpy as np
+
+
+class Workspace:
+    """
+    Pool of named, preallocated frame buffers.
+
+    Stages ask for a buffer by name, shape and dtype; the buffer is
+    allocated on first use and returned again on every later request
+    with the same shape and dtype. With a fixed configuration every
+    buffer is allocated once, during the first frame, and streaming
+    runs allocate no frame-sized arrays afterwards.
+
+    Arrays built on workspace buffers are overwritten by the next frame:
+    copy anything that must outlive it.
+
+    Parameters
+    ----------
+    allocator : callable (shape, dtype) -> ndarray
+        e.g. an FFT backend's empty() for SIMD-aligned buffers
+    """
+
+    def __init__(self, allocator=None):
+        self.allocator = np.empty if allocator is None else allocator
+        self.allocations = 0
+
+        self._buffers = {}
+
+    def get(self, name, shape, dtype):
+        """
+        Buffer `name` with the given shape and dtype (contents undefined).
+        """
+        shape = tuple(int(n) for n in shape)
+        dtype = np.dtype(dtype)
+
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape or buf.dtype != dtype:
+            buf = self.allocator(shape, dtype=dtype)
+            self._buffers[name] = buf
+            self.allocations += 1
+
+        return buf
+
+    @property
+    def nbytes(self):
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+    def clear(self):
+        self._buffers.clear()
+
+    def info(self):
+        """
+        {name: (shape, dtype)} of every buffer plus totals.
+        """
+        return {
+            "buffers": {
+                name: (buf.shape, buf.dtype.str)
+                for name, buf in self._buffers.items()
+            },
+            "nbytes": self.nbytes,
+            "allocations": self.allocations,
+        }
+
+
+def resolve_workspace(workspace, allocator=None):
+    """
+    None / False → None, True → new Workspace, Workspace → itself.
+    """
+    if workspace is None or workspace is False:
+        return None
+    if workspace is True:
+        return Workspace(allocator)
+    return workspace